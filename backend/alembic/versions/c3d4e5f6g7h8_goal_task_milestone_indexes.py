@@ -0,0 +1,61 @@
+"""add composite indexes for goal / task / milestone filters
+
+Revision ID: c3d4e5f6g7h8
+Revises: b2c3d4e5f6g7
+Create Date: 2026-10-15
+
+The goals router and the statistics endpoints filter goals by
+(person_id, deleted) / (person_id, status), and count tasks and milestones
+per goal split by completed / achieved. Composite indexes let those run as
+index scans instead of filtering the whole per-goal slice. The partial
+goals index covers the common "active goals" lookup and stays small.
+
+Built CONCURRENTLY so the deploy-time upgrade doesn't block writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'c3d4e5f6g7h8'
+down_revision: Union[str, Sequence[str], None] = 'b2c3d4e5f6g7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_goals_person_deleted',
+            'goals',
+            ['person_id', 'deleted'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_goals_person_status_active',
+            'goals',
+            ['person_id', 'status'],
+            postgresql_where=sa.text('deleted IS NOT TRUE'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_tasks_goal_completed_deleted',
+            'tasks',
+            ['goal_id', 'completed', 'deleted'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_milestones_goal_achieved_deleted',
+            'milestones',
+            ['goal_id', 'achieved', 'deleted'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_milestones_goal_achieved_deleted', table_name='milestones', postgresql_concurrently=True)
+        op.drop_index('ix_tasks_goal_completed_deleted', table_name='tasks', postgresql_concurrently=True)
+        op.drop_index('ix_goals_person_status_active', table_name='goals', postgresql_concurrently=True)
+        op.drop_index('ix_goals_person_deleted', table_name='goals', postgresql_concurrently=True)
@@ -0,0 +1,64 @@
+"""make goals.deleted NOT NULL with a false default
+
+Revision ID: d4e5f6g7h8i9
+Revises: c3d4e5f6g7h8
+Create Date: 2026-10-15
+
+Goal queries used `deleted = false OR deleted IS NULL`, which the planner
+can't match to a single index condition. Backfilling NULLs and enforcing
+NOT NULL lets every filter be a plain `deleted = false`. The partial
+"active goals" index is rebuilt with the matching `NOT deleted` predicate.
+
+The index is swapped without blocking goal writes: the new one is built
+CONCURRENTLY under a temporary name, the old one dropped CONCURRENTLY, and
+the new one renamed into place.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'd4e5f6g7h8i9'
+down_revision: Union[str, Sequence[str], None] = 'c3d4e5f6g7h8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+ACTIVE_INDEX = 'ix_goals_person_status_active'
+ACTIVE_INDEX_TMP = 'ix_goals_person_status_active_new'
+
+
+def _swap_active_index(predicate: str) -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            ACTIVE_INDEX_TMP,
+            'goals',
+            ['person_id', 'status'],
+            postgresql_where=sa.text(predicate),
+            postgresql_concurrently=True,
+        )
+        op.drop_index(ACTIVE_INDEX, table_name='goals', postgresql_concurrently=True)
+        op.execute(f'ALTER INDEX {ACTIVE_INDEX_TMP} RENAME TO {ACTIVE_INDEX}')
+
+
+def upgrade() -> None:
+    op.execute("UPDATE goals SET deleted = false WHERE deleted IS NULL")
+    op.alter_column(
+        'goals', 'deleted',
+        existing_type=sa.Boolean(),
+        nullable=False,
+        server_default=sa.text('false'),
+    )
+
+    _swap_active_index('NOT deleted')
+
+
+def downgrade() -> None:
+    _swap_active_index('deleted IS NOT TRUE')
+
+    op.alter_column(
+        'goals', 'deleted',
+        existing_type=sa.Boolean(),
+        nullable=True,
+        server_default=None,
+    )
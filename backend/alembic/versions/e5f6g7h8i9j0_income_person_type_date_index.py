@@ -0,0 +1,36 @@
+"""add (person_id, source_type, received_date) index on income_sources
+
+Revision ID: e5f6g7h8i9j0
+Revises: d4e5f6g7h8i9
+Create Date: 2026-10-15
+
+The income summary groups a person's rows by source_type within a
+received_date window, and /by-type filters on the same columns. Equality
+columns first, range column last.
+
+Built CONCURRENTLY so the deploy-time upgrade doesn't block writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'e5f6g7h8i9j0'
+down_revision: Union[str, Sequence[str], None] = 'd4e5f6g7h8i9'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_income_person_type_date',
+            'income_sources',
+            ['person_id', 'source_type', 'received_date'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_income_person_type_date', table_name='income_sources', postgresql_concurrently=True)
@@ -0,0 +1,37 @@
+"""add (person_id, received_date) index on income_sources
+
+Revision ID: f6g7h8i9j0k1
+Revises: e5f6g7h8i9j0
+Create Date: 2026-10-15
+
+Every income list filters by person_id and orders by received_date DESC,
+often with a received_date range. A btree scanned backwards serves the
+DESC order directly, so the sort node goes away and ranges become index
+range scans.
+
+Built CONCURRENTLY so the deploy-time upgrade doesn't block writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'f6g7h8i9j0k1'
+down_revision: Union[str, Sequence[str], None] = 'e5f6g7h8i9j0'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_income_person_date',
+            'income_sources',
+            ['person_id', 'received_date'],
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_income_person_date', table_name='income_sources', postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""add partial (person_id) index on live jobs
+
+Revision ID: g7h8i9j0k1l3
+Revises: f6g7h8i9j0k1
+Create Date: 2026-10-15
+
+Every jobs query filters person_id with deleted = false. A partial index
+holding only live rows matches that predicate and stays smaller than a
+full person_id index.
+
+Built CONCURRENTLY so the deploy-time upgrade doesn't block writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'g7h8i9j0k1l3'
+down_revision: Union[str, Sequence[str], None] = 'f6g7h8i9j0k1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_jobs_active_person',
+            'jobs',
+            ['person_id'],
+            postgresql_where=sa.text('deleted = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_jobs_active_person', table_name='jobs', postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""add partial (goal_id, order_index) index on live milestones
+
+Revision ID: h8i9j0k1l2m4
+Revises: g7h8i9j0k1l3
+Create Date: 2026-10-15
+
+Milestones of a goal are always read as WHERE goal_id = ? AND deleted =
+false ORDER BY order_index. This index returns them already ordered, so the
+query plan needs no sort step.
+
+Built CONCURRENTLY so the deploy-time upgrade doesn't block writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'h8i9j0k1l2m4'
+down_revision: Union[str, Sequence[str], None] = 'g7h8i9j0k1l3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_milestones_goal_order',
+            'milestones',
+            ['goal_id', 'order_index'],
+            postgresql_where=sa.text('deleted = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_milestones_goal_order', table_name='milestones', postgresql_concurrently=True)
@@ -0,0 +1,51 @@
+"""add partial indexes for salary-month lookups and their expenses
+
+Revision ID: i9j0k1l2m3n5
+Revises: h8i9j0k1l2m4
+Create Date: 2026-10-15
+
+- salary_months (person_id, month): the current-month and period filters
+  look salary months up by owner and YYYY-MM.
+- expenses (salary_month_id, date DESC): a salary month's expense list is
+  read newest first, and its total_spent is summed on every expense write.
+  With this index the list comes back already ordered.
+
+Both are limited to live rows (deleted = false), as every such query is.
+(person_id, month) is not unique: one person can have several jobs paying
+the same month. Built CONCURRENTLY so the deploy-time upgrade doesn't block
+writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'i9j0k1l2m3n5'
+down_revision: Union[str, Sequence[str], None] = 'h8i9j0k1l2m4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_salary_months_person_month',
+            'salary_months',
+            ['person_id', 'month'],
+            postgresql_where=sa.text('deleted = false'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_expenses_salary_month_date',
+            'expenses',
+            ['salary_month_id', sa.text('date DESC')],
+            postgresql_where=sa.text('deleted = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_expenses_salary_month_date', table_name='expenses', postgresql_concurrently=True)
+        op.drop_index('ix_salary_months_person_month', table_name='salary_months', postgresql_concurrently=True)
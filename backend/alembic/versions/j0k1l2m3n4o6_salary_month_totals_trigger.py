@@ -0,0 +1,69 @@
+"""maintain salary_months totals from an expenses trigger
+
+Revision ID: j0k1l2m3n4o6
+Revises: i9j0k1l2m3n5
+Create Date: 2026-10-15
+
+Every expense write used to re-sum all live expenses of the linked salary
+month in application code. An AFTER INSERT/UPDATE/DELETE row trigger on
+expenses now applies each row's delta to salary_months.total_spent and
+remaining_amount instead. A row counts only while deleted = false, and
+Gennis-mirrored months (gennis_salary_location_id set) are left alone.
+
+The totals are reconciled once here so the deltas start from exact sums.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'j0k1l2m3n4o6'
+down_revision: Union[str, Sequence[str], None] = 'i9j0k1l2m3n5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("""
+        CREATE OR REPLACE FUNCTION expenses_sync_salary_month_totals() RETURNS trigger AS $$
+        BEGIN
+            IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.salary_month_id IS NOT NULL AND NOT coalesce(OLD.deleted, false) THEN
+                UPDATE salary_months
+                   SET total_spent = coalesce(total_spent, 0) - OLD.amount,
+                       remaining_amount = net_amount - (coalesce(total_spent, 0) - OLD.amount)
+                 WHERE id = OLD.salary_month_id AND gennis_salary_location_id IS NULL;
+            END IF;
+            IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.salary_month_id IS NOT NULL AND NOT coalesce(NEW.deleted, false) THEN
+                UPDATE salary_months
+                   SET total_spent = coalesce(total_spent, 0) + NEW.amount,
+                       remaining_amount = net_amount - (coalesce(total_spent, 0) + NEW.amount)
+                 WHERE id = NEW.salary_month_id AND gennis_salary_location_id IS NULL;
+            END IF;
+            RETURN NULL;
+        END;
+        $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER expenses_salary_month_totals
+        AFTER INSERT OR DELETE OR UPDATE OF amount, salary_month_id, deleted ON expenses
+        FOR EACH ROW EXECUTE FUNCTION expenses_sync_salary_month_totals()
+    """)
+    op.execute("""
+        UPDATE salary_months sm
+           SET total_spent = totals.spent,
+               remaining_amount = sm.net_amount - totals.spent
+          FROM (
+                SELECT s.id, coalesce(sum(e.amount), 0) AS spent
+                  FROM salary_months s
+                  LEFT JOIN expenses e
+                    ON e.salary_month_id = s.id AND e.deleted = false
+                 WHERE s.gennis_salary_location_id IS NULL
+                 GROUP BY s.id
+               ) AS totals
+         WHERE sm.id = totals.id
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS expenses_salary_month_totals ON expenses")
+    op.execute("DROP FUNCTION IF EXISTS expenses_sync_salary_month_totals()")
@@ -0,0 +1,60 @@
+"""add composite indexes for savings, saving transactions and subtasks
+
+Revision ID: k1l2m3n4o5p7
+Revises: j0k1l2m3n4o6
+Create Date: 2026-10-15
+
+- savings (person_id, account_type): every savings endpoint filters by
+  owner, and the balance summary groups by account type. Live rows only.
+- saving_transactions (saving_id, transaction_date, id): the transaction
+  list, the balance-at-date lookups and the balance-chain recompute all
+  read one account's transactions in (transaction_date, id) order; the
+  index returns them pre-sorted in either direction.
+- sub_tasks (task_id, "order"): a task's live subtasks are listed and
+  renumbered by order. Live rows only.
+
+tasks.goal_id needs nothing new: ix_tasks_goal_completed_deleted already
+leads with it. Built CONCURRENTLY so the deploy-time upgrade doesn't block
+writes.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = 'k1l2m3n4o5p7'
+down_revision: Union[str, Sequence[str], None] = 'j0k1l2m3n4o6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_savings_person_type',
+            'savings',
+            ['person_id', 'account_type'],
+            postgresql_where=sa.text('deleted = false'),
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_saving_transactions_saving_date',
+            'saving_transactions',
+            ['saving_id', 'transaction_date', 'id'],
+            postgresql_concurrently=True,
+        )
+        op.create_index(
+            'ix_sub_tasks_task_order',
+            'sub_tasks',
+            ['task_id', 'order'],
+            postgresql_where=sa.text('deleted = false'),
+            postgresql_concurrently=True,
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_sub_tasks_task_order', table_name='sub_tasks', postgresql_concurrently=True)
+        op.drop_index('ix_saving_transactions_saving_date', table_name='saving_transactions', postgresql_concurrently=True)
+        op.drop_index('ix_savings_person_type', table_name='savings', postgresql_concurrently=True)
@@ -0,0 +1,35 @@
+"""add a non-negative check on savings.current_balance
+
+Revision ID: l2m3n4o5p6q8
+Revises: k1l2m3n4o5p7
+Create Date: 2026-10-15
+
+Withdrawals and savings-funded expenses now deduct with a conditional
+UPDATE ... WHERE current_balance >= amount; the CHECK makes the database
+the final guard so no write path can leave an account overdrawn.
+
+Added NOT VALID: new and updated rows are checked immediately, but the
+deploy doesn't scan savings or fail on any historical negative balance.
+Run `ALTER TABLE savings VALIDATE CONSTRAINT
+ck_savings_current_balance_nonnegative` once old rows are reconciled.
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = 'l2m3n4o5p6q8'
+down_revision: Union[str, Sequence[str], None] = 'k1l2m3n4o5p7'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute(
+        "ALTER TABLE savings ADD CONSTRAINT ck_savings_current_balance_nonnegative "
+        "CHECK (current_balance >= 0) NOT VALID"
+    )
+
+
+def downgrade() -> None:
+    op.drop_constraint('ck_savings_current_balance_nonnegative', 'savings', type_='check')
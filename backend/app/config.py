@@ -21,6 +21,12 @@ class Settings(BaseSettings):
     # Database
     DATABASE_URL: str
 
+    # Route handlers are sync `def` functions, so FastAPI runs each request on
+    # the AnyIO worker threadpool (default 40 threads). Unset, it matches the
+    # DB pool (DB_POOL_SIZE + DB_MAX_OVERFLOW): extra requests then wait for a
+    # thread instead of timing out at connection checkout with a 500.
+    THREADPOOL_SIZE: Optional[int] = None
+
     # External Gennis CRM database (read-only). Required to mirror teacher
     # salary data into SalaryMonth + GennisSalaryPayment. Leave unset to
     # disable the sync entirely.
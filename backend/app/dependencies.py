@@ -3,7 +3,7 @@ Dependency functions for authentication
 Use these to protect routes
 """
 
-from fastapi import Cookie, Depends, HTTPException, status
+from fastapi import Cookie, Depends, HTTPException, Request, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from sqlalchemy.orm import Session
 from typing import Optional
@@ -18,13 +18,25 @@ security = HTTPBearer(auto_error=False)
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="api/auth/login")
 
 
-async def get_current_user(
+def get_current_user(
+        request: Request,
         credentials: Optional[HTTPAuthorizationCredentials] = Depends(security),
         access_token_cookie: Optional[str] = Cookie(default=None, alias="access_token"),
         db: Session = Depends(get_db)
 ) -> models.Person:
     """Resolve the authenticated user from either the Authorization Bearer
-    header or the access_token cookie (httpOnly, set by /auth endpoints)."""
+    header or the access_token cookie (httpOnly, set by /auth endpoints).
+
+    Plain `def` on purpose: the Person lookup is a blocking DB call, so
+    FastAPI must run it on the threadpool instead of the event loop.
+
+    The resolved user is memoized on request.state, so any second
+    resolution within the same request (e.g. a dependency path that
+    bypasses FastAPI's per-request cache) costs no extra query."""
+    cached = getattr(request.state, "current_user", None)
+    if cached is not None:
+        return cached
+
     credentials_exception = HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
@@ -46,8 +58,16 @@ async def get_current_user(
     if email is None:
         raise credentials_exception
 
-    # Get user from database
-    user = db.query(models.Person).filter(models.Person.email == email).first()
+    # Get user from database: primary-key lookup via the user_id claim, so
+    # later db.get(Person, id) calls in the request hit the identity map.
+    # Older tokens without the claim fall back to the email lookup.
+    user_id = payload.get("user_id")
+    if user_id is not None:
+        user = db.get(models.Person, user_id)
+        if user is not None and user.email != email:
+            user = None
+    else:
+        user = db.query(models.Person).filter(models.Person.email == email).first()
 
     if user is None:
         raise credentials_exception
@@ -74,6 +94,7 @@ async def get_current_user(
         if token_issued_at <= user.last_logout_at:
             raise credentials_exception
 
+    request.state.current_user = user
     return user
 
 
@@ -163,8 +184,9 @@ def get_optional_current_user(
 
 
 def get_current_user_dependency(
+        request: Request,
         db: Session = Depends(get_db),
         token: str = Depends(oauth2_scheme)
 ) -> Person:
     """Get current authenticated user - use in protected endpoints"""
-    return get_current_user(token, db)
+    return get_current_user(request, HTTPAuthorizationCredentials(scheme="Bearer", credentials=token), None, db)
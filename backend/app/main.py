@@ -3,11 +3,14 @@ import logging
 import traceback
 from contextlib import asynccontextmanager
 
+import anyio.to_thread
 from fastapi import FastAPI, Request
+from fastapi.responses import ORJSONResponse
 from fastapi.exceptions import RequestValidationError
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 from starlette.responses import FileResponse, JSONResponse, RedirectResponse
+from sqlalchemy import text
 from apscheduler.schedulers.background import BackgroundScheduler
 from apscheduler.triggers.cron import CronTrigger
 
@@ -16,12 +19,19 @@ from app.routers import goals, person, tasks, subtasks, progresslog, progresslog
     category_budgets, dictionary, practice, essays, books, exercises, news, dashboard, task2, daily_log, paraphrase, \
     gap_fill, mini_build
 from app.config import settings
+from app.utils.pagination import NEXT_CURSOR_HEADER
+from app.database import DB_MAX_OVERFLOW, DB_POOL_SIZE, engine
 from app.services.job_service import JobService
 from app.services.telegram_bot import bot_service
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
+    # Sync route handlers run on this threadpool; one thread per pooled connection
+    anyio.to_thread.current_default_thread_limiter().total_tokens = (
+        settings.THREADPOOL_SIZE or DB_POOL_SIZE + DB_MAX_OVERFLOW
+    )
+
     # Run once at startup to fill any gap (e.g. server was down on the 1st)
     try:
         JobService.create_current_month_for_all_jobs()
@@ -63,6 +73,7 @@ app = FastAPI(
     docs_url=None,
     redoc_url=None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # CORS middleware - Using settings.get_cors_origins()
@@ -72,6 +83,7 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 
@@ -156,6 +168,19 @@ async def root():
     return RedirectResponse(url=settings.FRONTEND_URL)
 
 
+@app.get("/health", include_in_schema=False)
+def health():
+    """Liveness + DB check. Acquires and releases one pooled connection so an
+    exhausted or broken pool shows up here instead of as slow API calls."""
+    try:
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+    except Exception:
+        logger.exception("Health check: database unreachable")
+        return JSONResponse(status_code=503, content={"status": "error", "database": "unreachable"})
+    return {"status": "ok", "database": "ok"}
+
+
 @app.get("/docs", include_in_schema=False)
 async def custom_swagger_ui():
     return FileResponse("static/swagger-custom.html")
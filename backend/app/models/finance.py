@@ -1,6 +1,6 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import DDL, Boolean, CheckConstraint, Column, Date, DateTime, Float, ForeignKey, Index, Integer, String, Text, event, text
 from sqlalchemy.orm import relationship
 
 from app.database import Base
@@ -33,6 +33,10 @@ class Job(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_jobs_active_person", "person_id", postgresql_where=text("deleted = false")),
+    )
+
     person = relationship("Person", back_populates="jobs")
     salary_months = relationship("SalaryMonth", back_populates="job", cascade="all, delete-orphan")
 
@@ -65,6 +69,10 @@ class SalaryMonth(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_salary_months_person_month", "person_id", "month", postgresql_where=text("deleted = false")),
+    )
+
     job = relationship("Job", back_populates="salary_months")
     person = relationship("Person", back_populates="salary_months")
     expenses = relationship("Expense", back_populates="salary_month", cascade="all, delete-orphan")
@@ -112,10 +120,55 @@ class Expense(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        Index(
+            "ix_expenses_salary_month_date",
+            salary_month_id,
+            date.desc(),
+            postgresql_where=text("deleted = false"),
+        ),
+    )
+
     person = relationship("Person", back_populates="expenses")
     salary_month = relationship("SalaryMonth", back_populates="expenses")
 
 
+# salary_months.total_spent / remaining_amount are kept in step with their
+# live expenses by a Postgres trigger: each expense insert, update or delete
+# applies its own delta, so no write path has to re-sum the month. Gennis
+# mirrored months are skipped — their totals come from the CRM sync.
+# Production gets these from migration j0k1l2m3n4o6; the listeners below
+# give Base.metadata.create_all (tests) the same behaviour.
+SALARY_MONTH_TOTALS_FUNCTION = DDL("""
+CREATE OR REPLACE FUNCTION expenses_sync_salary_month_totals() RETURNS trigger AS $$
+BEGIN
+    IF TG_OP IN ('UPDATE', 'DELETE') AND OLD.salary_month_id IS NOT NULL AND NOT coalesce(OLD.deleted, false) THEN
+        UPDATE salary_months
+           SET total_spent = coalesce(total_spent, 0) - OLD.amount,
+               remaining_amount = net_amount - (coalesce(total_spent, 0) - OLD.amount)
+         WHERE id = OLD.salary_month_id AND gennis_salary_location_id IS NULL;
+    END IF;
+    IF TG_OP IN ('INSERT', 'UPDATE') AND NEW.salary_month_id IS NOT NULL AND NOT coalesce(NEW.deleted, false) THEN
+        UPDATE salary_months
+           SET total_spent = coalesce(total_spent, 0) + NEW.amount,
+               remaining_amount = net_amount - (coalesce(total_spent, 0) + NEW.amount)
+         WHERE id = NEW.salary_month_id AND gennis_salary_location_id IS NULL;
+    END IF;
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+""")
+
+SALARY_MONTH_TOTALS_TRIGGER = DDL("""
+CREATE TRIGGER expenses_salary_month_totals
+AFTER INSERT OR DELETE OR UPDATE OF amount, salary_month_id, deleted ON expenses
+FOR EACH ROW EXECUTE FUNCTION expenses_sync_salary_month_totals()
+""")
+
+event.listen(Expense.__table__, "after_create", SALARY_MONTH_TOTALS_FUNCTION.execute_if(dialect="postgresql"))
+event.listen(Expense.__table__, "after_create", SALARY_MONTH_TOTALS_TRIGGER.execute_if(dialect="postgresql"))
+
+
 class IncomeSource(Base):
     __tablename__ = "income_sources"
 
@@ -134,6 +187,11 @@ class IncomeSource(Base):
     deleted = Column(Boolean, default=False)
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_income_person_date", "person_id", "received_date"),
+        Index("ix_income_person_type_date", "person_id", "source_type", "received_date"),
+    )
+
     person = relationship("Person", back_populates="income_sources")
 
 
@@ -166,6 +224,11 @@ class Saving(Base):
     person = relationship("Person", back_populates="savings")
     transactions = relationship("SavingTransaction", back_populates="saving", cascade="all, delete-orphan")
 
+    __table_args__ = (
+        Index("ix_savings_person_type", "person_id", "account_type", postgresql_where=text("deleted = false")),
+        CheckConstraint("current_balance >= 0", name="ck_savings_current_balance_nonnegative"),
+    )
+
 
 class SavingTransaction(Base):
     __tablename__ = "saving_transactions"
@@ -185,6 +248,10 @@ class SavingTransaction(Base):
 
     saving = relationship("Saving", back_populates="transactions")
 
+    __table_args__ = (
+        Index("ix_saving_transactions_saving_date", "saving_id", "transaction_date", "id"),
+    )
+
 
 class GennisSalaryPayment(Base):
     __tablename__ = "gennis_salary_payments"
@@ -1,8 +1,8 @@
 from datetime import datetime
 
-from sqlalchemy import Boolean, Column, Date, DateTime, Float, ForeignKey, Integer, String, Text
+from sqlalchemy import Boolean, Column, Date, DateTime, Float, ForeignKey, Index, Integer, Numeric, String, Text, and_, case, cast, event, func, text
 from sqlalchemy.ext.hybrid import hybrid_property
-from sqlalchemy.orm import relationship
+from sqlalchemy.orm import Session, relationship, with_loader_criteria
 
 from app.database import Base
 
@@ -25,7 +25,7 @@ class Goal(Base):
 
     status = Column(String(20), default="active")
     priority = Column(String(20), default="medium")
-    deleted = Column(Boolean, default=False)
+    deleted = Column(Boolean, nullable=False, default=False, server_default=text("false"))
     color = Column(String(20), nullable=True)
 
     _stored_percentage = Column(Float, default=0)
@@ -33,6 +33,14 @@ class Goal(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_goals_person_deleted", "person_id", "deleted"),
+        Index(
+            "ix_goals_person_status_active", "person_id", "status",
+            postgresql_where=text("NOT deleted"),
+        ),
+    )
+
     person = relationship("Person", back_populates="goals")
     tasks = relationship("Task", back_populates="goal", cascade="all, delete-orphan")
     progress_logs = relationship("ProgressLog", back_populates="goal", cascade="all, delete-orphan")
@@ -56,12 +64,54 @@ class Goal(Base):
         self.percentage = round((completed_tasks / total_tasks) * 100, 2)
         return self.percentage
 
-    def calculate_manual_percentage(self):
-        if not self.target_value or self.target_value == 0:
+    @hybrid_property
+    def manual_percentage(self):
+        if not self.target_value:
             return None
-        percentage = (self.current_value / self.target_value) * 100
+        percentage = ((self.current_value or 0) / self.target_value) * 100
         return round(min(percentage, 100.0), 2)
 
+    @manual_percentage.expression
+    def manual_percentage(cls):
+        # Same rule in SQL so queries can select or aggregate it directly
+        return case(
+            (
+                and_(cls.target_value.isnot(None), cls.target_value != 0),
+                func.round(
+                    cast(func.least(func.coalesce(cls.current_value, 0) * 100.0 / cls.target_value, 100.0), Numeric),
+                    2,
+                ),
+            ),
+            else_=None,
+        )
+
+    def calculate_manual_percentage(self):
+        return self.manual_percentage
+
+
+@event.listens_for(Session, "do_orm_execute")
+def _hide_deleted_goals(state):
+    """Filter soft-deleted goals out of every top-level ORM SELECT.
+
+    Pass execution_options(include_deleted=True) to see them. Relationship
+    and refresh loads are left alone so cascades and db.refresh() still see
+    the row.
+    """
+    if (
+        state.is_select
+        and not state.is_column_load
+        and not state.is_relationship_load
+        and not state.execution_options.get("include_deleted", False)
+    ):
+        state.statement = state.statement.options(
+            with_loader_criteria(
+                Goal,
+                lambda cls: cls.deleted == False,
+                include_aliases=True,
+                propagate_to_loaders=False,
+            )
+        )
+
 
 class Milestone(Base):
     __tablename__ = "milestones"
@@ -83,6 +133,11 @@ class Milestone(Base):
     created_at = Column(DateTime, default=datetime.utcnow)
     updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_milestones_goal_achieved_deleted", "goal_id", "achieved", "deleted"),
+        Index("ix_milestones_goal_order", "goal_id", "order_index", postgresql_where=text("deleted = false")),
+    )
+
     goal = relationship("Goal", back_populates="milestones")
 
 
@@ -106,6 +161,10 @@ class Task(Base):
 
     created_at = Column(DateTime, default=datetime.utcnow)
 
+    __table_args__ = (
+        Index("ix_tasks_goal_completed_deleted", "goal_id", "completed", "deleted"),
+    )
+
     goal = relationship("Goal", back_populates="tasks")
     progress_log_tasks = relationship("ProgressLogTask", back_populates="task", cascade="all, delete-orphan")
     sub_tasks = relationship("SubTasks", back_populates="task", cascade="all, delete-orphan")
@@ -130,6 +189,10 @@ class SubTasks(Base):
 
     task = relationship("Task", back_populates="sub_tasks")
 
+    __table_args__ = (
+        Index("ix_sub_tasks_task_order", "task_id", "order", postgresql_where=text("deleted = false")),
+    )
+
 
 class ProgressLog(Base):
     __tablename__ = "progress_logs"
@@ -133,17 +133,16 @@ def _build_user_context(user: models.Person, db: Session) -> str:
     # advice reflects the latest external CRM state.
     gennis_sync.ensure_fresh_for_person(user.id, db)
 
-    active_jobs = db.query(models.Job).filter(
+    active_job_ids = db.query(models.Job.id).filter(
         models.Job.person_id == user.id,
         models.Job.active == True,
         models.Job.deleted == False,
-    ).all()
-    job_ids = [j.id for j in active_jobs]
+    )
     salary_months = db.query(models.SalaryMonth).filter(
-        models.SalaryMonth.job_id.in_(job_ids),
+        models.SalaryMonth.job_id.in_(active_job_ids.scalar_subquery()),
         models.SalaryMonth.month == current_month,
         models.SalaryMonth.deleted == False,
-    ).all() if job_ids else []
+    ).all()
     salary_income = sum(sm.net_amount for sm in salary_months)
 
     other_income = db.query(models.IncomeSource).filter(
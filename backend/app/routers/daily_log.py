@@ -2,7 +2,7 @@ from datetime import date as date_type
 from typing import Optional, List
 from fastapi import APIRouter, Depends, HTTPException, Query, status
 from sqlalchemy.orm import Session
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field
 
 from app import models
 from app.dependencies import get_current_user, get_db
@@ -40,8 +40,7 @@ class DailyLogOut(BaseModel):
     created_at: str
     updated_at: str
 
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True)
 
 
 def _to_out(log: models.DailyLog) -> DailyLogOut:
@@ -1,11 +1,14 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import update
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from datetime import datetime, date
+from collections import defaultdict
+from datetime import date
 
 from app import models, schemas
 from app.database import get_db
 from app.dependencies import get_current_user
+from app.services import response_cache
 
 router = APIRouter(
     prefix="/expenses",
@@ -58,7 +61,15 @@ def create_expense(
                 status_code=status.HTTP_404_NOT_FOUND,
                 detail="Savings account not found"
             )
-        if saving.current_balance < expense.amount:
+        # Check and deduct in one statement, so two concurrent expenses can't
+        # both pass the balance check
+        balance_after = db.execute(
+            update(models.Saving)
+            .where(models.Saving.id == saving.id, models.Saving.current_balance >= expense.amount)
+            .values(current_balance=models.Saving.current_balance - expense.amount)
+            .returning(models.Saving.current_balance)
+        ).scalar_one_or_none()
+        if balance_after is None:
             raise HTTPException(
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail=f"Insufficient savings balance. Available: {saving.current_balance}, Required: {expense.amount}"
@@ -70,9 +81,7 @@ def create_expense(
 
     # Auto-create savings withdrawal if source is savings
     if expense.source == "savings" and saving:
-        balance_before = saving.current_balance
-        saving.current_balance -= expense.amount
-        balance_after = saving.current_balance
+        balance_before = balance_after + expense.amount
 
         saving_tx = models.SavingTransaction(
             saving_id=saving.id,
@@ -87,24 +96,23 @@ def create_expense(
         db.flush()
         new_expense.saving_transaction_id = saving_tx.id
 
-    db.commit()
-    db.refresh(new_expense)
-
-    # Update salary month if linked
-    if new_expense.salary_month_id:
-        _update_salary_month_totals(new_expense.salary_month_id, db)
-
     # Update matching budget if exists
     _update_matching_budget(new_expense, db)
 
+    # Expense, savings withdrawal, budget totals and (via the expenses trigger)
+    # salary-month totals land in one transaction
+    db.commit()
+    db.refresh(new_expense)
+
+    response_cache.invalidate(current_user.id)
     return new_expense
 
 
 @router.get('/', response_model=List[schemas.Expense])
 def get_expenses(
         category: Optional[str] = Query(None, description="Filter by category"),
-        start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
-        end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+        start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
+        end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD)"),
         is_recurring: Optional[bool] = Query(None, description="Filter recurring expenses"),
         is_essential: Optional[bool] = Query(None, description="Filter essential expenses"),
         min_amount: Optional[float] = Query(None, description="Minimum amount"),
@@ -125,12 +133,10 @@ def get_expenses(
         query = query.filter(models.Expense.category == category)
 
     if start_date:
-        start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        query = query.filter(models.Expense.date >= start)
+        query = query.filter(models.Expense.date >= start_date)
 
     if end_date:
-        end = datetime.strptime(end_date, "%Y-%m-%d").date()
-        query = query.filter(models.Expense.date <= end)
+        query = query.filter(models.Expense.date <= end_date)
 
     if is_recurring is not None:
         query = query.filter(models.Expense.is_recurring == is_recurring)
@@ -368,18 +374,18 @@ def restore_expense(
             db.add(saving_tx)
             db.flush()
             db_expense.saving_transaction_id = saving_tx.id
-            from app.routers.savings import _recompute_balance_chain
-            _recompute_balance_chain(saving, db)
-
-    db.commit()
-    db.refresh(db_expense)
-
-    if db_expense.salary_month_id:
-        _update_salary_month_totals(db_expense.salary_month_id, db)
+            from app.routers.savings import _recompute_balance_chain_or_400
+            _recompute_balance_chain_or_400(
+                saving, db, "Cannot restore: would result in negative savings balance in the transaction chain"
+            )
 
     # Update matching budget
     _update_matching_budget(db_expense, db)
 
+    db.commit()
+    db.refresh(db_expense)
+
+    response_cache.invalidate(current_user.id)
     return db_expense
 
 
@@ -424,7 +430,6 @@ def update_expense(
             detail="Expense not found"
         )
 
-    old_salary_month_id = db_expense.salary_month_id
     old_category = db_expense.category
     old_date = db_expense.date
     old_amount = db_expense.amount
@@ -449,17 +454,13 @@ def update_expense(
                     models.Saving.id == saving_tx.saving_id
                 ).first()
                 if saving:
-                    from app.routers.savings import _recompute_balance_chain
-                    _recompute_balance_chain(saving, db)
+                    from app.routers.savings import _recompute_balance_chain_or_400
+                    _recompute_balance_chain_or_400(
+                        saving, db, "Update would result in negative savings balance in the transaction chain"
+                    )
 
-    db.commit()
-    db.refresh(db_expense)
-
-    # Update salary month totals if changed
-    if old_salary_month_id:
-        _update_salary_month_totals(old_salary_month_id, db)
-    if db_expense.salary_month_id and db_expense.salary_month_id != old_salary_month_id:
-        _update_salary_month_totals(db_expense.salary_month_id, db)
+    # Flush (not commit) so the budget totals below see the edited row
+    db.flush()
 
     # Update old budget if category or date changed
     if old_category != db_expense.category or old_date != db_expense.date:
@@ -468,6 +469,10 @@ def update_expense(
     # Update current matching budget
     _update_matching_budget(db_expense, db)
 
+    db.commit()
+    db.refresh(db_expense)
+
+    response_cache.invalidate(current_user.id)
     return db_expense
 
 
@@ -490,8 +495,6 @@ def delete_expense(
             detail="Expense not found"
         )
 
-    salary_month_id = db_expense.salary_month_id
-
     # Reverse savings withdrawal if this expense was funded from savings.
     # We add a reversal DEPOSIT (not delete the original withdrawal) to preserve
     # the full audit trail. The original withdrawal transaction stays in history.
@@ -521,21 +524,21 @@ def delete_expense(
             db.flush()
 
     db_expense.deleted = True
-    db.commit()
+    db.flush()
 
     # Recompute savings balance chain after adding the reversal deposit
     if saving_to_recompute:
-        from app.routers.savings import _recompute_balance_chain
-        _recompute_balance_chain(saving_to_recompute, db)
-        db.commit()
-
-    # Update salary month totals if linked
-    if salary_month_id:
-        _update_salary_month_totals(salary_month_id, db)
+        from app.routers.savings import _recompute_balance_chain_or_400
+        _recompute_balance_chain_or_400(
+            saving_to_recompute, db, "Cannot delete: would result in negative savings balance in the transaction chain"
+        )
 
     # Update matching budget
     _update_matching_budget(db_expense, db)
 
+    db.commit()
+
+    response_cache.invalidate(current_user.id)
     return {"message": "Expense deleted"}
 
 
@@ -572,19 +575,13 @@ def get_expense_summary_by_category(
     expenses = query.all()
 
     # Group by category
-    summary = {}
+    summary = defaultdict(lambda: {"total": 0, "count": 0, "average": 0})
     total = 0
 
     for expense in expenses:
-        category = expense.category or "uncategorized"
-        if category not in summary:
-            summary[category] = {
-                "total": 0,
-                "count": 0,
-                "average": 0
-            }
-        summary[category]["total"] += expense.amount
-        summary[category]["count"] += 1
+        entry = summary[expense.category or "uncategorized"]
+        entry["total"] += expense.amount
+        entry["count"] += 1
         total += expense.amount
 
     # Calculate averages and percentages
@@ -593,7 +590,7 @@ def get_expense_summary_by_category(
         summary[category]["percentage"] = (summary[category]["total"] / total * 100) if total > 0 else 0
 
     return {
-        "summary": summary,
+        "summary": dict(summary),
         "total": total,
         "period": f"{year}-{month:02d}" if year and month else str(year) if year else "all-time"
     }
@@ -639,7 +636,10 @@ def _update_matching_budget(expense: models.Expense, db: Session):
 
 
 def _update_matching_budget_by_fields(person_id: int, category: str, expense_date, db: Session):
-    """Find and update the budget matching the given person, category and date"""
+    """Find and update the budget matching the given person, category and date.
+
+    Does not commit — the calling route commits once for the whole write.
+    """
     period = expense_date.strftime("%Y-%m")
     budget = db.query(models.Budget).filter(
         models.Budget.person_id == person_id,
@@ -651,32 +651,4 @@ def _update_matching_budget_by_fields(person_id: int, category: str, expense_dat
     if budget:
         from app.routers.budgets import _update_budget_totals
         _update_budget_totals(budget.id, db)
-        db.commit()
-
-
-def _update_salary_month_totals(salary_month_id: int, db: Session):
-    """Update total_spent and remaining_amount for a salary month.
-
-    For Gennis-mirrored months we leave total_spent / remaining_amount alone
-    — those reflect what the company has paid you (Gennis taken_money /
-    remaining_salary) and would otherwise be clobbered by the sum of local
-    expenses (a different concept).
-    """
-    salary_month = db.query(models.SalaryMonth).filter(
-        models.SalaryMonth.id == salary_month_id
-    ).first()
-
-    if not salary_month:
-        return
-    if salary_month.gennis_salary_location_id is not None:
-        return
 
-    expenses = db.query(models.Expense).filter(
-        models.Expense.salary_month_id == salary_month_id,
-        models.Expense.deleted == False
-    ).all()
-
-    total_spent = sum(expense.amount for expense in expenses)
-    salary_month.total_spent = total_spent
-    salary_month.remaining_amount = salary_month.net_amount - total_spent
-    db.commit()
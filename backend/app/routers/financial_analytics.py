@@ -1,13 +1,15 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import select
 from sqlalchemy.orm import Session
 from typing import List, Optional, Dict
+from collections import defaultdict
 from datetime import datetime, date, timedelta
 
 from app import models, schemas
 from app.database import get_db
 from app.dependencies import get_current_user
-from app.routers.savings import _sync_balance
-from app.services import gennis_sync
+from app.routers.savings import _sync_balance_or_400
+from app.services import gennis_sync, response_cache
 
 router = APIRouter(
     prefix="/financial-analytics",
@@ -25,6 +27,14 @@ def get_monthly_summary(
     Get comprehensive financial summary for a month
     Month format: YYYY-MM (e.g., "2026-01")
     """
+    return response_cache.get_or_compute(
+        current_user.id,
+        ("monthly-summary", month),
+        lambda: _build_monthly_summary(month, db, current_user),
+    )
+
+
+def _build_monthly_summary(month: str, db: Session, current_user: models.Person) -> schemas.FinancialSummary:
     try:
         year, month_num = map(int, month.split('-'))
         start_date = date(year, month_num, 1)
@@ -43,29 +53,32 @@ def get_monthly_summary(
     gennis_sync.ensure_fresh_for_person(current_user.id, db)
 
     # Calculate total salary income
-    salary_months = db.query(models.SalaryMonth).filter(
+    salary_months = db.execute(select(models.SalaryMonth.net_amount).where(
         models.SalaryMonth.person_id == current_user.id,
         models.SalaryMonth.month == month,
         models.SalaryMonth.deleted == False
-    ).all()
+    )).all()
     total_salary = sum(sm.net_amount for sm in salary_months)
 
     # Calculate other income
-    income_sources = db.query(models.IncomeSource).filter(
+    income_sources = db.execute(select(models.IncomeSource.amount).where(
         models.IncomeSource.person_id == current_user.id,
         models.IncomeSource.deleted == False,
         models.IncomeSource.received_date >= start_date,
         models.IncomeSource.received_date < end_date
-    ).all()
+    )).all()
     total_other_income = sum(inc.amount for inc in income_sources)
 
-    # Calculate expenses — split by funding source
-    all_expenses = db.query(models.Expense).filter(
+    # Calculate expenses — split by funding source. Only a few columns are
+    # read, so load plain Row tuples instead of full ORM objects.
+    all_expenses = db.execute(select(
+        models.Expense.amount, models.Expense.category, models.Expense.saving_id
+    ).where(
         models.Expense.person_id == current_user.id,
         models.Expense.deleted == False,
         models.Expense.date >= start_date,
         models.Expense.date < end_date
-    ).all()
+    )).all()
     # Income-funded: no saving_id (paid from salary/other income)
     income_expenses = [e for e in all_expenses if e.saving_id is None]
     # Savings-funded: has saving_id (paid from savings withdrawal)
@@ -75,10 +88,9 @@ def get_monthly_summary(
     savings_funded_total = sum(e.amount for e in savings_expenses)
 
     # Expense breakdown by category (income-funded only)
-    expense_by_category = {}
+    expense_by_category = defaultdict(float)
     for exp in income_expenses:
-        category = exp.category or "uncategorized"
-        expense_by_category[category] = expense_by_category.get(category, 0) + exp.amount
+        expense_by_category[exp.category or "uncategorized"] += exp.amount
 
     # Calculate total savings balance at end of the queried month
     savings_accounts = db.query(models.Saving).filter(
@@ -108,7 +120,7 @@ def get_monthly_summary(
         savings_funded_total=savings_funded_total,
         net_income=net_income,
         total_savings=total_savings,
-        expense_by_category=expense_by_category,
+        expense_by_category=dict(expense_by_category),
         savings_rate=round(savings_rate, 2)
     )
 
@@ -134,38 +146,41 @@ def get_monthly_report(
         )
 
     # Get salary
-    salary_months = db.query(models.SalaryMonth).filter(
+    salary_months = db.execute(select(models.SalaryMonth.net_amount).where(
         models.SalaryMonth.person_id == current_user.id,
         models.SalaryMonth.month == month,
         models.SalaryMonth.deleted == False
-    ).all()
+    )).all()
     salary_received = sum(sm.net_amount for sm in salary_months)
 
     # Get other income
-    income_sources = db.query(models.IncomeSource).filter(
+    income_sources = db.execute(select(models.IncomeSource.amount).where(
         models.IncomeSource.person_id == current_user.id,
         models.IncomeSource.deleted == False,
         models.IncomeSource.received_date >= start_date,
         models.IncomeSource.received_date < end_date
-    ).all()
+    )).all()
     other_income = sum(inc.amount for inc in income_sources)
 
     # Get expenses — split by funding source
-    all_expenses = db.query(models.Expense).filter(
+    all_expenses = db.execute(select(
+        models.Expense.name, models.Expense.amount, models.Expense.category,
+        models.Expense.date, models.Expense.saving_id
+    ).where(
         models.Expense.person_id == current_user.id,
         models.Expense.deleted == False,
         models.Expense.date >= start_date,
         models.Expense.date < end_date
-    ).all()
+    )).all()
     income_expenses = [e for e in all_expenses if e.saving_id is None]
     savings_expenses = [e for e in all_expenses if e.saving_id is not None]
     total_expenses = sum(e.amount for e in income_expenses)
     savings_funded_total = sum(e.amount for e in savings_expenses)
 
     # Get savings contributions (deposits only — not expense-withdrawals)
-    saving_ids = [s.id for s in db.query(models.Saving).filter(models.Saving.person_id == current_user.id).all()]
+    saving_ids = db.query(models.Saving.id).filter(models.Saving.person_id == current_user.id)
     savings_transactions = db.query(models.SavingTransaction).filter(
-        models.SavingTransaction.saving_id.in_(saving_ids),
+        models.SavingTransaction.saving_id.in_(saving_ids.scalar_subquery()),
         models.SavingTransaction.transaction_type == "deposit",
         models.SavingTransaction.transaction_date >= start_date,
         models.SavingTransaction.transaction_date < end_date
@@ -183,10 +198,13 @@ def get_monthly_report(
         models.Budget.deleted == False
     ).all()
 
+    spent_by_category = defaultdict(float)
+    for e in all_expenses:
+        spent_by_category[e.category] += e.amount
+
     budget_adherence = {}
     for budget in budgets:
-        cat_expenses = [e for e in all_expenses if e.category == budget.category]
-        spent = sum(e.amount for e in cat_expenses)
+        spent = spent_by_category.get(budget.category, 0.0)
         adherence = (spent / budget.allocated_amount * 100) if budget.allocated_amount > 0 else 0
         budget_adherence[budget.category] = round(adherence, 2)
 
@@ -222,6 +240,15 @@ def calculate_net_worth(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Calculate total net worth"""
+    current_month = date.today().strftime("%Y-%m")
+    return response_cache.get_or_compute(
+        current_user.id,
+        ("net-worth", current_month),
+        lambda: _build_net_worth(current_month, db, current_user),
+    )
+
+
+def _build_net_worth(current_month: str, db: Session, current_user: models.Person) -> dict:
     # Get all savings
     savings = db.query(models.Saving).filter(
         models.Saving.person_id == current_user.id,
@@ -230,24 +257,23 @@ def calculate_net_worth(
 
     any_synced = False
     total_savings = 0.0
-    savings_by_type = {}
+    savings_by_type = defaultdict(float)
     for s in savings:
-        balance = _sync_balance(s, db)
+        balance = _sync_balance_or_400(s, db)
         if s in db.dirty:
             any_synced = True
         total_savings += balance
-        savings_by_type[s.account_type] = savings_by_type.get(s.account_type, 0) + balance
+        savings_by_type[s.account_type] += balance
 
     if any_synced or db.new or db.dirty:
         db.commit()
 
     # Get current month's remaining salary across all jobs
-    current_month = date.today().strftime("%Y-%m")
-    salary_months = db.query(models.SalaryMonth).filter(
+    salary_months = db.execute(select(models.SalaryMonth.remaining_amount).where(
         models.SalaryMonth.person_id == current_user.id,
         models.SalaryMonth.month == current_month,
         models.SalaryMonth.deleted == False
-    ).all()
+    )).all()
 
     cash_in_hand = sum(sm.remaining_amount for sm in salary_months if sm.remaining_amount > 0)
 
@@ -259,7 +285,7 @@ def calculate_net_worth(
             "savings_accounts": total_savings,
             "cash_in_hand": cash_in_hand,
         },
-        "savings_by_type": savings_by_type
+        "savings_by_type": dict(savings_by_type)
     }
 
 
@@ -291,12 +317,14 @@ def get_spending_trends(
             end_date = date(target_year, target_month + 1, 1)
 
         # Get expenses for this month — split by source
-        all_expenses = db.query(models.Expense).filter(
+        all_expenses = db.execute(select(
+            models.Expense.amount, models.Expense.category, models.Expense.saving_id
+        ).where(
             models.Expense.person_id == current_user.id,
             models.Expense.deleted == False,
             models.Expense.date >= start_date,
             models.Expense.date < end_date
-        ).all()
+        )).all()
         income_expenses = [e for e in all_expenses if e.saving_id is None]
         savings_expenses = [e for e in all_expenses if e.saving_id is not None]
 
@@ -304,17 +332,16 @@ def get_spending_trends(
         savings_funded = sum(e.amount for e in savings_expenses)
 
         # Category breakdown (income-funded only)
-        by_category = {}
+        by_category = defaultdict(float)
         for exp in income_expenses:
-            cat = exp.category or "uncategorized"
-            by_category[cat] = by_category.get(cat, 0) + exp.amount
+            by_category[exp.category or "uncategorized"] += exp.amount
 
         trends.append({
             "period": period,
             "total_spent": total,
             "savings_funded": savings_funded,
             "expense_count": len(income_expenses),
-            "by_category": by_category
+            "by_category": dict(by_category)
         })
 
     # Calculate average monthly spending
@@ -354,13 +381,13 @@ def analyze_category_spending(
         else:
             end_date = date(target_year, target_month + 1, 1)
 
-        expenses = db.query(models.Expense).filter(
+        expenses = db.execute(select(models.Expense.amount).where(
             models.Expense.person_id == current_user.id,
             models.Expense.deleted == False,
             models.Expense.category == category,
             models.Expense.date >= start_date,
             models.Expense.date < end_date
-        ).all()
+        )).all()
 
         total = sum(exp.amount for exp in expenses)
         avg = total / len(expenses) if expenses else 0
@@ -467,30 +494,32 @@ def compare_income_expenses(
             end_date = date(target_year, target_month + 1, 1)
 
         # Calculate income
-        salary = db.query(models.SalaryMonth).filter(
+        salary = db.execute(select(models.SalaryMonth.net_amount).where(
             models.SalaryMonth.person_id == current_user.id,
             models.SalaryMonth.month == period,
             models.SalaryMonth.deleted == False
-        ).all()
+        )).all()
         salary_income = sum(s.net_amount for s in salary)
 
-        other_income = db.query(models.IncomeSource).filter(
+        other_income = db.execute(select(models.IncomeSource.amount).where(
             models.IncomeSource.person_id == current_user.id,
             models.IncomeSource.deleted == False,
             models.IncomeSource.received_date >= start_date,
             models.IncomeSource.received_date < end_date
-        ).all()
+        )).all()
         other_income_total = sum(inc.amount for inc in other_income)
 
         total_income = salary_income + other_income_total
 
         # Calculate expenses — split by source
-        all_expenses = db.query(models.Expense).filter(
+        all_expenses = db.execute(select(
+            models.Expense.amount, models.Expense.category, models.Expense.saving_id
+        ).where(
             models.Expense.person_id == current_user.id,
             models.Expense.deleted == False,
             models.Expense.date >= start_date,
             models.Expense.date < end_date
-        ).all()
+        )).all()
         income_expenses = [e for e in all_expenses if e.saving_id is None]
         savings_expenses = [e for e in all_expenses if e.saving_id is not None]
         total_expenses = sum(e.amount for e in income_expenses)
@@ -1,22 +1,84 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
-from typing import List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, Response, status, Query
+from fastapi.encoders import jsonable_encoder
+from sqlalchemy.orm import Session, raiseload
+import hashlib
+import json
+from collections import Counter
+from typing import Optional
 from datetime import datetime
 
-from sqlalchemy import or_, func
+from sqlalchemy import and_, or_, func, case, insert, select, update
 
 from app import models, schemas
 from app.database import get_db
+from app.services import response_cache
+from app.services.list_rows import as_dicts, columns_of
 from app.services.progress_service import ProgressService
 from app.dependencies import get_current_active_user
 
-not_deleted = or_(models.Goal.deleted == False, models.Goal.deleted.is_(None))
+# Statistics are cached per goal owner; goal, task, milestone and subtask
+# writes invalidate them.
+STATS_CACHE_TTL = 30
 
 router = APIRouter(
     prefix="/goals",
     tags=["goals"]
 )
 
+# List routes read trusted columns straight into dicts (see list_rows); the
+# stored percentage is NULL-safe in SQL, as the hybrid property is in Python.
+_GOAL_PERCENTAGE = func.coalesce(models.Goal._stored_percentage, 0.0).label("percentage")
+GOAL_COLUMNS = columns_of(schemas.Goal)
+GOAL_FIELDS = tuple(
+    _GOAL_PERCENTAGE if column == "percentage" else getattr(models.Goal, column) for column in GOAL_COLUMNS
+)
+GOAL_LIST_ITEM_COLUMNS = columns_of(schemas.GoalListItem)
+GOAL_LIST_ITEM_FIELDS = tuple(
+    _GOAL_PERCENTAGE if column == "percentage" else getattr(models.Goal, column) for column in GOAL_LIST_ITEM_COLUMNS
+)
+
+
+def _get_active_goal(db: Session, goal_id: int, options=()) -> models.Goal:
+    """Primary-key lookup (identity-map first) that 404s on missing or soft-deleted goals.
+
+    Soft-deleted rows are already filtered by the session's loader criteria;
+    the flag check covers instances sitting in the identity map.
+    """
+    goal = db.get(models.Goal, goal_id, options=options)
+    if goal is None or goal.deleted:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found")
+    return goal
+
+
+def _set_goal_deleted(db: Session, goal: models.Goal, deleted: bool) -> None:
+    """Flip the soft-delete flag on a goal and all its tasks and milestones.
+
+    Children are updated with one bulk UPDATE per table rather than loading
+    them through the ORM cascade. Commit is left to the caller.
+    """
+    db.execute(
+        update(models.Task).where(models.Task.goal_id == goal.id).values(deleted=deleted),
+        execution_options={"synchronize_session": False},
+    )
+    db.execute(
+        update(models.Milestone).where(models.Milestone.goal_id == goal.id).values(deleted=deleted),
+        execution_options={"synchronize_session": False},
+    )
+    goal.deleted = deleted
+
+
+def _not_modified(request: Request, response: Response, *version) -> Optional[Response]:
+    """Set an ETag derived from `version`; return a 304 if the client already has it."""
+    etag = '"%s"' % hashlib.md5(repr(version).encode()).hexdigest()
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers={"ETag": etag})
+    response.headers["ETag"] = etag
+    return None
+
+
+def _payload_version(payload) -> str:
+    return json.dumps(jsonable_encoder(payload), sort_keys=True)
+
 
 # ─── Collection / creation ───────────────────────────────────────────────────
 
@@ -27,52 +89,74 @@ def create_goal(
         current_user=Depends(get_current_active_user)
 ):
     """Create a new goal"""
-    new_goal = models.Goal(**goal.model_dump())
-    db.add(new_goal)
+    # INSERT ... RETURNING hands back the full row, so no refresh SELECT;
+    # serialize before commit expires the instance.
+    new_goal = db.execute(
+        insert(models.Goal).values(**goal.model_dump()).returning(models.Goal)
+    ).scalar_one()
+    result = schemas.Goal.model_validate(new_goal)
     db.commit()
-    db.refresh(new_goal)
-    return new_goal
+    response_cache.invalidate(result.person_id)
+    return result
 
 
-@router.get('/', response_model=List[schemas.Goal])
+@router.get('/', response_model=None)
 def get_goals(
+        request: Request,
+        response: Response,
         person_id: int = Query(..., description="Person ID"),
         status_filter: Optional[str] = Query(None, description="Filter by status: active, completed, paused"),
         category_filter: Optional[str] = Query(None, description="Filter by category"),
+        slim: bool = Query(False, description="Return only id, name, status, percentage, category and priority"),
         db: Session = Depends(get_db),
         current_user=Depends(get_current_active_user)
 ):
     """
     Get all goals with optional filters.
-    Percentage field shows the latest calculated progress.
+    Pass slim=true for light list items; fetch /{goal_id} for the full record.
     """
-    query = db.query(models.Goal).filter(models.Goal.person_id == person_id, not_deleted)
+    filters = [models.Goal.person_id == person_id]
 
     if status_filter:
-        query = query.filter(models.Goal.status == status_filter)
+        filters.append(models.Goal.status == status_filter)
 
     if category_filter:
-        query = query.filter(models.Goal.category == category_filter)
+        filters.append(models.Goal.category == category_filter)
 
-    return query.all()
+    # Row count + newest updated_at changes whenever the list would. Every goal
+    # write bumps updated_at, so this needs no Redis counter or write-side hook.
+    version = db.execute(
+        select(func.count(models.Goal.id), func.max(models.Goal.updated_at)).where(*filters)
+    ).one()
+    not_modified = _not_modified(request, response, person_id, status_filter, category_filter, slim, *version)
+    if not_modified:
+        return not_modified
+
+    # Only the response columns are selected — no ORM objects are built
+    if slim:
+        return as_dicts(db.execute(select(*GOAL_LIST_ITEM_FIELDS).where(*filters)), GOAL_LIST_ITEM_COLUMNS)
+    return as_dicts(db.execute(select(*GOAL_FIELDS).where(*filters)), GOAL_COLUMNS)
 
 
 # ─── Static sub-paths (must come BEFORE /{goal_id}) ──────────────────────────
 
-@router.get('/deleted/person/{person_id}', response_model=List[schemas.Goal])
+@router.get('/deleted/person/{person_id}', response_model=None)
 def get_deleted_goals(
         person_id: int,
         db: Session = Depends(get_db),
         current_user=Depends(get_current_active_user)
 ):
     """Get all soft-deleted goals for a specific person"""
-    return db.query(models.Goal).filter(
-        models.Goal.person_id == person_id,
-        models.Goal.deleted == True
-    ).all()
+    return as_dicts(db.execute(
+        select(*GOAL_FIELDS).where(
+            models.Goal.person_id == person_id,
+            models.Goal.deleted == True
+        ),
+        execution_options={"include_deleted": True},
+    ), GOAL_COLUMNS)
 
 
-@router.get('/person/{person_id}', response_model=List[schemas.Goal])
+@router.get('/person/{person_id}', response_model=None)
 def get_goals_by_person(
         person_id: int,
         include_completed: bool = Query(True, description="Include completed goals"),
@@ -80,16 +164,18 @@ def get_goals_by_person(
         current_user=Depends(get_current_active_user)
 ):
     """Get all goals for a specific person"""
-    query = db.query(models.Goal).filter(models.Goal.person_id == person_id, not_deleted)
+    stmt = select(*GOAL_FIELDS).where(models.Goal.person_id == person_id)
 
     if not include_completed:
-        query = query.filter(models.Goal.status != 'completed')
+        stmt = stmt.where(models.Goal.status != 'completed')
 
-    return query.all()
+    return as_dicts(db.execute(stmt), GOAL_COLUMNS)
 
 
 @router.get('/statistics/overview')
 def get_all_goals_overview(
+        request: Request,
+        response: Response,
         person_id: Optional[int] = Query(None, description="Filter by person ID"),
         db: Session = Depends(get_db),
         current_user=Depends(get_current_active_user)
@@ -103,14 +189,34 @@ def get_all_goals_overview(
     - Goals on track vs behind schedule
     - Total tasks and completion rate
     """
-    query = db.query(models.Goal).filter(not_deleted)
+    if person_id is None:
+        # Spans every person, so no single person's writes could invalidate it
+        overview = _build_goals_overview(None, db)
+    else:
+        overview = response_cache.get_or_compute(
+            person_id,
+            "goals-overview",
+            lambda: _build_goals_overview(person_id, db),
+            ttl=STATS_CACHE_TTL,
+        )
+    return _not_modified(request, response, _payload_version(overview)) or overview
 
+
+def _build_goals_overview(person_id: Optional[int], db: Session) -> dict:
+    goal_filter = []
     if person_id:
-        query = query.filter(models.Goal.person_id == person_id)
+        goal_filter.append(models.Goal.person_id == person_id)
 
-    goals = query.all()
+    # Bucket and sum in the database: one row per status instead of one per goal
+    status_rows = db.execute(select(
+        models.Goal.status,
+        func.count(models.Goal.id),
+        func.coalesce(func.sum(func.coalesce(models.Goal._stored_percentage, 0.0)), 0.0),
+    ).where(*goal_filter).group_by(models.Goal.status)).all()
 
-    if not goals:
+    total_goals = sum(count for _, count, _ in status_rows)
+
+    if not total_goals:
         return {
             'total_goals': 0,
             'by_status': {},
@@ -119,24 +225,18 @@ def get_all_goals_overview(
             'total_completed_tasks': 0
         }
 
-    by_status = {}
-    total_percentage = 0
-    total_tasks = 0
-    total_completed = 0
-
-    for goal in goals:
-        goal_status = goal.status
-        by_status[goal_status] = by_status.get(goal_status, 0) + 1
-        total_percentage += goal.percentage
+    by_status = {goal_status: count for goal_status, count, _ in status_rows}
+    total_percentage = sum(percentage_sum for _, _, percentage_sum in status_rows)
 
-        tasks = db.query(models.Task).filter(models.Task.goal_id == goal.id).all()
-        total_tasks += len(tasks)
-        total_completed += sum(1 for t in tasks if t.completed)
+    total_tasks, total_completed = db.execute(select(
+        func.count(models.Task.id),
+        func.coalesce(func.sum(case((models.Task.completed == True, 1), else_=0)), 0),
+    ).join(models.Goal, models.Task.goal_id == models.Goal.id).where(*goal_filter)).one()
 
-    avg_completion = total_percentage / len(goals) if goals else 0
+    avg_completion = total_percentage / total_goals
 
     return {
-        'total_goals': len(goals),
+        'total_goals': total_goals,
         'by_status': by_status,
         'average_completion': round(avg_completion, 2),
         'total_tasks': total_tasks,
@@ -147,6 +247,8 @@ def get_all_goals_overview(
 
 @router.get('/statistics/person/{person_id}')
 def get_goals_statistics_by_person(
+        request: Request,
+        response: Response,
         person_id: int,
         db: Session = Depends(get_db),
         current_user=Depends(get_current_active_user)
@@ -158,19 +260,31 @@ def get_goals_statistics_by_person(
     - Summary: total goals, by status, by category, average completion
     - Per-goal breakdown: tasks, milestones, progress, target vs current value
     """
-    all_goals = db.query(models.Goal).filter(
-        models.Goal.person_id == person_id
-    ).all()
+    statistics = response_cache.get_or_compute(
+        person_id,
+        "goals-statistics",
+        lambda: _build_goals_statistics(person_id, db),
+        ttl=STATS_CACHE_TTL,
+    )
+    return _not_modified(request, response, _payload_version(statistics)) or statistics
+
+
+def _build_goals_statistics(person_id: int, db: Session) -> dict:
+    all_goals = db.execute(
+        select(models.Goal).where(models.Goal.person_id == person_id),
+        execution_options={"include_deleted": True},
+    ).scalars().all()
 
     deleted_goals = sum(1 for g in all_goals if g.deleted)
     goals = [g for g in all_goals if not g.deleted]
 
-    if not all_goals:
+    # Nothing active: skip the grouped count queries entirely
+    if not goals:
         return {
             'person_id': person_id,
-            'total_goals': 0,
+            'total_goals': len(all_goals),
             'active_goals': 0,
-            'deleted_goals': 0,
+            'deleted_goals': deleted_goals,
             'by_status': {},
             'by_category': {},
             'average_completion': 0,
@@ -182,45 +296,48 @@ def get_goals_statistics_by_person(
             'goals': []
         }
 
-    by_status = {}
-    by_category = {}
-    total_percentage = 0
+    by_status = Counter(goal.status for goal in goals)
+    by_category = Counter(goal.category or 'uncategorized' for goal in goals)
+    total_percentage = sum(goal.percentage for goal in goals)
     total_tasks = 0
     total_completed_tasks = 0
     total_milestones = 0
     total_achieved_milestones = 0
     goals_detail = []
 
-    for goal in goals:
-        by_status[goal.status] = by_status.get(goal.status, 0) + 1
-
-        cat = goal.category or 'uncategorized'
-        by_category[cat] = by_category.get(cat, 0) + 1
-
-        total_percentage += goal.percentage
-
-        goal_total_tasks = db.query(func.count(models.Task.id)).filter(
-            models.Task.goal_id == goal.id,
+    # Per-goal task / milestone counts in two grouped queries instead of
+    # four COUNT queries per goal.
+    goal_ids = [g.id for g in goals]
+    task_stats = {
+        goal_id: (total, completed or 0)
+        for goal_id, total, completed in db.execute(select(
+            models.Task.goal_id,
+            func.count(models.Task.id),
+            func.sum(case((models.Task.completed == True, 1), else_=0)),
+        ).where(
+            models.Task.goal_id.in_(goal_ids),
             or_(models.Task.deleted == False, models.Task.deleted.is_(None))
-        ).scalar()
-        goal_completed_tasks = db.query(func.count(models.Task.id)).filter(
-            models.Task.goal_id == goal.id,
-            models.Task.completed == True,
-            or_(models.Task.deleted == False, models.Task.deleted.is_(None))
-        ).scalar()
+        ).group_by(models.Task.goal_id))
+    }
+    milestone_stats = {
+        goal_id: (total, achieved or 0)
+        for goal_id, total, achieved in db.execute(select(
+            models.Milestone.goal_id,
+            func.count(models.Milestone.id),
+            func.sum(case((models.Milestone.achieved == True, 1), else_=0)),
+        ).where(
+            models.Milestone.goal_id.in_(goal_ids),
+            models.Milestone.deleted == False
+        ).group_by(models.Milestone.goal_id))
+    }
+
+    for goal in goals:
+        goal_total_tasks, goal_completed_tasks = task_stats.get(goal.id, (0, 0))
 
         total_tasks += goal_total_tasks
         total_completed_tasks += goal_completed_tasks
 
-        goal_total_milestones = db.query(func.count(models.Milestone.id)).filter(
-            models.Milestone.goal_id == goal.id,
-            models.Milestone.deleted == False
-        ).scalar()
-        goal_achieved_milestones = db.query(func.count(models.Milestone.id)).filter(
-            models.Milestone.goal_id == goal.id,
-            models.Milestone.achieved == True,
-            models.Milestone.deleted == False
-        ).scalar()
+        goal_total_milestones, goal_achieved_milestones = milestone_stats.get(goal.id, (0, 0))
 
         total_milestones += goal_total_milestones
         total_achieved_milestones += goal_achieved_milestones
@@ -250,8 +367,8 @@ def get_goals_statistics_by_person(
         'total_goals': len(all_goals),
         'active_goals': len(goals),
         'deleted_goals': deleted_goals,
-        'by_status': by_status,
-        'by_category': by_category,
+        'by_status': dict(by_status),
+        'by_category': dict(by_category),
         'average_completion': avg_completion,
         'total_tasks': total_tasks,
         'total_completed_tasks': total_completed_tasks,
@@ -267,14 +384,14 @@ def get_goals_statistics_by_person(
 @router.get('/{goal_id}', response_model=schemas.Goal)
 def get_goal(
         goal_id: int,
+        request: Request,
+        response: Response,
         db: Session = Depends(get_db),
         current_user=Depends(get_current_active_user)
 ):
     """Get a specific goal by ID with current progress percentage"""
-    goal = db.query(models.Goal).filter(models.Goal.id == goal_id, not_deleted).first()
-    if not goal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found")
-    return goal
+    goal = _get_active_goal(db, goal_id)
+    return _not_modified(request, response, goal.id, goal.updated_at) or goal
 
 
 @router.get('/{goal_id}/with-stats', response_model=schemas.GoalWithStats)
@@ -290,21 +407,30 @@ def get_goal_with_statistics(
     - Manual percentage (if target_value exists)
     - Current stored percentage
     """
-    goal = db.query(models.Goal).filter(models.Goal.id == goal_id, not_deleted).first()
-    if not goal:
+    owner_id = db.scalar(select(models.Goal.person_id).where(models.Goal.id == goal_id))
+    if owner_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found")
+    return response_cache.get_or_compute(
+        owner_id,
+        ("goal-with-stats", goal_id),
+        lambda: _build_goal_with_statistics(goal_id, db),
+        ttl=STATS_CACHE_TTL,
+    )
 
-    progress_details = ProgressService.get_goal_progress_details(goal_id, db)
 
-    goal_dict = {
-        **goal.__dict__,
-        'total_tasks': progress_details['total_tasks'],
-        'completed_tasks': progress_details['completed_tasks'],
-        'task_completion_percentage': progress_details['percentages']['simple'],
-        'manual_percentage': goal.calculate_manual_percentage()
-    }
+def _build_goal_with_statistics(goal_id: int, db: Session) -> schemas.GoalWithStats:
+    goal = _get_active_goal(db, goal_id, options=[raiseload("*")])
+
+    # Only the task counts are needed here, not the full progress breakdown
+    total_tasks, completed_tasks = ProgressService.get_task_counts([goal_id], db)[goal_id]
+    task_completion = round(completed_tasks / total_tasks * 100, 2) if total_tasks else 0.0
 
-    return goal_dict
+    return schemas.GoalWithStats.model_validate(goal).model_copy(update={
+        'total_tasks': total_tasks,
+        'completed_tasks': completed_tasks,
+        'task_completion_percentage': task_completion,
+        'manual_percentage': goal.manual_percentage
+    })
 
 
 @router.get('/{goal_id}/progress-details')
@@ -322,9 +448,7 @@ def get_goal_progress_details(
     - Priority breakdowns
     - Target vs current values
     """
-    goal = db.query(models.Goal).filter(models.Goal.id == goal_id, not_deleted).first()
-    if not goal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found")
+    _get_active_goal(db, goal_id)
 
     return ProgressService.get_goal_progress_details(goal_id, db)
 
@@ -340,9 +464,7 @@ def update_goal(
     Update a goal. If current_value is updated and target_value exists,
     the percentage will be recalculated based on manual progress.
     """
-    db_goal = db.query(models.Goal).filter(models.Goal.id == goal_id, not_deleted).first()
-    if not db_goal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found")
+    db_goal = _get_active_goal(db, goal_id)
 
     update_data = goal.model_dump(exclude_unset=True)
     current_value_changed = 'current_value' in update_data
@@ -357,6 +479,7 @@ def update_goal(
         ProgressService.update_goal_percentage(goal_id, db, method='hybrid')
         db.refresh(db_goal)
 
+    response_cache.invalidate(db_goal.person_id)
     return db_goal
 
 
@@ -367,13 +490,14 @@ def delete_goal(
         current_user=Depends(get_current_active_user)
 ):
     """Soft-delete a goal (marks it as deleted). Use the restore endpoint to undo."""
-    db_goal = db.query(models.Goal).filter(models.Goal.id == goal_id).first()
+    db_goal = db.get(models.Goal, goal_id, execution_options={"include_deleted": True})
     if not db_goal:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found")
     if db_goal.deleted:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Goal is already deleted")
-    db_goal.deleted = True
+    _set_goal_deleted(db, db_goal, True)
     db.commit()
+    response_cache.invalidate(db_goal.person_id)
     return {"message": "Goal deleted"}
 
 
@@ -384,14 +508,15 @@ def restore_goal(
         current_user=Depends(get_current_active_user)
 ):
     """Restore a previously soft-deleted goal."""
-    db_goal = db.query(models.Goal).filter(models.Goal.id == goal_id).first()
+    db_goal = db.get(models.Goal, goal_id, execution_options={"include_deleted": True})
     if not db_goal:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found")
     if not db_goal.deleted:
         raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Goal is not deleted")
-    db_goal.deleted = False
+    _set_goal_deleted(db, db_goal, False)
     db.commit()
     db.refresh(db_goal)
+    response_cache.invalidate(db_goal.person_id)
     return db_goal
 
 
@@ -411,9 +536,7 @@ def recalculate_goal_progress(
     - subtasks: Include subtask completion in calculation
     - hybrid: Use manual progress if available, otherwise use simple task counting
     """
-    goal = db.query(models.Goal).filter(models.Goal.id == goal_id, not_deleted).first()
-    if not goal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found")
+    goal = _get_active_goal(db, goal_id)
 
     new_percentage = ProgressService.update_goal_percentage(goal_id, db, method=method)
 
@@ -433,6 +556,7 @@ def recalculate_goal_progress(
     except Exception:
         pass
 
+    response_cache.invalidate(goal.person_id)
     return goal
 
 
@@ -446,23 +570,37 @@ def mark_goal_complete(
     Mark a goal as completed.
     Sets status to 'completed' and percentage to 100.
     """
-    goal = db.query(models.Goal).filter(models.Goal.id == goal_id, not_deleted).first()
-    if not goal:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found")
+    # One conditional UPDATE ... RETURNING: the status guard makes it atomic,
+    # and no separate SELECT / refresh round trips are needed.
+    stmt = (
+        update(models.Goal)
+        .where(
+            models.Goal.id == goal_id,
+            models.Goal.deleted == False,
+            models.Goal.status.is_distinct_from('completed'),
+        )
+        .values(
+            status='completed',
+            _stored_percentage=100.0,
+            current_value=case(
+                (and_(models.Goal.target_value.isnot(None), models.Goal.target_value != 0), models.Goal.target_value),
+                else_=models.Goal.current_value,
+            ),
+        )
+        .returning(models.Goal)
+    )
+    goal = db.execute(stmt).scalar_one_or_none()
 
-    if goal.status == 'completed':
+    if goal is None:
+        # Either missing/deleted (404) or already completed (400)
+        _get_active_goal(db, goal_id)
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Goal is already completed"
         )
 
-    goal.status = 'completed'
-    goal.percentage = 100.0
-
-    if goal.target_value:
-        goal.current_value = goal.target_value
-
+    result = schemas.Goal.model_validate(goal)
     db.commit()
-    db.refresh(goal)
 
-    return goal
+    response_cache.invalidate(result.person_id)
+    return result
@@ -1,17 +1,29 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlalchemy import func, update
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from datetime import datetime, date
+from datetime import date, timedelta
 
 from app import models, schemas
 from app.database import get_db
 from app.dependencies import get_current_user
+from app.services import response_cache
+from app.services.list_rows import as_dicts, columns_of, entity_columns
+from app.utils.dates import month_range, year_range
+from app.utils.pagination import keyset_page
 
 router = APIRouter(
     prefix="/income-sources",
     tags=["income-sources"]
 )
 
+INCOME_SOURCE_COLUMNS = columns_of(schemas.IncomeSource)
+INCOME_SOURCE_FIELDS = entity_columns(models.IncomeSource, INCOME_SOURCE_COLUMNS)
+
+# Income writes invalidate the caller's cache entries, so this only bounds
+# how long a bursty dashboard reuses one result.
+CURRENT_MONTH_CACHE_TTL = 30
+
 
 @router.post('/', response_model=schemas.IncomeSource, status_code=status.HTTP_201_CREATED)
 def create_income_source(
@@ -30,20 +42,24 @@ def create_income_source(
     db.add(new_income_source)
     db.commit()
     db.refresh(new_income_source)
+    response_cache.invalidate(current_user.id)
     return new_income_source
 
 
-@router.get('/', response_model=List[schemas.IncomeSource])
+@router.get('/', response_model=None)
 def get_income_sources(
+        response: Response,
         source_type: Optional[str] = Query(None, description="Filter by source type"),
-        start_date: Optional[str] = Query(None, description="Start date (YYYY-MM-DD)"),
-        end_date: Optional[str] = Query(None, description="End date (YYYY-MM-DD)"),
+        start_date: Optional[date] = Query(None, description="Start date (YYYY-MM-DD)"),
+        end_date: Optional[date] = Query(None, description="End date (YYYY-MM-DD), inclusive"),
         frequency: Optional[str] = Query(None, description="Filter by frequency"),
+        limit: Optional[int] = Query(None, ge=1, le=200, description="Page size; omit to get every row"),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
         db: Session = Depends(get_db),
         current_user: models.Person = Depends(get_current_user)
 ):
-    """Get all income sources for current user"""
-    query = db.query(models.IncomeSource).filter(
+    """Get income sources for current user, newest first; pass limit to page"""
+    query = db.query(*INCOME_SOURCE_FIELDS).filter(
         models.IncomeSource.person_id == current_user.id,
         models.IncomeSource.deleted == False
     )
@@ -52,39 +68,45 @@ def get_income_sources(
         query = query.filter(models.IncomeSource.source_type == source_type)
 
     if start_date:
-        start = datetime.strptime(start_date, "%Y-%m-%d").date()
-        query = query.filter(models.IncomeSource.received_date >= start)
+        query = query.filter(models.IncomeSource.received_date >= start_date)
 
     if end_date:
-        end = datetime.strptime(end_date, "%Y-%m-%d").date()
-        query = query.filter(models.IncomeSource.received_date <= end)
+        # Half-open upper bound, same as the other period filters
+        query = query.filter(models.IncomeSource.received_date < end_date + timedelta(days=1))
 
     if frequency:
         query = query.filter(models.IncomeSource.frequency == frequency)
 
-    return query.order_by(models.IncomeSource.received_date.desc()).all()
+    rows = keyset_page(
+        query, models.IncomeSource.received_date, models.IncomeSource.id, cursor, limit, response
+    )
+    return as_dicts(rows, INCOME_SOURCE_COLUMNS)
 
 
-@router.get('/current-month', response_model=List[schemas.IncomeSource])
+@router.get('/current-month', response_model=None)
 def get_current_month_income(
         db: Session = Depends(get_db),
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get income sources for the current month"""
     today = date.today()
-    start_of_month = today.replace(day=1)
+    return response_cache.get_or_compute(
+        current_user.id,
+        ("income-current-month", today),
+        lambda: _current_month_income(today, db, current_user.id),
+        ttl=CURRENT_MONTH_CACHE_TTL,
+    )
 
-    if today.month == 12:
-        end_of_month = today.replace(year=today.year + 1, month=1, day=1)
-    else:
-        end_of_month = today.replace(month=today.month + 1, day=1)
 
-    return db.query(models.IncomeSource).filter(
-        models.IncomeSource.person_id == current_user.id,
+def _current_month_income(today: date, db: Session, person_id: int) -> list:
+    start_of_month, end_of_month = month_range(today.year, today.month)
+
+    return as_dicts(db.query(*INCOME_SOURCE_FIELDS).filter(
+        models.IncomeSource.person_id == person_id,
         models.IncomeSource.deleted == False,
         models.IncomeSource.received_date >= start_of_month,
         models.IncomeSource.received_date < end_of_month
-    ).order_by(models.IncomeSource.received_date.desc()).all()
+    ).order_by(models.IncomeSource.received_date.desc()), INCOME_SOURCE_COLUMNS)
 
 
 @router.get('/by-type/{source_type}', response_model=List[schemas.IncomeSource])
@@ -102,21 +124,12 @@ def get_income_by_type(
         models.IncomeSource.source_type == source_type
     )
 
-    if year and month:
-        start = date(year, month, 1)
-        if month == 12:
-            end = date(year + 1, 1, 1)
-        else:
-            end = date(year, month + 1, 1)
+    if year:
+        start, end = month_range(year, month) if month else year_range(year)
         query = query.filter(
             models.IncomeSource.received_date >= start,
             models.IncomeSource.received_date < end
         )
-    elif year:
-        query = query.filter(
-            models.IncomeSource.received_date >= date(year, 1, 1),
-            models.IncomeSource.received_date < date(year + 1, 1, 1)
-        )
 
     return query.order_by(models.IncomeSource.received_date.desc()).all()
 
@@ -167,43 +180,35 @@ def get_income_summary_by_type(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get income summary grouped by source type"""
-    query = db.query(models.IncomeSource).filter(
+    query = db.query(
+        models.IncomeSource.source_type,
+        func.sum(models.IncomeSource.amount).label("total"),
+        func.count(models.IncomeSource.id).label("count"),
+    ).filter(
         models.IncomeSource.person_id == current_user.id,
         models.IncomeSource.deleted == False
     )
 
-    if year and month:
-        start = date(year, month, 1)
-        if month == 12:
-            end = date(year + 1, 1, 1)
-        else:
-            end = date(year, month + 1, 1)
+    if year:
+        start, end = month_range(year, month) if month else year_range(year)
         query = query.filter(
             models.IncomeSource.received_date >= start,
             models.IncomeSource.received_date < end
         )
-    elif year:
-        query = query.filter(
-            models.IncomeSource.received_date >= date(year, 1, 1),
-            models.IncomeSource.received_date < date(year + 1, 1, 1)
-        )
 
-    income_sources = query.all()
-
-    summary = {}
-    total = 0
-
-    for income in income_sources:
-        source_type = income.source_type or "uncategorized"
-        if source_type not in summary:
-            summary[source_type] = {"total": 0, "count": 0, "average": 0}
-        summary[source_type]["total"] += income.amount
-        summary[source_type]["count"] += 1
-        total += income.amount
-
-    for source_type in summary:
-        summary[source_type]["average"] = summary[source_type]["total"] / summary[source_type]["count"]
-        summary[source_type]["percentage"] = (summary[source_type]["total"] / total * 100) if total > 0 else 0
+    # One row per source type, aggregated in the database
+    rows = query.group_by(models.IncomeSource.source_type).all()
+    total = sum(row.total for row in rows)
+
+    summary = {
+        (row.source_type or "uncategorized"): {
+            "total": row.total,
+            "count": row.count,
+            "average": row.total / row.count,
+            "percentage": (row.total / total * 100) if total > 0 else 0,
+        }
+        for row in rows
+    }
 
     return {
         "summary": summary,
@@ -220,36 +225,27 @@ def get_total_income_for_period(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get total income for a specific period"""
-    query = db.query(models.IncomeSource).filter(
+    query = db.query(
+        func.coalesce(func.sum(models.IncomeSource.amount), 0),
+        func.count(models.IncomeSource.id),
+    ).filter(
         models.IncomeSource.person_id == current_user.id,
         models.IncomeSource.deleted == False
     )
 
-    if month:
-        start = date(year, month, 1)
-        if month == 12:
-            end = date(year + 1, 1, 1)
-        else:
-            end = date(year, month + 1, 1)
-        query = query.filter(
-            models.IncomeSource.received_date >= start,
-            models.IncomeSource.received_date < end
-        )
-        period = f"{year}-{month:02d}"
-    else:
-        query = query.filter(
-            models.IncomeSource.received_date >= date(year, 1, 1),
-            models.IncomeSource.received_date < date(year + 1, 1, 1)
-        )
-        period = str(year)
+    start, end = month_range(year, month) if month else year_range(year)
+    query = query.filter(
+        models.IncomeSource.received_date >= start,
+        models.IncomeSource.received_date < end
+    )
+    period = f"{year}-{month:02d}" if month else str(year)
 
-    income_sources = query.all()
-    total = sum(inc.amount for inc in income_sources)
+    total, count = query.one()
 
     return {
         "period": period,
         "total_income": total,
-        "count": len(income_sources)
+        "count": count
     }
 
 
@@ -275,6 +271,7 @@ def restore_income_source(
     db_income_source.deleted = False
     db.commit()
     db.refresh(db_income_source)
+    response_cache.invalidate(current_user.id)
     return db_income_source
 
 
@@ -307,11 +304,21 @@ def update_income_source(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Update an income source"""
-    db_income_source = db.query(models.IncomeSource).filter(
-        models.IncomeSource.id == income_source_id,
-        models.IncomeSource.person_id == current_user.id,
-        models.IncomeSource.deleted == False
-    ).first()
+    update_data = income_source.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_income_source(income_source_id, db, current_user)
+
+    # Ownership check and write in one UPDATE ... RETURNING
+    db_income_source = db.execute(
+        update(models.IncomeSource)
+        .where(
+            models.IncomeSource.id == income_source_id,
+            models.IncomeSource.person_id == current_user.id,
+            models.IncomeSource.deleted == False
+        )
+        .values(**update_data)
+        .returning(models.IncomeSource)
+    ).scalar_one_or_none()
 
     if not db_income_source:
         raise HTTPException(
@@ -319,13 +326,10 @@ def update_income_source(
             detail="Income source not found"
         )
 
-    update_data = income_source.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_income_source, key, value)
-
+    result = schemas.IncomeSource.model_validate(db_income_source)
     db.commit()
-    db.refresh(db_income_source)
-    return db_income_source
+    response_cache.invalidate(current_user.id)
+    return result
 
 
 @router.delete('/{income_source_id}', status_code=status.HTTP_200_OK)
@@ -335,18 +339,18 @@ def delete_income_source(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Soft-delete an income source"""
-    db_income_source = db.query(models.IncomeSource).filter(
+    deleted = db.query(models.IncomeSource).filter(
         models.IncomeSource.id == income_source_id,
         models.IncomeSource.person_id == current_user.id,
         models.IncomeSource.deleted == False
-    ).first()
+    ).update({models.IncomeSource.deleted: True}, synchronize_session=False)
 
-    if not db_income_source:
+    if not deleted:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Income source not found"
         )
 
-    db_income_source.deleted = True
     db.commit()
+    response_cache.invalidate(current_user.id)
     return {"message": "Income source deleted"}
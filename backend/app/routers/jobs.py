@@ -1,19 +1,45 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
+from sqlalchemy import and_, select, update
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from datetime import datetime, date
+from datetime import date
 
 from app import models, schemas
 from app.database import get_db
 from app.dependencies import get_current_user
 from app.services.job_service import JobService
-from app.services import gennis_sync
+from app.services import gennis_sync, response_cache
+from app.services.list_rows import as_dicts, columns_of, entity_columns
+from app.utils.pagination import keyset_page
 
 router = APIRouter(
     prefix="/jobs",
     tags=["jobs"]
 )
 
+JOB_COLUMNS = columns_of(schemas.Job)
+JOB_FIELDS = entity_columns(models.Job, JOB_COLUMNS)
+
+
+def _job_not_found() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+
+
+def _ensure_self(person_id: int, current_user: models.Person) -> None:
+    if person_id != current_user.id:
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="You can only view jobs for yourself"
+        )
+
+
+def _get_owned_job(db: Session, job_id: int, person_id: int) -> models.Job:
+    """Primary-key lookup (identity-map first) that 404s on other people's or deleted jobs."""
+    job = db.get(models.Job, job_id)
+    if job is None or job.person_id != person_id or job.deleted:
+        raise _job_not_found()
+    return job
+
 
 @router.post('/', response_model=schemas.Job, status_code=status.HTTP_201_CREATED)
 def create_job(
@@ -37,82 +63,82 @@ def create_job(
     # Auto-generate a SalaryMonth record for every month the job covers
     JobService.generate_salary_months(new_job, db)
 
+    response_cache.invalidate(current_user.id)
     return new_job
 
 
-@router.get('/', response_model=List[schemas.Job])
+def _list_jobs(
+        db: Session,
+        person_id: int,
+        response: Response,
+        active_only: bool = False,
+        deleted: bool = False,
+        limit: Optional[int] = None,
+        cursor: Optional[str] = None,
+) -> list:
+    """Shared body of every jobs list route, newest start_date first."""
+    query = db.query(*JOB_FIELDS).filter(
+        models.Job.person_id == person_id,
+        models.Job.deleted == deleted
+    )
+
+    if active_only:
+        query = query.filter(models.Job.active == True)
+
+    rows = keyset_page(query, models.Job.start_date, models.Job.id, cursor, limit, response)
+    return as_dicts(rows, JOB_COLUMNS)
+
+
+@router.get('/', response_model=None)
 def get_jobs(
+        response: Response,
         active_only: bool = Query(False, description="Filter only active jobs"),
+        limit: Optional[int] = Query(None, ge=1, le=200, description="Page size; omit to get every row"),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
         db: Session = Depends(get_db),
         current_user: models.Person = Depends(get_current_user)
 ):
-    """Get all jobs for the current user"""
-    query = db.query(models.Job).filter(
-        models.Job.person_id == current_user.id,
-        models.Job.deleted == False
-    )
+    """Get jobs for the current user"""
+    return _list_jobs(db, current_user.id, response, active_only, limit=limit, cursor=cursor)
 
-    if active_only:
-        query = query.filter(models.Job.active == True)
-
-    return query.order_by(models.Job.start_date.desc()).all()
 
+# Thin aliases kept for existing clients; new code should use GET /jobs.
 
-@router.get('/active', response_model=List[schemas.Job])
+@router.get('/active', response_model=None)
 def get_active_jobs(
+        response: Response,
         db: Session = Depends(get_db),
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get only active jobs for the current user"""
-    return db.query(models.Job).filter(
-        models.Job.person_id == current_user.id,
-        models.Job.active == True,
-        models.Job.deleted == False
-    ).order_by(models.Job.start_date.desc()).all()
+    return _list_jobs(db, current_user.id, response, active_only=True)
 
 
-@router.get('/by-person/{person_id}', response_model=List[schemas.Job])
+@router.get('/by-person/{person_id}', response_model=None)
 def get_jobs_by_person(
         person_id: int,
+        response: Response,
         active_only: bool = Query(False, description="Filter only active jobs"),
         db: Session = Depends(get_db),
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get all jobs for a specific person"""
-    if person_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only view jobs for yourself"
-        )
-
-    query = db.query(models.Job).filter(
-        models.Job.person_id == person_id,
-        models.Job.deleted == False
-    )
-
-    if active_only:
-        query = query.filter(models.Job.active == True)
-
-    return query.order_by(models.Job.start_date.desc()).all()
+    _ensure_self(person_id, current_user)
+    return _list_jobs(db, person_id, response, active_only)
 
 
-@router.get('/deleted/by-person/{person_id}', response_model=List[schemas.Job])
+@router.get('/deleted/by-person/{person_id}', response_model=None)
 def get_deleted_jobs_by_person(
         person_id: int,
+        response: Response,
+        limit: Optional[int] = Query(None, ge=1, le=200, description="Page size; omit to get every row"),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
         db: Session = Depends(get_db),
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get all soft-deleted jobs for a specific person"""
-    if person_id != current_user.id:
-        raise HTTPException(
-            status_code=status.HTTP_403_FORBIDDEN,
-            detail="You can only view jobs for yourself"
-        )
-
-    return db.query(models.Job).filter(
-        models.Job.person_id == person_id,
-        models.Job.deleted == True
-    ).order_by(models.Job.start_date.desc()).all()
+    _ensure_self(person_id, current_user)
+    return _list_jobs(db, person_id, response, deleted=True, limit=limit, cursor=cursor)
 
 
 @router.get('/{job_id}', response_model=schemas.Job)
@@ -122,18 +148,7 @@ def get_job(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get a specific job by ID"""
-    job = db.query(models.Job).filter(
-        models.Job.id == job_id,
-        models.Job.person_id == current_user.id,
-        models.Job.deleted == False
-    ).first()
-
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found"
-        )
-    return job
+    return _get_owned_job(db, job_id, current_user.id)
 
 
 @router.put('/{job_id}', response_model=schemas.Job)
@@ -144,25 +159,29 @@ def update_job(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Update a job"""
-    db_job = db.query(models.Job).filter(
-        models.Job.id == job_id,
-        models.Job.person_id == current_user.id,
-        models.Job.deleted == False
-    ).first()
-
-    if not db_job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found"
+    update_data = job.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_job(job_id, db, current_user)
+
+    # Ownership check and write in one UPDATE ... RETURNING
+    db_job = db.execute(
+        update(models.Job)
+        .where(
+            models.Job.id == job_id,
+            models.Job.person_id == current_user.id,
+            models.Job.deleted == False
         )
+        .values(**update_data)
+        .returning(models.Job)
+    ).scalar_one_or_none()
 
-    update_data = job.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_job, key, value)
+    if not db_job:
+        raise _job_not_found()
 
+    result = schemas.Job.model_validate(db_job)
     db.commit()
-    db.refresh(db_job)
-    return db_job
+    response_cache.invalidate(current_user.id)
+    return result
 
 
 @router.delete('/{job_id}', status_code=status.HTTP_200_OK)
@@ -172,20 +191,17 @@ def delete_job(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Soft-delete a job"""
-    db_job = db.query(models.Job).filter(
+    deleted = db.query(models.Job).filter(
         models.Job.id == job_id,
         models.Job.person_id == current_user.id,
         models.Job.deleted == False
-    ).first()
+    ).update({models.Job.deleted: True}, synchronize_session=False)
 
-    if not db_job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found"
-        )
+    if not deleted:
+        raise _job_not_found()
 
-    db_job.deleted = True
     db.commit()
+    response_cache.invalidate(current_user.id)
     return {"message": "Job deleted"}
 
 
@@ -201,54 +217,67 @@ def get_job_salary_months(
     than the freshness window (5 min). Stale Gennis lookups never block the
     response — failures fall back to whatever is already cached locally.
     """
-    job = db.query(models.Job).filter(
-        models.Job.id == job_id,
-        models.Job.person_id == current_user.id,
-        models.Job.deleted == False
-    ).first()
-
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found"
+    salary_months_stmt = select(models.SalaryMonth).where(
+        models.SalaryMonth.job_id == job_id,
+        models.SalaryMonth.deleted == False
+    ).order_by(models.SalaryMonth.month.desc())
+
+    # Ownership check and salary months in one query: (job, month) pairs,
+    # with a single (job, None) row when the job has no months yet.
+    rows = db.execute(
+        select(models.Job, models.SalaryMonth)
+        .outerjoin(models.SalaryMonth, and_(
+            models.SalaryMonth.job_id == models.Job.id,
+            models.SalaryMonth.deleted == False
+        ))
+        .where(
+            models.Job.id == job_id,
+            models.Job.person_id == current_user.id,
+            models.Job.deleted == False
         )
+        .order_by(models.SalaryMonth.month.desc())
+    ).all()
 
-    gennis_sync.ensure_fresh(job, db)
+    if not rows:
+        raise _job_not_found()
 
-    return db.query(models.SalaryMonth).filter(
-        models.SalaryMonth.job_id == job_id,
-        models.SalaryMonth.deleted == False
-    ).order_by(models.SalaryMonth.month.desc()).all()
+    if gennis_sync.ensure_fresh(rows[0][0], db) is not None:
+        # A sync just ran, so the joined months are stale
+        return db.execute(salary_months_stmt).scalars().all()
+
+    return [salary_month for _, salary_month in rows if salary_month is not None]
 
 
 @router.post('/{job_id}/deactivate', response_model=schemas.Job)
 def deactivate_job(
         job_id: int,
-        end_date: Optional[str] = Query(None, description="End date in YYYY-MM-DD format"),
+        end_date: Optional[date] = Query(None, description="End date in YYYY-MM-DD format"),
         db: Session = Depends(get_db),
         current_user: models.Person = Depends(get_current_user)
 ):
     """Mark a job as inactive (ended)"""
-    db_job = db.query(models.Job).filter(
-        models.Job.id == job_id,
-        models.Job.person_id == current_user.id,
-        models.Job.deleted == False
-    ).first()
-
-    if not db_job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found"
+    values = {"active": False}
+    if end_date:
+        values["end_date"] = end_date
+
+    db_job = db.execute(
+        update(models.Job)
+        .where(
+            models.Job.id == job_id,
+            models.Job.person_id == current_user.id,
+            models.Job.deleted == False
         )
+        .values(**values)
+        .returning(models.Job)
+    ).scalar_one_or_none()
 
-    db_job.active = False
-
-    if end_date:
-        db_job.end_date = datetime.strptime(end_date, "%Y-%m-%d").date()
+    if not db_job:
+        raise _job_not_found()
 
+    result = schemas.Job.model_validate(db_job)
     db.commit()
-    db.refresh(db_job)
-    return db_job
+    response_cache.invalidate(current_user.id)
+    return result
 
 
 @router.post('/{job_id}/generate-salary-months', response_model=schemas.SalaryMonthGenerateResponse,
@@ -264,20 +293,11 @@ def generate_salary_months(
     that runs automatically when a job is created.
     Already-existing months are skipped without error.
     """
-    job = db.query(models.Job).filter(
-        models.Job.id == job_id,
-        models.Job.person_id == current_user.id,
-        models.Job.deleted == False
-    ).first()
-
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found"
-        )
+    job = _get_owned_job(db, job_id, current_user.id)
 
     created, skipped = JobService.generate_salary_months(job, db)
 
+    response_cache.invalidate(current_user.id)
     return schemas.SalaryMonthGenerateResponse(
         created_count=len(created),
         skipped_count=len(skipped),
@@ -297,13 +317,7 @@ def sync_job_from_gennis(
     Mirrors teachersalary → SalaryMonth and teachersalaries → GennisSalaryPayment.
     Requires `gennis_username` to be set on the job.
     """
-    job = db.query(models.Job).filter(
-        models.Job.id == job_id,
-        models.Job.person_id == current_user.id,
-        models.Job.deleted == False,
-    ).first()
-    if not job:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Job not found")
+    job = _get_owned_job(db, job_id, current_user.id)
 
     if not job.gennis_username:
         raise HTTPException(
@@ -318,6 +332,7 @@ def sync_job_from_gennis(
             detail=f"Sync skipped: {report.skipped_reason}",
         )
 
+    response_cache.invalidate(current_user.id)
     return {
         "job_id": report.job_id,
         "months_inserted": report.months_inserted,
@@ -1,21 +1,46 @@
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import case, select, update
 from sqlalchemy.orm import Session
-from typing import List
+from typing import Optional
 from datetime import datetime
 
 from app import models, schemas
 from app.database import get_db
+from app.services import response_cache
+from app.services.list_rows import as_dicts, columns_of, entity_columns
+from app.utils.pagination import keyset_page
 
 router = APIRouter(
     prefix="/milestones",
     tags=["milestones"]
 )
 
+MILESTONE_COLUMNS = columns_of(schemas.Milestone)
+MILESTONE_FIELDS = entity_columns(models.Milestone, MILESTONE_COLUMNS)
 
-@router.get('/', response_model=List[schemas.Milestone])
-def get_milestones(db: Session = Depends(get_db)):
-    """Get all milestones"""
-    return db.query(models.Milestone).filter(models.Milestone.deleted == False).all()
+
+def _invalidate_goal_owner(goal_id: int, db: Session) -> None:
+    """Milestones feed the goal statistics; drop the owner's cached copies."""
+    person_id = db.scalar(
+        select(models.Goal.person_id)
+        .where(models.Goal.id == goal_id)
+        .execution_options(include_deleted=True)
+    )
+    if person_id is not None:
+        response_cache.invalidate(person_id)
+
+
+@router.get('/', response_model=None)
+def get_milestones(
+        response: Response,
+        limit: Optional[int] = Query(None, ge=1, le=200, description="Page size; omit to get every row"),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
+        db: Session = Depends(get_db)
+):
+    """Get milestones, newest first; pass limit to page"""
+    query = db.query(*MILESTONE_FIELDS).filter(models.Milestone.deleted == False)
+    rows = keyset_page(query, None, models.Milestone.id, cursor, limit, response)
+    return as_dicts(rows, MILESTONE_COLUMNS)
 
 
 @router.get('/{milestone_id}', response_model=schemas.Milestone)
@@ -30,46 +55,51 @@ def get_milestone(milestone_id: int, db: Session = Depends(get_db)):
     return milestone
 
 
-@router.get('/goal/{goal_id}', response_model=List[schemas.Milestone])
-def get_milestones_by_goal(goal_id: int, db: Session = Depends(get_db)):
-    """Get all milestones for a specific goal"""
-    return db.query(models.Milestone).filter(
+@router.get('/goal/{goal_id}', response_model=None)
+def get_milestones_by_goal(
+        goal_id: int,
+        limit: int = Query(100, ge=1, le=500, description="Maximum milestones to return"),
+        db: Session = Depends(get_db)
+):
+    """Get milestones for a specific goal, in display order"""
+    return as_dicts(db.query(*MILESTONE_FIELDS).filter(
         models.Milestone.goal_id == goal_id,
         models.Milestone.deleted == False
-    ).order_by(models.Milestone.order_index).all()
+    ).order_by(models.Milestone.order_index).limit(limit), MILESTONE_COLUMNS)
 
 
-@router.get('/person/{person_id}', response_model=List[schemas.Milestone])
+@router.get('/person/{person_id}', response_model=None)
 def get_milestones_by_person(person_id: int, db: Session = Depends(get_db)):
     """Get all milestones for a specific person (across all their goals)"""
-    return db.query(models.Milestone).join(models.Goal).filter(
+    return as_dicts(db.query(*MILESTONE_FIELDS).join(models.Goal).filter(
         models.Goal.person_id == person_id,
         models.Milestone.deleted == False
-    ).order_by(models.Milestone.order_index).all()
+    ).order_by(models.Milestone.order_index), MILESTONE_COLUMNS)
 
 
-@router.get('/deleted', response_model=List[schemas.Milestone])
+@router.get('/deleted', response_model=None)
 def get_deleted_milestones(db: Session = Depends(get_db)):
     """Get all deleted milestones"""
-    return db.query(models.Milestone).filter(models.Milestone.deleted == True).all()
+    return as_dicts(db.query(*MILESTONE_FIELDS).filter(models.Milestone.deleted == True), MILESTONE_COLUMNS)
 
 
-@router.get('/deleted/goal/{goal_id}', response_model=List[schemas.Milestone])
+@router.get('/deleted/goal/{goal_id}', response_model=None)
 def get_deleted_milestones_by_goal(goal_id: int, db: Session = Depends(get_db)):
     """Get all deleted milestones for a specific goal"""
-    return db.query(models.Milestone).filter(
+    return as_dicts(db.query(*MILESTONE_FIELDS).filter(
         models.Milestone.goal_id == goal_id,
         models.Milestone.deleted == True
-    ).order_by(models.Milestone.order_index).all()
+    ).order_by(models.Milestone.order_index), MILESTONE_COLUMNS)
 
 
-@router.get('/deleted/person/{person_id}', response_model=List[schemas.Milestone])
+@router.get('/deleted/person/{person_id}', response_model=None)
 def get_deleted_milestones_by_person(person_id: int, db: Session = Depends(get_db)):
     """Get all deleted milestones for a specific person"""
-    return db.query(models.Milestone).join(models.Goal).filter(
+    # Include milestones trashed along with their goal
+    return as_dicts(db.query(*MILESTONE_FIELDS).join(models.Goal).filter(
         models.Goal.person_id == person_id,
         models.Milestone.deleted == True
-    ).order_by(models.Milestone.order_index).all()
+    ).order_by(models.Milestone.order_index).execution_options(include_deleted=True), MILESTONE_COLUMNS)
 
 
 @router.post('/', response_model=schemas.Milestone)
@@ -82,62 +112,80 @@ def create_milestone(milestone: schemas.MilestoneCreate, db: Session = Depends(g
             detail=f"Goal with id {milestone.goal_id} not found"
         )
 
-    new_milestone = models.Milestone(**milestone.dict())
+    new_milestone = models.Milestone(**milestone.model_dump())
     db.add(new_milestone)
     db.commit()
     db.refresh(new_milestone)
+    response_cache.invalidate(goal.person_id)
     return new_milestone
 
 
 @router.put('/{milestone_id}', response_model=schemas.Milestone)
 def update_milestone(milestone_id: int, milestone: schemas.MilestoneUpdate, db: Session = Depends(get_db)):
     """Update a milestone"""
-    db_milestone = db.query(models.Milestone).filter(models.Milestone.id == milestone_id).first()
-    if not db_milestone:
-        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Milestone not found")
-
-    update_data = milestone.dict(exclude_unset=True)
+    update_data = milestone.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_milestone(milestone_id, db)
 
     if 'achieved' in update_data:
-        if update_data['achieved'] and not db_milestone.achieved:
-            update_data['achieved_at'] = datetime.utcnow()
-        elif not update_data['achieved']:
+        if update_data['achieved']:
+            # Keep the original timestamp if it was already achieved
+            update_data['achieved_at'] = case(
+                (models.Milestone.achieved == True, models.Milestone.achieved_at),
+                else_=datetime.utcnow()
+            )
+        else:
             update_data['achieved_at'] = None
 
-    for key, value in update_data.items():
-        setattr(db_milestone, key, value)
+    db_milestone = db.execute(
+        update(models.Milestone)
+        .where(models.Milestone.id == milestone_id)
+        .values(**update_data)
+        .returning(models.Milestone)
+    ).scalar_one_or_none()
+    if not db_milestone:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Milestone not found")
 
+    result = schemas.Milestone.model_validate(db_milestone)
     db.commit()
-    db.refresh(db_milestone)
-    return db_milestone
+    _invalidate_goal_owner(result.goal_id, db)
+    return result
 
 
 @router.delete('/{milestone_id}', status_code=status.HTTP_200_OK)
 def delete_milestone(milestone_id: int, db: Session = Depends(get_db)):
     """Delete a milestone"""
-    db_milestone = db.query(models.Milestone).filter(models.Milestone.id == milestone_id).first()
-    if not db_milestone:
+    goal_id = db.execute(
+        update(models.Milestone)
+        .where(models.Milestone.id == milestone_id)
+        .values(deleted=True)
+        .returning(models.Milestone.goal_id)
+    ).scalar_one_or_none()
+    if goal_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Milestone not found")
 
-    db_milestone.deleted = True
     db.commit()
+    _invalidate_goal_owner(goal_id, db)
     return {"message": "Milestone deleted"}
 
 
 @router.post('/{milestone_id}/mark', response_model=schemas.Milestone)
 def mark_milestone(milestone_id: int, db: Session = Depends(get_db)):
     """Toggle milestone achieved status"""
-    db_milestone = db.query(models.Milestone).filter(models.Milestone.id == milestone_id).first()
+    # The toggle runs in SQL against the current row value
+    db_milestone = db.execute(
+        update(models.Milestone)
+        .where(models.Milestone.id == milestone_id)
+        .values(
+            achieved=case((models.Milestone.achieved == True, False), else_=True),
+            achieved_at=case((models.Milestone.achieved == True, None), else_=datetime.utcnow()),
+        )
+        .returning(models.Milestone)
+    ).scalar_one_or_none()
     if not db_milestone:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Milestone not found")
 
-    if db_milestone.achieved:
-        db_milestone.achieved = False
-        db_milestone.achieved_at = None
-    else:
-        db_milestone.achieved = True
-        db_milestone.achieved_at = datetime.utcnow()
-
+    result = schemas.Milestone.model_validate(db_milestone)
     db.commit()
-    db.refresh(db_milestone)
-    return db_milestone
+    _invalidate_goal_owner(result.goal_id, db)
+    return result
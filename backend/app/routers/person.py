@@ -1,4 +1,6 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
@@ -6,6 +8,7 @@ from passlib.context import CryptContext
 
 from app import models, schemas
 from app.database import get_db
+from app.services.list_rows import as_dicts, columns_of, entity_columns
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
@@ -14,36 +17,50 @@ router = APIRouter(
     tags=["person"]
 )
 
+PERSON_COLUMNS = columns_of(schemas.Person)
+PERSON_FIELDS = entity_columns(models.Person, PERSON_COLUMNS)
 
-@router.get('/', response_model=List[schemas.Person])
-def get_persons(db: Session = Depends(get_db)):
-    return db.query(models.Person).all()
+
+@router.get('/', response_model=None)
+def get_persons(
+        limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; omit to get every row"),
+        offset: int = Query(0, ge=0),
+        db: Session = Depends(get_db)
+):
+    """People, newest first"""
+    return as_dicts(
+        db.query(*PERSON_FIELDS).order_by(models.Person.id.desc()).offset(offset).limit(limit),
+        PERSON_COLUMNS
+    )
 
 
 @router.post('/', response_model=schemas.Person, status_code=status.HTTP_201_CREATED)
 def create_person(person: schemas.PersonCreate, db: Session = Depends(get_db)):
-    # Check if email already exists
-    db_person = db.query(models.Person).filter(
-        models.Person.email == person.email
-    ).first()
-
-    if db_person:
-        raise HTTPException(status_code=400, detail="Email already registered")
-
     person_data = person.model_dump()
     password = person_data.pop("password")
     person_data["hashed_password"] = pwd_context.hash(password)
 
-    new_person = models.Person(**person_data)
-    db.add(new_person)
+    # The unique index on email rejects duplicates atomically; no pre-check
+    # SELECT, and no race between two signups with the same address.
+    new_person = db.execute(
+        pg_insert(models.Person)
+        .values(**person_data)
+        .on_conflict_do_nothing(index_elements=[models.Person.email])
+        .returning(models.Person)
+    ).scalar_one_or_none()
+
+    if new_person is None:
+        db.rollback()
+        raise HTTPException(status_code=400, detail="Email already registered")
+
+    result = schemas.Person.model_validate(new_person)
     db.commit()
-    db.refresh(new_person)
-    return new_person
+    return result
 
 
 @router.get('/{person_id}', response_model=schemas.Person)
 def get_person(person_id: int, db: Session = Depends(get_db)):
-    person = db.query(models.Person).filter(models.Person.id == person_id).first()
+    person = db.get(models.Person, person_id)
     if not person:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Person not found")
     return person
@@ -51,20 +68,27 @@ def get_person(person_id: int, db: Session = Depends(get_db)):
 
 @router.put('/{person_id}', response_model=schemas.Person)
 def update_person(person_id: int, person: schemas.PersonUpdate, db: Session = Depends(get_db)):
-    db_person = db.query(models.Person).filter(models.Person.id == person_id).first()
+    update_data = person.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_person(person_id, db)
+
+    db_person = db.execute(
+        update(models.Person)
+        .where(models.Person.id == person_id)
+        .values(**update_data)
+        .returning(models.Person)
+    ).scalar_one_or_none()
     if not db_person:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Person not found")
-    update_data = person.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_person, key, value)
+
+    result = schemas.Person.model_validate(db_person)
     db.commit()
-    db.refresh(db_person)
-    return db_person
+    return result
 
 
 @router.delete('/{person_id}', status_code=status.HTTP_200_OK)
 def delete_person(person_id: int, db: Session = Depends(get_db)):
-    db_person = db.query(models.Person).filter(models.Person.id == person_id).first()
+    db_person = db.get(models.Person, person_id)
     if not db_person:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Person not found")
     db.delete(db_person)
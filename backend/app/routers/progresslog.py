@@ -1,55 +1,76 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 
 from app import models, schemas
 from app.database import get_db
+from app.services.list_rows import as_dicts, columns_of, entity_columns
 
 router = APIRouter(
     prefix="/progresslog",
     tags=["progresslog"]
 )
 
+PROGRESS_LOG_COLUMNS = columns_of(schemas.ProgressLog)
+PROGRESS_LOG_FIELDS = entity_columns(models.ProgressLog, PROGRESS_LOG_COLUMNS)
+
 
 @router.post('/', response_model=schemas.ProgressLog, status_code=status.HTTP_201_CREATED)
 def create_progress_log(progress_log: schemas.ProgressLogCreate, db: Session = Depends(get_db)):
-    new_progress_log = models.ProgressLog(**progress_log.dict())
-    db.add(new_progress_log)
+    new_progress_log = db.execute(
+        insert(models.ProgressLog).values(**progress_log.model_dump(exclude_none=True)).returning(models.ProgressLog)
+    ).scalar_one()
+    result = schemas.ProgressLog.model_validate(new_progress_log)
     db.commit()
-    db.refresh(new_progress_log)
-    return new_progress_log
+    return result
 
 
 @router.get('/{progress_log_id}', response_model=schemas.ProgressLog)
 def get_progress_log(progress_log_id: int, db: Session = Depends(get_db)):
-    progress_log = db.query(models.ProgressLog).filter(models.ProgressLog.id == progress_log_id).first()
+    progress_log = db.get(models.ProgressLog, progress_log_id)
     if not progress_log:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Progress log not found")
     return progress_log
 
 
-@router.get('/', response_model=List[schemas.ProgressLog])
-def get_progress_logs(db: Session = Depends(get_db)):
-    return db.query(models.ProgressLog).all()
+@router.get('/', response_model=None)
+def get_progress_logs(
+        limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; omit to get every row"),
+        offset: int = Query(0, ge=0),
+        db: Session = Depends(get_db)
+):
+    """Progress logs, newest first"""
+    return as_dicts(
+        db.query(*PROGRESS_LOG_FIELDS).order_by(models.ProgressLog.id.desc()).offset(offset).limit(limit),
+        PROGRESS_LOG_COLUMNS
+    )
 
 
 @router.put('/{progress_log_id}', response_model=schemas.ProgressLog)
 def update_progress_log(progress_log_id: int, progress_log: schemas.ProgressLogUpdate, db: Session = Depends(get_db)):
-    db_progress_log = db.query(models.ProgressLog).filter(models.ProgressLog.id == progress_log_id).first()
+    update_data = progress_log.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_progress_log(progress_log_id, db)
+
+    db_progress_log = db.execute(
+        update(models.ProgressLog)
+        .where(models.ProgressLog.id == progress_log_id)
+        .values(**update_data)
+        .returning(models.ProgressLog)
+    ).scalar_one_or_none()
     if not db_progress_log:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Progress log not found")
-    update_data = progress_log.dict(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_progress_log, key, value)
+
+    result = schemas.ProgressLog.model_validate(db_progress_log)
     db.commit()
-    db.refresh(db_progress_log)
-    return db_progress_log
+    return result
 
 
 @router.delete('/{progress_log_id}', status_code=status.HTTP_200_OK)
 def delete_progress_log(progress_log_id: int, db: Session = Depends(get_db)):
-    db_progress_log = db.query(models.ProgressLog).filter(models.ProgressLog.id == progress_log_id).first()
+    db_progress_log = db.get(models.ProgressLog, progress_log_id)
     if not db_progress_log:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Progress log not found")
     db.delete(db_progress_log)
@@ -57,6 +78,9 @@ def delete_progress_log(progress_log_id: int, db: Session = Depends(get_db)):
     return {"message": "Progress log deleted"}
 
 
-@router.get('/goal/{goal_id}', response_model=List[schemas.ProgressLog])
+@router.get('/goal/{goal_id}', response_model=None)
 def get_progress_logs_by_goal(goal_id: int, db: Session = Depends(get_db)):
-    return db.query(models.ProgressLog).filter(models.ProgressLog.goal_id == goal_id).all()
+    return as_dicts(
+        db.query(*PROGRESS_LOG_FIELDS).filter(models.ProgressLog.goal_id == goal_id),
+        PROGRESS_LOG_COLUMNS
+    )
@@ -1,26 +1,38 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
+from sqlalchemy import insert, update
 from sqlalchemy.orm import Session
-from typing import List, Optional
 from datetime import datetime
+from typing import Optional
 
 from app import models, schemas
 from app.database import get_db
+from app.services.list_rows import as_dicts, columns_of, entity_columns
 
 router = APIRouter(
     prefix="/progresslog_task",
     tags=["progresslog_task"]
 )
 
+PROGRESS_TASK_LOG_COLUMNS = columns_of(schemas.ProgressTaskLog)
+PROGRESS_TASK_LOG_FIELDS = entity_columns(models.ProgressLogTask, PROGRESS_TASK_LOG_COLUMNS)
 
-@router.get('/task/{task_id}', response_model=List[schemas.ProgressTaskLog])
-def get_progress_logs_by_task(task_id: int, db: Session = Depends(get_db)):
-    return db.query(models.ProgressLogTask).filter(models.ProgressLogTask.task_id == task_id).all()
+
+@router.get('/task/{task_id}', response_model=None)
+def get_progress_logs_by_task(
+        task_id: int,
+        limit: Optional[int] = Query(None, ge=1, le=1000, description="Page size; omit to get every row"),
+        offset: int = Query(0, ge=0),
+        db: Session = Depends(get_db)
+):
+    """Logs for a task, newest first"""
+    return as_dicts(db.query(*PROGRESS_TASK_LOG_FIELDS).filter(
+        models.ProgressLogTask.task_id == task_id
+    ).order_by(models.ProgressLogTask.id.desc()).offset(offset).limit(limit), PROGRESS_TASK_LOG_COLUMNS)
 
 
 @router.get('/{progress_log_task_id}', response_model=schemas.ProgressTaskLog)
 def get_progress_log_task(progress_log_task_id: int, db: Session = Depends(get_db)):
-    progress_log_task = db.query(models.ProgressLogTask).filter(
-        models.ProgressLogTask.id == progress_log_task_id).first()
+    progress_log_task = db.get(models.ProgressLogTask, progress_log_task_id)
     if not progress_log_task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Progress log task not found")
     return progress_log_task
@@ -28,33 +40,40 @@ def get_progress_log_task(progress_log_task_id: int, db: Session = Depends(get_d
 
 @router.post('/', response_model=schemas.ProgressTaskLog)
 def create_progress_log_task(progress_log_task: schemas.ProgressLogTaskCreate, db: Session = Depends(get_db)):
-    new_progress_log_task = models.ProgressLogTask(**progress_log_task.dict())
-    db.add(new_progress_log_task)
+    new_progress_log_task = db.execute(
+        insert(models.ProgressLogTask)
+        .values(**progress_log_task.model_dump(exclude_none=True))
+        .returning(models.ProgressLogTask)
+    ).scalar_one()
+    result = schemas.ProgressTaskLog.model_validate(new_progress_log_task)
     db.commit()
-    db.refresh(new_progress_log_task)
-    return new_progress_log_task
+    return result
 
 
 @router.put('/{progress_log_task_id}', response_model=schemas.ProgressTaskLog)
 def update_progress_log_task(progress_log_task_id: int, progress_log_task: schemas.ProgressLogTaskUpdate,
                              db: Session = Depends(get_db)):
-    db_progress_log_task = db.query(models.ProgressLogTask).filter(
-        models.ProgressLogTask.id == progress_log_task_id).first()
+    update_data = progress_log_task.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_progress_log_task(progress_log_task_id, db)
+
+    db_progress_log_task = db.execute(
+        update(models.ProgressLogTask)
+        .where(models.ProgressLogTask.id == progress_log_task_id)
+        .values(**update_data)
+        .returning(models.ProgressLogTask)
+    ).scalar_one_or_none()
     if not db_progress_log_task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Progress log task not found")
-    update_data = progress_log_task.dict(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_progress_log_task, key, value)
+
+    result = schemas.ProgressTaskLog.model_validate(db_progress_log_task)
     db.commit()
-    db.refresh(db_progress_log_task)
-    return db_progress_log_task
+    return result
 
 
 @router.delete('/{progress_log_task_id}', status_code=status.HTTP_200_OK)
 def delete_progress_log_task(progress_log_task_id: int, db: Session = Depends(get_db)):
-    db_progress_log_task = db.query(models.ProgressLogTask).filter(
-
-        models.ProgressLogTask.id == progress_log_task_id).first()
+    db_progress_log_task = db.get(models.ProgressLogTask, progress_log_task_id)
     if not db_progress_log_task:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Progress log task not found")
     db.delete(db_progress_log_task)
@@ -1,18 +1,72 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session, joinedload
+from sqlalchemy import func, insert, update
+from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime
 
 from app import models, schemas
 from app.database import get_db
 from app.dependencies import get_current_user
-from app.services import gennis_sync
+from app.services import gennis_sync, response_cache
+from app.services.list_rows import as_dicts, columns_of, entity_columns
 
 router = APIRouter(
     prefix="/salary-months",
     tags=["salary-months"]
 )
 
+# The list is invalidated by every salary-month, job and Gennis-sync write;
+# the TTL only bounds staleness across workers.
+SALARY_MONTHS_CACHE_TTL = 30
+
+SALARY_MONTH_COLUMNS = columns_of(schemas.SalaryMonth)
+SALARY_MONTH_FIELDS = entity_columns(models.SalaryMonth, SALARY_MONTH_COLUMNS)
+SALARY_MONTH_WITH_JOB_COLUMNS = columns_of(schemas.SalaryMonthWithJob)
+SALARY_MONTH_WITH_JOB_FIELDS = SALARY_MONTH_FIELDS + (
+    models.Job.name.label("job_name"),
+    models.Job.company.label("company"),
+)
+
+
+def _salary_months_with_job(db: Session, person_id: int, deleted: bool):
+    """Column-only select of a person's salary months with their job's name and company."""
+    return db.query(*SALARY_MONTH_WITH_JOB_FIELDS).outerjoin(
+        models.Job, models.Job.id == models.SalaryMonth.job_id
+    ).filter(
+        models.SalaryMonth.person_id == person_id,
+        models.SalaryMonth.deleted == deleted
+    )
+
+
+def _get_salary_month_for_job(db: Session, job_id: int, month: str, person_id: int) -> models.SalaryMonth:
+    """Live salary month of one of the person's jobs, ownership checked in the same query."""
+    salary_month = db.query(models.SalaryMonth).join(
+        models.Job, models.Job.id == models.SalaryMonth.job_id
+    ).filter(
+        models.Job.id == job_id,
+        models.Job.person_id == person_id,
+        models.SalaryMonth.month == month,
+        models.SalaryMonth.deleted == False
+    ).first()
+
+    if not salary_month:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"No salary record found for job {job_id} in {month}"
+        )
+    return salary_month
+
+
+def _get_owned_salary_month(db: Session, salary_month_id: int, person_id: int) -> models.SalaryMonth:
+    """Primary-key lookup (identity-map first) that 404s on other people's or deleted months."""
+    salary_month = db.get(models.SalaryMonth, salary_month_id)
+    if salary_month is None or salary_month.person_id != person_id or salary_month.deleted:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Salary month not found"
+        )
+    return salary_month
+
 
 @router.post('/', response_model=schemas.SalaryMonth, status_code=status.HTTP_201_CREATED)
 def create_salary_month(
@@ -22,22 +76,22 @@ def create_salary_month(
 ):
     """Create a new salary month record"""
     # Verify the job belongs to the current user
-    job = db.query(models.Job).filter(
+    owns_job = db.query(db.query(models.Job).filter(
         models.Job.id == salary_month.job_id,
         models.Job.person_id == current_user.id
-    ).first()
+    ).exists()).scalar()
 
-    if not job:
+    if not owns_job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found or doesn't belong to you"
         )
 
     # Check if salary month already exists for this job and month
-    existing = db.query(models.SalaryMonth).filter(
+    existing = db.query(db.query(models.SalaryMonth).filter(
         models.SalaryMonth.job_id == salary_month.job_id,
         models.SalaryMonth.month == salary_month.month
-    ).first()
+    ).exists()).scalar()
 
     if existing:
         raise HTTPException(
@@ -45,17 +99,20 @@ def create_salary_month(
             detail=f"Salary month already exists for {salary_month.month}"
         )
 
-    new_salary_month = models.SalaryMonth(**salary_month.model_dump())
-    new_salary_month.person_id = current_user.id
-    new_salary_month.remaining_amount = new_salary_month.net_amount
-
-    db.add(new_salary_month)
+    new_salary_month = db.execute(
+        insert(models.SalaryMonth).values(
+            **salary_month.model_dump(),
+            person_id=current_user.id,
+            remaining_amount=salary_month.net_amount,
+        ).returning(models.SalaryMonth)
+    ).scalar_one()
+    result = schemas.SalaryMonth.model_validate(new_salary_month)
     db.commit()
-    db.refresh(new_salary_month)
-    return new_salary_month
+    response_cache.invalidate(current_user.id)
+    return result
 
 
-@router.get('/', response_model=List[schemas.SalaryMonthWithJob])
+@router.get('/', response_model=None)
 def get_salary_months(
         year: Optional[int] = Query(None, description="Filter by year"),
         month: Optional[int] = Query(None, ge=1, le=12, description="Filter by month (1-12)"),
@@ -63,13 +120,17 @@ def get_salary_months(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get all salary months for current user's jobs"""
-    query = db.query(models.SalaryMonth).options(
-        joinedload(models.SalaryMonth.job)
-    ).filter(
-        models.SalaryMonth.person_id == current_user.id,
-        models.SalaryMonth.deleted == False
+    return response_cache.get_or_compute(
+        current_user.id,
+        ("salary-months", year, month),
+        lambda: _list_salary_months(db, current_user.id, year, month),
+        ttl=SALARY_MONTHS_CACHE_TTL,
     )
 
+
+def _list_salary_months(db: Session, person_id: int, year: Optional[int], month: Optional[int]) -> list:
+    query = _salary_months_with_job(db, person_id, deleted=False)
+
     # Apply filters
     if year and month:
         period = f"{year}-{month:02d}"
@@ -77,17 +138,7 @@ def get_salary_months(
     elif year:
         query = query.filter(models.SalaryMonth.month.like(f"{year}-%"))
 
-    salary_months = query.order_by(models.SalaryMonth.month.desc()).all()
-
-    result = []
-    for sm in salary_months:
-        data = schemas.SalaryMonthWithJob.model_validate(sm)
-        data = data.model_copy(update={
-            'job_name': sm.job.name if sm.job else None,
-            'company': sm.job.company if sm.job else None,
-        })
-        result.append(data)
-    return result
+    return as_dicts(query.order_by(models.SalaryMonth.month.desc()), SALARY_MONTH_WITH_JOB_COLUMNS)
 
 
 @router.get('/current', response_model=schemas.SalaryMonth)
@@ -114,31 +165,19 @@ def get_current_month_salary(
     return salary
 
 
-@router.get('/deleted', response_model=List[schemas.SalaryMonthWithJob])
+@router.get('/deleted', response_model=None)
 def get_deleted_salary_months(
         db: Session = Depends(get_db),
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get all deleted salary months for current user"""
-    salary_months = db.query(models.SalaryMonth).options(
-        joinedload(models.SalaryMonth.job)
-    ).filter(
-        models.SalaryMonth.person_id == current_user.id,
-        models.SalaryMonth.deleted == True
-    ).order_by(models.SalaryMonth.month.desc()).all()
-
-    result = []
-    for sm in salary_months:
-        data = schemas.SalaryMonthWithJob.model_validate(sm)
-        data = data.model_copy(update={
-            'job_name': sm.job.name if sm.job else None,
-            'company': sm.job.company if sm.job else None,
-        })
-        result.append(data)
-    return result
+    return as_dicts(
+        _salary_months_with_job(db, current_user.id, deleted=True).order_by(models.SalaryMonth.month.desc()),
+        SALARY_MONTH_WITH_JOB_COLUMNS
+    )
 
 
-@router.get('/by-person/{person_id}', response_model=List[schemas.SalaryMonthWithJob])
+@router.get('/by-person/{person_id}', response_model=None)
 def get_salary_months_by_person(
         person_id: int,
         db: Session = Depends(get_db),
@@ -151,25 +190,13 @@ def get_salary_months_by_person(
             detail="You can only view your own salary months"
         )
 
-    salary_months = db.query(models.SalaryMonth).options(
-        joinedload(models.SalaryMonth.job)
-    ).filter(
-        models.SalaryMonth.person_id == person_id,
-        models.SalaryMonth.deleted == False
-    ).order_by(models.SalaryMonth.month.desc()).all()
-
-    result = []
-    for sm in salary_months:
-        data = schemas.SalaryMonthWithJob.model_validate(sm)
-        data = data.model_copy(update={
-            'job_name': sm.job.name if sm.job else None,
-            'company': sm.job.company if sm.job else None,
-        })
-        result.append(data)
-    return result
+    return as_dicts(
+        _salary_months_with_job(db, person_id, deleted=False).order_by(models.SalaryMonth.month.desc()),
+        SALARY_MONTH_WITH_JOB_COLUMNS
+    )
 
 
-@router.get('/by-person/{person_id}/deleted', response_model=List[schemas.SalaryMonthWithJob])
+@router.get('/by-person/{person_id}/deleted', response_model=None)
 def get_deleted_salary_months_by_person(
         person_id: int,
         db: Session = Depends(get_db),
@@ -182,47 +209,35 @@ def get_deleted_salary_months_by_person(
             detail="You can only view your own salary months"
         )
 
-    salary_months = db.query(models.SalaryMonth).options(
-        joinedload(models.SalaryMonth.job)
-    ).filter(
-        models.SalaryMonth.person_id == person_id,
-        models.SalaryMonth.deleted == True
-    ).order_by(models.SalaryMonth.month.desc()).all()
-
-    result = []
-    for sm in salary_months:
-        data = schemas.SalaryMonthWithJob.model_validate(sm)
-        data = data.model_copy(update={
-            'job_name': sm.job.name if sm.job else None,
-            'company': sm.job.company if sm.job else None,
-        })
-        result.append(data)
-    return result
+    return as_dicts(
+        _salary_months_with_job(db, person_id, deleted=True).order_by(models.SalaryMonth.month.desc()),
+        SALARY_MONTH_WITH_JOB_COLUMNS
+    )
 
 
-@router.get('/by-job/{job_id}', response_model=List[schemas.SalaryMonth])
+@router.get('/by-job/{job_id}', response_model=None)
 def get_salary_months_by_job(
         job_id: int,
         db: Session = Depends(get_db),
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get all salary months for a specific job"""
-    job = db.query(models.Job).filter(
+    owns_job = db.query(db.query(models.Job).filter(
         models.Job.id == job_id,
         models.Job.person_id == current_user.id,
         models.Job.deleted == False
-    ).first()
+    ).exists()).scalar()
 
-    if not job:
+    if not owns_job:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Job not found or doesn't belong to you"
         )
 
-    return db.query(models.SalaryMonth).filter(
+    return as_dicts(db.query(*SALARY_MONTH_FIELDS).filter(
         models.SalaryMonth.job_id == job_id,
         models.SalaryMonth.deleted == False
-    ).order_by(models.SalaryMonth.month.desc()).all()
+    ).order_by(models.SalaryMonth.month.desc()), SALARY_MONTH_COLUMNS)
 
 
 @router.get('/by-job/{job_id}/{month}', response_model=schemas.SalaryMonth)
@@ -233,28 +248,7 @@ def get_salary_month_by_job_and_month(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get salary month by job ID and month (format: YYYY-MM)"""
-    job = db.query(models.Job).filter(
-        models.Job.id == job_id,
-        models.Job.person_id == current_user.id
-    ).first()
-
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found or doesn't belong to you"
-        )
-
-    salary_month = db.query(models.SalaryMonth).filter(
-        models.SalaryMonth.job_id == job_id,
-        models.SalaryMonth.month == month,
-        models.SalaryMonth.deleted == False
-    ).first()
-
-    if not salary_month:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No salary record found for job {job_id} in {month}"
-        )
+    salary_month = _get_salary_month_for_job(db, job_id, month, current_user.id)
 
     return salary_month
 
@@ -268,28 +262,7 @@ def update_salary_month_by_job_and_month(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Update salary month by job ID and month (format: YYYY-MM)"""
-    job = db.query(models.Job).filter(
-        models.Job.id == job_id,
-        models.Job.person_id == current_user.id
-    ).first()
-
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found or doesn't belong to you"
-        )
-
-    db_salary_month = db.query(models.SalaryMonth).filter(
-        models.SalaryMonth.job_id == job_id,
-        models.SalaryMonth.month == month,
-        models.SalaryMonth.deleted == False
-    ).first()
-
-    if not db_salary_month:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No salary record found for job {job_id} in {month}"
-        )
+    db_salary_month = _get_salary_month_for_job(db, job_id, month, current_user.id)
 
     update_data = salary_month.model_dump(exclude_unset=True)
     for key, value in update_data.items():
@@ -301,6 +274,7 @@ def update_salary_month_by_job_and_month(
 
     db.commit()
     db.refresh(db_salary_month)
+    response_cache.invalidate(current_user.id)
     return db_salary_month
 
 
@@ -312,31 +286,11 @@ def delete_salary_month_by_job_and_month(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Delete salary month by job ID and month (format: YYYY-MM)"""
-    job = db.query(models.Job).filter(
-        models.Job.id == job_id,
-        models.Job.person_id == current_user.id
-    ).first()
-
-    if not job:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Job not found or doesn't belong to you"
-        )
-
-    db_salary_month = db.query(models.SalaryMonth).filter(
-        models.SalaryMonth.job_id == job_id,
-        models.SalaryMonth.month == month,
-        models.SalaryMonth.deleted == False
-    ).first()
-
-    if not db_salary_month:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail=f"No salary record found for job {job_id} in {month}"
-        )
+    db_salary_month = _get_salary_month_for_job(db, job_id, month, current_user.id)
 
     db_salary_month.deleted = True
     db.commit()
+    response_cache.invalidate(current_user.id)
     return {"message": "Salary month deleted"}
 
 
@@ -351,22 +305,25 @@ def get_salary_month(
     If the parent job is Gennis-synced, refresh the mirror first when stale
     so the page never shows yesterday's numbers.
     """
-    salary_month = db.query(models.SalaryMonth).filter(
+    # Salary month and its job in one round-trip; the join also enforces
+    # that the job exists.
+    row = db.query(models.SalaryMonth, models.Job).join(
+        models.Job, models.Job.id == models.SalaryMonth.job_id
+    ).filter(
         models.SalaryMonth.id == salary_month_id,
         models.SalaryMonth.person_id == current_user.id,
         models.SalaryMonth.deleted == False
     ).first()
 
-    if not salary_month:
+    if not row:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Salary month not found"
         )
 
-    job = db.query(models.Job).filter(models.Job.id == salary_month.job_id).first()
-    if job is not None:
-        gennis_sync.ensure_fresh(job, db)
-        # Re-read after potential mirror update.
+    salary_month, job = row
+    if gennis_sync.ensure_fresh(job, db) is not None:
+        # Re-read after the mirror update.
         db.refresh(salary_month)
 
     return salary_month
@@ -380,29 +337,36 @@ def update_salary_month(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Update a salary month"""
-    db_salary_month = db.query(models.SalaryMonth).filter(
-        models.SalaryMonth.id == salary_month_id,
-        models.SalaryMonth.person_id == current_user.id,
-        models.SalaryMonth.deleted == False
-    ).first()
+    update_data = salary_month.model_dump(exclude_unset=True)
+    if not update_data:
+        return get_salary_month(salary_month_id, db, current_user)
+
+    # Recalculate remaining_amount if net_amount changed
+    if 'net_amount' in update_data:
+        update_data['remaining_amount'] = (
+            update_data['net_amount'] - func.coalesce(models.SalaryMonth.total_spent, 0.0)
+        )
 
+    db_salary_month = db.execute(
+        update(models.SalaryMonth)
+        .where(
+            models.SalaryMonth.id == salary_month_id,
+            models.SalaryMonth.person_id == current_user.id,
+            models.SalaryMonth.deleted == False
+        )
+        .values(**update_data)
+        .returning(models.SalaryMonth)
+    ).scalar_one_or_none()
     if not db_salary_month:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Salary month not found"
         )
 
-    update_data = salary_month.model_dump(exclude_unset=True)
-    for key, value in update_data.items():
-        setattr(db_salary_month, key, value)
-
-    # Recalculate remaining_amount if net_amount changed
-    if 'net_amount' in update_data:
-        db_salary_month.remaining_amount = db_salary_month.net_amount - db_salary_month.total_spent
-
+    result = schemas.SalaryMonth.model_validate(db_salary_month)
     db.commit()
-    db.refresh(db_salary_month)
-    return db_salary_month
+    response_cache.invalidate(current_user.id)
+    return result
 
 
 @router.delete('/{salary_month_id}', status_code=status.HTTP_200_OK)
@@ -412,20 +376,11 @@ def delete_salary_month(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Delete a salary month"""
-    db_salary_month = db.query(models.SalaryMonth).filter(
-        models.SalaryMonth.id == salary_month_id,
-        models.SalaryMonth.person_id == current_user.id,
-        models.SalaryMonth.deleted == False
-    ).first()
-
-    if not db_salary_month:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Salary month not found"
-        )
+    db_salary_month = _get_owned_salary_month(db, salary_month_id, current_user.id)
 
     db_salary_month.deleted = True
     db.commit()
+    response_cache.invalidate(current_user.id)
     return {"message": "Salary month deleted"}
 
 
@@ -436,13 +391,13 @@ def get_salary_month_expenses(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get all expenses linked to a salary month"""
-    salary_month = db.query(models.SalaryMonth).filter(
+    owns_salary_month = db.query(db.query(models.SalaryMonth).filter(
         models.SalaryMonth.id == salary_month_id,
         models.SalaryMonth.person_id == current_user.id,
         models.SalaryMonth.deleted == False
-    ).first()
+    ).exists()).scalar()
 
-    if not salary_month:
+    if not owns_salary_month:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Salary month not found"
@@ -468,13 +423,13 @@ def get_salary_month_gennis_payments(
     Read-only. Most recent first by payment_date; payments with no resolved
     date (rare) fall to the end.
     """
-    salary_month = db.query(models.SalaryMonth).filter(
+    owns_salary_month = db.query(db.query(models.SalaryMonth).filter(
         models.SalaryMonth.id == salary_month_id,
         models.SalaryMonth.person_id == current_user.id,
         models.SalaryMonth.deleted == False
-    ).first()
+    ).exists()).scalar()
 
-    if not salary_month:
+    if not owns_salary_month:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Salary month not found"
@@ -496,42 +451,36 @@ def recalculate_salary_month(
 ):
     """Recalculate total_spent and remaining_amount for a salary month.
 
+    Expense writes keep these totals current through the expenses trigger,
+    so this is a reconciliation tool (e.g. after manual data fixes) rather
+    than part of any write path.
+
     For Gennis-mirrored months this triggers a Gennis re-sync instead of the
     local expense-sum derivation, because total_spent there reflects
     company-paid (Gennis taken_money), not personal expense allocations.
     """
-    salary_month = db.query(models.SalaryMonth).filter(
-        models.SalaryMonth.id == salary_month_id,
-        models.SalaryMonth.person_id == current_user.id,
-        models.SalaryMonth.deleted == False
-    ).first()
-
-    if not salary_month:
-        raise HTTPException(
-            status_code=status.HTTP_404_NOT_FOUND,
-            detail="Salary month not found"
-        )
+    salary_month = _get_owned_salary_month(db, salary_month_id, current_user.id)
 
     if salary_month.gennis_salary_location_id is not None:
-        job = db.query(models.Job).filter(models.Job.id == salary_month.job_id).first()
+        job = db.get(models.Job, salary_month.job_id)
         if job is not None:
             # Bypass the 5-min freshness guard since this is an explicit
             # recalculate request.
             gennis_sync.sync_job(job, db)
             db.refresh(salary_month)
+        response_cache.invalidate(current_user.id)
         return salary_month
 
     # Calculate total spent from expenses (non-Gennis months)
-    expenses = db.query(models.Expense).filter(
+    total_spent = db.query(func.coalesce(func.sum(models.Expense.amount), 0.0)).filter(
         models.Expense.salary_month_id == salary_month_id,
         models.Expense.deleted == False
-    ).all()
-
-    total_spent = sum(expense.amount for expense in expenses)
+    ).scalar()
 
     salary_month.total_spent = total_spent
     salary_month.remaining_amount = salary_month.net_amount - total_spent
 
     db.commit()
     db.refresh(salary_month)
+    response_cache.invalidate(current_user.id)
     return salary_month
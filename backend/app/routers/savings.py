@@ -1,4 +1,5 @@
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
+from sqlalchemy import delete, func, or_, select, update
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime, date
@@ -7,12 +8,20 @@ from calendar import monthrange
 from app import models, schemas
 from app.database import get_db
 from app.dependencies import get_current_user
+from app.services import response_cache
+from app.services.list_rows import as_dicts, columns_of, entity_columns
+from app.utils.pagination import keyset_page
 
 router = APIRouter(
     prefix="/savings",
     tags=["savings"]
 )
 
+TOTAL_BALANCE_CACHE_TTL = 30
+
+SAVING_TRANSACTION_COLUMNS = columns_of(schemas.SavingTransaction)
+SAVING_TRANSACTION_FIELDS = entity_columns(models.SavingTransaction, SAVING_TRANSACTION_COLUMNS)
+
 
 def _sync_balance(saving: models.Saving, db: Session) -> float:
     """
@@ -58,6 +67,33 @@ def _sync_balance(saving: models.Saving, db: Session) -> float:
     return running_balance
 
 
+def _savings_needing_sync(person_id: int, db: Session) -> List[models.Saving]:
+    """
+    Live savings whose current_balance would be changed by _sync_balance:
+    those with orphaned savings-funded expenses, or whose stored balance has
+    drifted from their last transaction's balance_after.
+    """
+    last_balance = select(models.SavingTransaction.balance_after).where(
+        models.SavingTransaction.saving_id == models.Saving.id
+    ).order_by(models.SavingTransaction.id.desc()).limit(1).scalar_subquery()
+
+    has_orphans = db.query(models.Expense).filter(
+        models.Expense.saving_id == models.Saving.id,
+        models.Expense.saving_transaction_id == None,
+        models.Expense.source == "savings",
+        models.Expense.deleted == False
+    ).exists()
+
+    return db.query(models.Saving).filter(
+        models.Saving.person_id == person_id,
+        models.Saving.deleted == False,
+        or_(
+            has_orphans,
+            func.coalesce(last_balance, models.Saving.initial_amount) != models.Saving.current_balance
+        )
+    ).all()
+
+
 def _recompute_balance_chain(saving: models.Saving, db: Session) -> float:
     """
     Recompute balance_before / balance_after for every transaction in
@@ -87,6 +123,113 @@ def _recompute_balance_chain(saving: models.Saving, db: Session) -> float:
     return min_balance
 
 
+def _recompute_balance_chain_or_400(saving: models.Saving, db: Session, detail: str) -> None:
+    """
+    _recompute_balance_chain for write paths: a dip below zero anywhere in the
+    replayed chain rolls the request back as a 400 instead of letting
+    ck_savings_current_balance_nonnegative fail the commit.
+    """
+    if _recompute_balance_chain(saving, db) < 0:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=detail
+        )
+
+
+def _sync_balance_or_400(saving: models.Saving, db: Session) -> float:
+    """_sync_balance, refusing (400) a backfill that would overdraw the account."""
+    balance = _sync_balance(saving, db)
+    if balance < 0:
+        db.rollback()
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Savings-funded expenses exceed the balance of account {saving.id}"
+        )
+    return balance
+
+
+def _owned_saving_id(saving_id: int, person_id: int, db: Session) -> Optional[int]:
+    """
+    Authorization-only lookup: the id of the person's live account, or None.
+    Fetches a single integer instead of hydrating the Saving row, for routes
+    that never read or mutate the account itself.
+    """
+    return db.query(models.Saving.id).filter(
+        models.Saving.id == saving_id,
+        models.Saving.person_id == person_id,
+        models.Saving.deleted == False
+    ).scalar()
+
+
+def _append_transaction(
+        saving_id: int,
+        person_id: int,
+        transaction_type: str,
+        amount: float,
+        transaction_date: date,
+        description: Optional[str],
+        db: Session,
+) -> Optional[models.SavingTransaction]:
+    """
+    Fast path for a transaction dated on or after every existing one (the
+    usual "today" deposit/withdrawal): nothing later needs its balances
+    rewritten, so the account balance moves with one atomic
+    UPDATE ... RETURNING and the new row is stamped from the result.
+
+    Returns None — having changed nothing — when the transaction is
+    backdated, the account isn't the person's, its balance has drifted from
+    the transaction chain, or the new balance would be negative; callers then
+    take the full path, which recomputes the chain and raises the precise
+    404/400. All of those are conditions of the one UPDATE, so the fast
+    path costs that statement and the INSERT.
+    """
+    delta = amount if transaction_type in ("deposit", "interest") else -amount
+    # Only trust current_balance when it still matches the chain's tail —
+    # the same running total _recompute_balance_chain would start from.
+    chain_tail = select(models.SavingTransaction.balance_after).where(
+        models.SavingTransaction.saving_id == saving_id
+    ).order_by(
+        models.SavingTransaction.transaction_date.desc(),
+        models.SavingTransaction.id.desc()
+    ).limit(1).scalar_subquery()
+    conditions = [
+        models.Saving.id == saving_id,
+        models.Saving.person_id == person_id,
+        models.Saving.deleted == False,
+        models.Saving.current_balance == func.coalesce(chain_tail, 0.0),
+        ~select(models.SavingTransaction.id).where(
+            models.SavingTransaction.saving_id == saving_id,
+            models.SavingTransaction.transaction_date > transaction_date
+        ).exists(),
+        # Also keeps already-negative accounts (predating the CHECK) off the
+        # fast path, where the constraint would fail the UPDATE itself
+        models.Saving.current_balance + delta >= 0
+    ]
+
+    balance_after = db.execute(
+        update(models.Saving)
+        .where(*conditions)
+        .values(current_balance=models.Saving.current_balance + delta)
+        .returning(models.Saving.current_balance)
+    ).scalar_one_or_none()
+    if balance_after is None:
+        return None
+
+    transaction = models.SavingTransaction(
+        saving_id=saving_id,
+        transaction_type=transaction_type,
+        amount=amount,
+        transaction_date=transaction_date,
+        balance_before=balance_after - delta,
+        balance_after=balance_after,
+        description=description
+    )
+    db.add(transaction)
+    db.flush()
+    return transaction
+
+
 @router.post('/', response_model=schemas.Saving, status_code=status.HTTP_201_CREATED)
 def create_saving(
         saving: schemas.SavingCreate,
@@ -116,6 +259,7 @@ def create_saving(
 
     db.commit()
     db.refresh(new_saving)
+    response_cache.invalidate(current_user.id)
     return new_saving
 
 
@@ -147,29 +291,38 @@ def get_total_balance(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Get total balance across all active savings accounts"""
-    savings = db.query(models.Saving).filter(
-        models.Saving.person_id == current_user.id,
-        models.Saving.deleted == False
-    ).all()
-
-    total = 0.0
-    by_type = {}
-    any_synced = False
+    return response_cache.get_or_compute(
+        current_user.id,
+        "savings-total-balance",
+        lambda: _build_total_balance(current_user.id, db),
+        ttl=TOTAL_BALANCE_CACHE_TTL,
+    )
 
-    for saving in savings:
-        balance = _sync_balance(saving, db)
-        if saving in db.dirty:
-            any_synced = True
-        total += balance
-        by_type[saving.account_type] = by_type.get(saving.account_type, 0) + balance
 
-    if any_synced or db.new or db.dirty:
+def _build_total_balance(person_id: int, db: Session) -> dict:
+    # Self-heal only the accounts that need it (usually none), then let the
+    # database do the totals.
+    stale = _savings_needing_sync(person_id, db)
+    for saving in stale:
+        _sync_balance_or_400(saving, db)
+    if stale:
         db.commit()
 
+    rows = db.query(
+        models.Saving.account_type,
+        func.coalesce(func.sum(models.Saving.current_balance), 0.0),
+        func.count(models.Saving.id)
+    ).filter(
+        models.Saving.person_id == person_id,
+        models.Saving.deleted == False
+    ).group_by(models.Saving.account_type).all()
+
+    by_type = {account_type: float(balance) for account_type, balance, _ in rows}
+
     return {
-        "total_balance": total,
+        "total_balance": sum(by_type.values()),
         "by_type": by_type,
-        "account_count": len(savings)
+        "account_count": sum(count for _, _, count in rows)
     }
 
 
@@ -305,6 +458,7 @@ def restore_saving(
     db_saving.deleted = False
     db.commit()
     db.refresh(db_saving)
+    response_cache.invalidate(current_user.id)
     return db_saving
 
 
@@ -327,7 +481,7 @@ def get_saving(
             detail="Saving account not found"
         )
 
-    _sync_balance(saving, db)
+    _sync_balance_or_400(saving, db)
     db.commit()
     db.refresh(saving)
 
@@ -372,6 +526,7 @@ def update_saving(
 
     db.commit()
     db.refresh(db_saving)
+    response_cache.invalidate(current_user.id)
     return db_saving
 
 
@@ -382,20 +537,25 @@ def delete_saving(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Soft-delete a savings account"""
-    db_saving = db.query(models.Saving).filter(
-        models.Saving.id == saving_id,
-        models.Saving.person_id == current_user.id,
-        models.Saving.deleted == False
-    ).first()
+    deleted_id = db.execute(
+        update(models.Saving)
+        .where(
+            models.Saving.id == saving_id,
+            models.Saving.person_id == current_user.id,
+            models.Saving.deleted == False
+        )
+        .values(deleted=True)
+        .returning(models.Saving.id)
+    ).scalar_one_or_none()
 
-    if not db_saving:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Saving account not found"
         )
 
-    db_saving.deleted = True
     db.commit()
+    response_cache.invalidate(current_user.id)
     return {"message": "Saving deleted"}
 
 
@@ -473,30 +633,29 @@ def get_saving_monthly_summary(
     )
 
 
-@router.get('/{saving_id}/transactions', response_model=List[schemas.SavingTransaction])
+@router.get('/{saving_id}/transactions', response_model=None)
 def get_saving_transactions(
         saving_id: int,
+        response: Response,
         limit: int = Query(100, ge=1, le=1000),
-        offset: int = Query(0, ge=0),
+        cursor: Optional[str] = Query(None, description="X-Next-Cursor from the previous page"),
         db: Session = Depends(get_db),
         current_user: models.Person = Depends(get_current_user)
 ):
-    """Get transaction history for a savings account"""
-    saving = db.query(models.Saving).filter(
-        models.Saving.id == saving_id,
-        models.Saving.person_id == current_user.id,
-        models.Saving.deleted == False
-    ).first()
-
-    if not saving:
+    """Get transaction history for a savings account, newest first, one page at a time"""
+    if _owned_saving_id(saving_id, current_user.id, db) is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Saving account not found"
         )
 
-    return db.query(models.SavingTransaction).filter(
+    query = db.query(*SAVING_TRANSACTION_FIELDS).filter(
         models.SavingTransaction.saving_id == saving_id
-    ).order_by(models.SavingTransaction.transaction_date.desc()).offset(offset).limit(limit).all()
+    )
+    rows = keyset_page(
+        query, models.SavingTransaction.transaction_date, models.SavingTransaction.id, cursor, limit, response
+    )
+    return as_dicts(rows, SAVING_TRANSACTION_COLUMNS)
 
 
 @router.post('/{saving_id}/transactions', response_model=schemas.SavingTransaction, status_code=status.HTTP_201_CREATED)
@@ -507,6 +666,17 @@ def create_saving_transaction(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Create a new transaction for a savings account"""
+    if transaction.transaction_type in ("deposit", "withdrawal", "interest"):
+        appended = _append_transaction(
+            saving_id, current_user.id, transaction.transaction_type, transaction.amount,
+            transaction.transaction_date, transaction.description, db
+        )
+        if appended is not None:
+            result = schemas.SavingTransaction.model_validate(appended)
+            db.commit()
+            response_cache.invalidate(current_user.id)
+            return result
+
     saving = db.query(models.Saving).filter(
         models.Saving.id == saving_id,
         models.Saving.person_id == current_user.id,
@@ -551,12 +721,15 @@ def create_saving_transaction(
     db.add(new_transaction)
     db.flush()
 
-    _recompute_balance_chain(saving, db)
+    _recompute_balance_chain_or_400(
+        saving, db, "Transaction would result in negative balance in the transaction chain"
+    )
 
     db.commit()
     db.refresh(new_transaction)
     db.refresh(saving)
 
+    response_cache.invalidate(current_user.id)
     return new_transaction
 
 
@@ -568,6 +741,17 @@ def deposit_to_saving(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Make a deposit to a savings account"""
+    trans_date = body.transaction_date or date.today()
+
+    appended = _append_transaction(
+        saving_id, current_user.id, "deposit", body.amount, trans_date, body.description, db
+    )
+    if appended is not None:
+        result = schemas.SavingTransaction.model_validate(appended)
+        db.commit()
+        response_cache.invalidate(current_user.id)
+        return result
+
     saving = db.query(models.Saving).filter(
         models.Saving.id == saving_id,
         models.Saving.person_id == current_user.id,
@@ -580,8 +764,6 @@ def deposit_to_saving(
             detail="Saving account not found"
         )
 
-    trans_date = body.transaction_date or date.today()
-
     transaction = models.SavingTransaction(
         saving_id=saving_id,
         transaction_type="deposit",
@@ -594,11 +776,14 @@ def deposit_to_saving(
 
     db.add(transaction)
     db.flush()
-    _recompute_balance_chain(saving, db)
+    _recompute_balance_chain_or_400(
+        saving, db, "Transaction would result in negative balance in the transaction chain"
+    )
 
     db.commit()
     db.refresh(transaction)
 
+    response_cache.invalidate(current_user.id)
     return transaction
 
 
@@ -610,6 +795,17 @@ def withdraw_from_saving(
         current_user: models.Person = Depends(get_current_user)
 ):
     """Make a withdrawal from a savings account"""
+    trans_date = body.transaction_date or date.today()
+
+    appended = _append_transaction(
+        saving_id, current_user.id, "withdrawal", body.amount, trans_date, body.description, db
+    )
+    if appended is not None:
+        result = schemas.SavingTransaction.model_validate(appended)
+        db.commit()
+        response_cache.invalidate(current_user.id)
+        return result
+
     saving = db.query(models.Saving).filter(
         models.Saving.id == saving_id,
         models.Saving.person_id == current_user.id,
@@ -622,8 +818,6 @@ def withdraw_from_saving(
             detail="Saving account not found"
         )
 
-    trans_date = body.transaction_date or date.today()
-
     # Check balance at the point of the withdrawal date
     prev_tx = db.query(models.SavingTransaction).filter(
         models.SavingTransaction.saving_id == saving_id,
@@ -652,11 +846,14 @@ def withdraw_from_saving(
 
     db.add(transaction)
     db.flush()
-    _recompute_balance_chain(saving, db)
+    _recompute_balance_chain_or_400(
+        saving, db, "Transaction would result in negative balance in the transaction chain"
+    )
 
     db.commit()
     db.refresh(transaction)
 
+    response_cache.invalidate(current_user.id)
     return transaction
 
 
@@ -764,6 +961,11 @@ def apply_interest(
 
     balance_before = saving.current_balance
     balance_after = balance_before + monthly_interest
+    if balance_after < 0:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Cannot apply interest to a negative balance"
+        )
 
     transaction = models.SavingTransaction(
         saving_id=saving_id,
@@ -780,6 +982,7 @@ def apply_interest(
     db.commit()
     db.refresh(transaction)
 
+    response_cache.invalidate(current_user.id)
     return transaction
 
 
@@ -803,41 +1006,26 @@ def delete_saving_transaction(
             detail="Saving account not found"
         )
 
-    transaction = db.query(models.SavingTransaction).filter(
-        models.SavingTransaction.id == transaction_id,
-        models.SavingTransaction.saving_id == saving_id
-    ).first()
+    deleted_id = db.execute(
+        delete(models.SavingTransaction)
+        .where(
+            models.SavingTransaction.id == transaction_id,
+            models.SavingTransaction.saving_id == saving_id
+        )
+        .returning(models.SavingTransaction.id)
+    ).scalar_one_or_none()
 
-    if not transaction:
+    if deleted_id is None:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Transaction not found"
         )
 
-    # Simulate the chain without this transaction to check for negative balances
-    remaining = db.query(models.SavingTransaction).filter(
-        models.SavingTransaction.saving_id == saving_id,
-        models.SavingTransaction.id != transaction_id
-    ).order_by(
-        models.SavingTransaction.transaction_date,
-        models.SavingTransaction.id
-    ).all()
-
-    running = 0.0
-    for tx in remaining:
-        if tx.transaction_type in ("deposit", "interest"):
-            running += tx.amount
-        else:
-            running -= tx.amount
-        if running < 0:
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="Cannot delete: would result in negative balance in the transaction chain"
-            )
-
-    db.delete(transaction)
-    db.flush()
-    _recompute_balance_chain(saving, db)
+    # Replay the chain without it; a dip below zero anywhere undoes the delete
+    _recompute_balance_chain_or_400(
+        saving, db, "Cannot delete: would result in negative balance in the transaction chain"
+    )
     db.commit()
 
+    response_cache.invalidate(current_user.id)
     return {"message": "Transaction deleted"}
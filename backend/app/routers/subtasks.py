@@ -1,41 +1,69 @@
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from typing import List, Optional
 from datetime import datetime
 
-from sqlalchemy import func
+from sqlalchemy import func, select, update
 
 from app import models, schemas
 from app.database import get_db
+from app.services import response_cache
+from app.services.list_rows import as_dicts, columns_of, entity_columns
 
 router = APIRouter(
     prefix="/subtasks",
     tags=["subtasks"]
 )
 
+SUBTASK_COLUMNS = columns_of(schemas.SubTask)
+SUBTASK_FIELDS = entity_columns(models.SubTasks, SUBTASK_COLUMNS)
+
+
+def _invalidate_task_owner(task_id: int, db: Session) -> None:
+    """Subtasks feed the goal statistics; drop the goal owner's cached copies."""
+    person_id = db.scalar(
+        select(models.Goal.person_id)
+        .join(models.Task, models.Task.goal_id == models.Goal.id)
+        .where(models.Task.id == task_id)
+        .execution_options(include_deleted=True)
+    )
+    if person_id is not None:
+        response_cache.invalidate(person_id)
+
 
 def _reorder_subtasks(task_id: int, db: Session):
-    """Recalculate order for all active subtasks of a task"""
-    subtasks = (
-        db.query(models.SubTasks)
-        .filter(models.SubTasks.task_id == task_id, models.SubTasks.deleted == False)
-        .order_by(models.SubTasks.order)
-        .all()
+    """Recalculate order for all active subtasks of a task.
+
+    One UPDATE ... FROM over a ROW_NUMBER() subquery renumbers the whole
+    task in the database instead of loading and rewriting each row."""
+    ranked = (
+        select(
+            models.SubTasks.id,
+            func.row_number().over(order_by=(models.SubTasks.order, models.SubTasks.id)).label("rn")
+        )
+        .where(models.SubTasks.task_id == task_id, models.SubTasks.deleted == False)
+        .subquery()
+    )
+    db.execute(
+        update(models.SubTasks)
+        .where(models.SubTasks.id == ranked.c.id)
+        .values(order=ranked.c.rn - 1)
+        .execution_options(synchronize_session=False)
     )
-    for i, subtask in enumerate(subtasks):
-        subtask.order = i
     db.commit()
 
 
-@router.get('/', response_model=List[schemas.SubTask])
+@router.get('/', response_model=None)
 def get_subtasks(db: Session = Depends(get_db)):
-    return db.query(models.SubTasks).filter(models.SubTasks.deleted == False).all()
+    return as_dicts(db.query(*SUBTASK_FIELDS).filter(models.SubTasks.deleted == False), SUBTASK_COLUMNS)
 
 
-@router.get('/deleted/task/{task_id}', response_model=List[schemas.SubTask])
+@router.get('/deleted/task/{task_id}', response_model=None)
 def get_deleted_subtasks(task_id: int, db: Session = Depends(get_db)):
     """Get all soft-deleted subtasks for a specific task"""
-    return db.query(models.SubTasks).filter(models.SubTasks.task_id == task_id, models.SubTasks.deleted == True).all()
+    return as_dicts(db.query(*SUBTASK_FIELDS).filter(
+        models.SubTasks.task_id == task_id,
+        models.SubTasks.deleted == True
+    ), SUBTASK_COLUMNS)
 
 
 @router.get('/{subtask_id}', response_model=schemas.SubTask)
@@ -52,11 +80,12 @@ def create_subtask(subtask: schemas.SubTaskCreate, db: Session = Depends(get_db)
         models.SubTasks.task_id == subtask.task_id,
         models.SubTasks.deleted == False
     ).scalar()
-    new_subtask = models.SubTasks(**subtask.dict())
+    new_subtask = models.SubTasks(**subtask.model_dump())
     new_subtask.order = (max_order + 1) if max_order is not None else 0
     db.add(new_subtask)
     db.commit()
     db.refresh(new_subtask)
+    _invalidate_task_owner(new_subtask.task_id, db)
     return new_subtask
 
 
@@ -65,38 +94,47 @@ def update_subtask(subtask_id: int, subtask: schemas.SubTaskUpdate, db: Session
     db_subtask = db.query(models.SubTasks).filter(models.SubTasks.id == subtask_id).first()
     if not db_subtask:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subtask not found")
-    update_data = subtask.dict(exclude_unset=True)
+    update_data = subtask.model_dump(exclude_unset=True)
     for key, value in update_data.items():
         setattr(db_subtask, key, value)
     db.commit()
     db.refresh(db_subtask)
+    _invalidate_task_owner(db_subtask.task_id, db)
     return db_subtask
 
 
 @router.delete('/{subtask_id}', status_code=status.HTTP_200_OK)
 def delete_subtask(subtask_id: int, db: Session = Depends(get_db)):
-    db_subtask = db.query(models.SubTasks).filter(models.SubTasks.id == subtask_id).first()
-    if not db_subtask:
+    task_id = db.execute(
+        update(models.SubTasks)
+        .where(models.SubTasks.id == subtask_id)
+        .values(deleted=True)
+        .returning(models.SubTasks.task_id)
+    ).scalar_one_or_none()
+    if task_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Subtask not found")
-    task_id = db_subtask.task_id
-    db_subtask.deleted = True
-    db.commit()
     _reorder_subtasks(task_id, db)
+    _invalidate_task_owner(task_id, db)
     return {"message": "Subtask deleted"}
 
 
-@router.get('/person/{person_id}', response_model=List[schemas.SubTask])
+@router.get('/person/{person_id}', response_model=None)
 def get_subtasks_by_person(person_id: int, db: Session = Depends(get_db)):
     """Get all subtasks for a specific person (across all their goals and tasks)"""
-    return db.query(models.SubTasks).join(models.Task).join(models.Goal).filter(
+    # Task and Goal are joined for filtering only; both are many-to-one, so
+    # each subtask comes back once, as a plain column row.
+    return as_dicts(db.query(*SUBTASK_FIELDS).join(models.Task).join(models.Goal).filter(
         models.Goal.person_id == person_id,
         models.SubTasks.deleted == False
-    ).all()
+    ), SUBTASK_COLUMNS)
 
 
-@router.get('/task/{task_id}', response_model=List[schemas.SubTask])
+@router.get('/task/{task_id}', response_model=None)
 def get_subtasks_by_task(task_id: int, db: Session = Depends(get_db)):
-    return db.query(models.SubTasks).filter(models.SubTasks.task_id == task_id, models.SubTasks.deleted == False).all()
+    return as_dicts(db.query(*SUBTASK_FIELDS).filter(
+        models.SubTasks.task_id == task_id,
+        models.SubTasks.deleted == False
+    ), SUBTASK_COLUMNS)
 
 
 @router.post('/{subtask_id}/mark_subtask', response_model=schemas.SubTask)
@@ -113,4 +151,5 @@ def mark_subtask(subtask_id: int, db: Session = Depends(get_db)):
         db_subtask.completed_at = datetime.utcnow()
     db.commit()
     db.refresh(db_subtask)
+    _invalidate_task_owner(db_subtask.task_id, db)
     return db_subtask
@@ -2,9 +2,11 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime, date, timedelta
-from sqlalchemy import or_, func
+from sqlalchemy import case, or_, func, select, update
 from app import models, schemas
 from app.database import get_db
+from app.services import response_cache
+from app.services.list_rows import as_dicts, columns_of, entity_columns
 from app.services.progress_service import ProgressService
 from app.dependencies import get_current_active_user
 
@@ -14,15 +16,30 @@ router = APIRouter(
     tags=["tasks"]
 )
 
+STATS_CACHE_TTL = 30
 
-@router.get('/', response_model=List[schemas.Task])
+TASK_COLUMNS = columns_of(schemas.Task)
+TASK_FIELDS = entity_columns(models.Task, TASK_COLUMNS)
+
+
+def _recalculate_goals(db: Session, *goal_ids: int) -> None:
+    """Recompute the stored percentage of each goal before the response goes out.
+
+    Clients refetch the goal as soon as a task write returns, so this stays in
+    the request: the percentage they read, and any stats cached after the
+    caller's invalidate, already reflect the write."""
+    for goal_id in goal_ids:
+        ProgressService.update_goal_percentage(goal_id, db, method='hybrid')
+
+
+@router.get('/', response_model=None)
 def get_tasks(db: Session = Depends(get_db), current_user=Depends(get_current_active_user)):
     """Get all tasks for current user (via their goals)"""
-    return (
-        db.query(models.Task)
+    return as_dicts(
+        db.query(*TASK_FIELDS)
         .join(models.Goal)
-        .filter(models.Goal.person_id == current_user.id, models.Task.deleted == False)
-        .all()
+        .filter(models.Goal.person_id == current_user.id, models.Task.deleted == False),
+        TASK_COLUMNS
     )
 
 
@@ -110,13 +127,22 @@ def get_task_completion_dates(task_id: int, db: Session = Depends(get_db), curre
     return sorted(log_dates | block_dates)
 
 
-@router.get('/deleted/goal/{goal_id}', response_model=List[schemas.Task])
+@router.get('/deleted/goal/{goal_id}', response_model=None)
 def get_deleted_tasks(goal_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_active_user)):
     """Get all soft-deleted tasks for a specific goal"""
-    goal = db.query(models.Goal).filter(models.Goal.id == goal_id, models.Goal.person_id == current_user.id).first()
+    # Deleting a goal moves its tasks to the trash, so the goal itself may be deleted too
+    goal = (
+        db.query(models.Goal)
+        .filter(models.Goal.id == goal_id, models.Goal.person_id == current_user.id)
+        .execution_options(include_deleted=True)
+        .first()
+    )
     if not goal:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found")
-    return db.query(models.Task).filter(models.Task.goal_id == goal_id, models.Task.deleted == True).all()
+    return as_dicts(
+        db.query(*TASK_FIELDS).filter(models.Task.goal_id == goal_id, models.Task.deleted == True),
+        TASK_COLUMNS
+    )
 
 
 @router.get('/{task_id}', response_model=schemas.Task)
@@ -163,15 +189,16 @@ def create_task(task: schemas.TaskCreate, db: Session = Depends(get_db), current
                 )
 
     # Create the task
-    new_task = models.Task(**task.dict())
+    new_task = models.Task(**task.model_dump())
     db.add(new_task)
     db.commit()
     db.refresh(new_task)
 
     # Recalculate goal progress only when linked to a goal
     if task.goal_id is not None:
-        ProgressService.update_goal_percentage(task.goal_id, db, method='hybrid')
+        _recalculate_goals(db, task.goal_id)
 
+    response_cache.invalidate(current_user.id)
     return new_task
 
 
@@ -195,7 +222,7 @@ def update_task(task_id: int, task: schemas.TaskUpdate, db: Session = Depends(ge
 
     old_goal_id = db_task.goal_id
     completion_changed = False
-    update_data = task.dict(exclude_unset=True)
+    update_data = task.model_dump(exclude_unset=True)
 
     # Handle goal change
     new_goal_id = update_data.get('goal_id', old_goal_id)
@@ -244,12 +271,13 @@ def update_task(task_id: int, task: schemas.TaskUpdate, db: Session = Depends(ge
     # Recalculate progress for old and new goals when changed
     if completion_changed or ('goal_id' in update_data and new_goal_id != old_goal_id):
         if old_goal_id:
-            ProgressService.update_goal_percentage(old_goal_id, db, method='hybrid')
+            _recalculate_goals(db, old_goal_id)
         if db_task.goal_id and db_task.goal_id != old_goal_id:
-            ProgressService.update_goal_percentage(db_task.goal_id, db, method='hybrid')
+            _recalculate_goals(db, db_task.goal_id)
     elif completion_changed and db_task.goal_id:
-        ProgressService.update_goal_percentage(db_task.goal_id, db, method='hybrid')
+        _recalculate_goals(db, db_task.goal_id)
 
+    response_cache.invalidate(current_user.id)
     return db_task
 
 
@@ -259,44 +287,45 @@ def delete_task(task_id: int, db: Session = Depends(get_db), current_user=Depend
     Soft-delete a task and recalculate goal progress.
     Removing a task affects the total count and percentage.
     """
-    db_task = (
-        db.query(models.Task)
-        .join(models.Goal)
-        .filter(models.Task.id == task_id, models.Goal.person_id == current_user.id)
-        .first()
-    )
-    if not db_task:
+    goal_id = db.execute(
+        update(models.Task)
+        .where(
+            models.Task.id == task_id,
+            models.Task.goal_id.in_(select(models.Goal.id).where(models.Goal.person_id == current_user.id))
+        )
+        .values(deleted=True)
+        .returning(models.Task.goal_id)
+    ).scalar_one_or_none()
+    if goal_id is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Task not found")
 
-    goal_id = db_task.goal_id
-
-    db_task.deleted = True
     db.commit()
 
     # Recalculate goal progress (removing a task changes the total)
-    ProgressService.update_goal_percentage(goal_id, db, method='hybrid')
+    _recalculate_goals(db, goal_id)
 
+    response_cache.invalidate(current_user.id)
     return {"message": "Task deleted"}
 
 
-@router.get('/person/{person_id}', response_model=List[schemas.Task])
+@router.get('/person/{person_id}', response_model=None)
 def get_tasks_by_person(person_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_active_user)):
     """Get all tasks for a specific person (across all their goals)"""
     if person_id != current_user.id:
         raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Access denied")
-    return db.query(models.Task).join(models.Goal).filter(
+    return as_dicts(db.query(*TASK_FIELDS).join(models.Goal).filter(
         models.Goal.person_id == person_id,
         not_deleted
-    ).all()
+    ), TASK_COLUMNS)
 
 
-@router.get('/goal/{goal_id}', response_model=List[schemas.Task])
+@router.get('/goal/{goal_id}', response_model=None)
 def get_tasks_by_goal(goal_id: int, db: Session = Depends(get_db), current_user=Depends(get_current_active_user)):
     """Get all tasks for a specific goal"""
     goal = db.query(models.Goal).filter(models.Goal.id == goal_id, models.Goal.person_id == current_user.id).first()
     if not goal:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found")
-    return db.query(models.Task).filter(models.Task.goal_id == goal_id, not_deleted).all()
+    return as_dicts(db.query(*TASK_FIELDS).filter(models.Task.goal_id == goal_id, not_deleted), TASK_COLUMNS)
 
 
 @router.post('/{task_id}/mark_task', response_model=schemas.Task)
@@ -346,7 +375,8 @@ def mark_task(task_id: int, db: Session = Depends(get_db), current_user=Depends(
 
         db.commit()
         db.refresh(db_task)
-        ProgressService.update_goal_percentage(db_task.goal_id, db, method='hybrid')
+        _recalculate_goals(db, db_task.goal_id)
+        response_cache.invalidate(current_user.id)
         return db_task
 
     # ── Non-recurring: original toggle behaviour ──────────────────────────────
@@ -370,7 +400,8 @@ def mark_task(task_id: int, db: Session = Depends(get_db), current_user=Depends(
         db.commit()
         db.refresh(db_task)
 
-    ProgressService.update_goal_percentage(db_task.goal_id, db, method='hybrid')
+    _recalculate_goals(db, db_task.goal_id)
+    response_cache.invalidate(current_user.id)
     return db_task
 
 
@@ -433,35 +464,43 @@ def get_goal_task_statistics(goal_id: int, db: Session = Depends(get_db), curren
     if not goal:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Goal not found")
 
+    return response_cache.get_or_compute(
+        current_user.id,
+        ("goal-task-statistics", goal_id),
+        lambda: _build_goal_task_statistics(goal_id, db),
+        ttl=STATS_CACHE_TTL,
+    )
+
+
+def _build_goal_task_statistics(goal_id: int, db: Session) -> dict:
     # Get detailed progress information
     progress_details = ProgressService.get_goal_progress_details(goal_id, db)
 
-    # Get additional task breakdowns
-    tasks = db.query(models.Task).filter(models.Task.goal_id == goal_id).all()
+    # Task breakdowns, aggregated in the database
+    completed_count = func.sum(case((models.Task.completed == True, 1), else_=0))
+    priority = func.lower(models.Task.priority)
 
     by_priority = {
         'high': {'total': 0, 'completed': 0},
         'medium': {'total': 0, 'completed': 0},
         'low': {'total': 0, 'completed': 0}
     }
-
-    by_type = {}
-
-    for task in tasks:
-        # Count by priority
-        priority = task.priority.lower()
-        if priority in by_priority:
-            by_priority[priority]['total'] += 1
-            if task.completed:
-                by_priority[priority]['completed'] += 1
-
-        # Count by type
-        task_type = task.task_type
-        if task_type not in by_type:
-            by_type[task_type] = {'total': 0, 'completed': 0}
-        by_type[task_type]['total'] += 1
-        if task.completed:
-            by_type[task_type]['completed'] += 1
+    for task_priority, total, completed in (
+        db.query(priority, func.count(), completed_count)
+        .filter(models.Task.goal_id == goal_id)
+        .group_by(priority)
+    ):
+        if task_priority in by_priority:
+            by_priority[task_priority] = {'total': total, 'completed': completed or 0}
+
+    by_type = {
+        task_type: {'total': total, 'completed': completed or 0}
+        for task_type, total, completed in (
+            db.query(models.Task.task_type, func.count(), completed_count)
+            .filter(models.Task.goal_id == goal_id)
+            .group_by(models.Task.task_type)
+        )
+    }
 
     return {
         **progress_details,
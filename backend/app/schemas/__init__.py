@@ -12,6 +12,7 @@ from app.schemas.goals import (
     Goal,
     GoalBase,
     GoalCreate,
+    GoalListItem,
     GoalUpdate,
     GoalWithStats,
     Milestone,
@@ -135,7 +136,7 @@ __all__ = [
     # person
     "Person", "PersonBase", "PersonCreate", "PersonUpdate",
     # goals
-    "Goal", "GoalBase", "GoalCreate", "GoalUpdate", "GoalWithStats",
+    "Goal", "GoalBase", "GoalCreate", "GoalListItem", "GoalUpdate", "GoalWithStats",
     "Milestone", "MilestoneBase", "MilestoneCreate", "MilestoneUpdate",
     "Task", "TaskBase", "TaskCreate", "TaskUpdate", "TaskStatistics",
     "RecurringCompletionTask",
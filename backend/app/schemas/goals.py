@@ -1,8 +1,17 @@
 from datetime import date, datetime
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, ConfigDict, Field
 
+# Closed vocabularies for request payloads. Response schemas keep plain `str`
+# so rows written outside the API (e.g. AI-coach generated tasks) still serialize.
+Priority = Literal["high", "medium", "low"]
+GoalStatus = Literal["active", "completed", "paused", "abandoned"]
+TaskType = Literal["daily", "weekly", "monthly", "one-time"]
+# The progress-log form sends great/good/neutral/bad/awful; okay and
+# struggling are the values this API documented before the form existed.
+Mood = Literal["great", "good", "neutral", "bad", "awful", "okay", "struggling"]
+
 
 class GoalBase(BaseModel):
     name: str = Field(..., description="Goal name")
@@ -12,7 +21,7 @@ class GoalBase(BaseModel):
     current_value: float = Field(default=0, description="Current progress value")
     start_date: Optional[date] = Field(None)
     target_date: Optional[date] = Field(None)
-    priority: str = Field(default="medium", description="Priority: high, medium, low")
+    priority: Priority = Field(default="medium", description="Priority: high, medium, low")
     color: Optional[str] = Field(None)
 
 
@@ -42,8 +51,8 @@ class GoalUpdate(BaseModel):
     name: Optional[str] = Field(None)
     description: Optional[str] = None
     target_value: Optional[float] = Field(None)
-    status: Optional[str] = Field(None, description="Status: active, completed, paused")
-    priority: Optional[str] = Field(None)
+    status: Optional[GoalStatus] = Field(None, description="Status: active, completed, paused, abandoned")
+    priority: Optional[Priority] = Field(None)
     category: Optional[str] = Field(None)
     start_date: Optional[date] = Field(None)
     target_date: Optional[date] = Field(None)
@@ -86,6 +95,7 @@ class Goal(GoalBase):
 
     id: int
     person_id: int
+    priority: str = Field(default="medium")
     status: str
     deleted: Optional[bool] = Field(default=False)
     created_at: datetime
@@ -93,6 +103,18 @@ class Goal(GoalBase):
     percentage: float = Field(default=0, description="Stored progress percentage")
 
 
+class GoalListItem(BaseModel):
+    """Slim goal row for list views"""
+    id: int
+    name: str
+    status: str
+    percentage: float = Field(default=0, description="Stored progress percentage")
+    category: Optional[str] = None
+    priority: Optional[str] = None
+
+    model_config = ConfigDict(from_attributes=True)
+
+
 class GoalWithStats(Goal):
     """Goal response with detailed statistics"""
     total_tasks: int = Field(default=0, description="Total number of tasks")
@@ -138,9 +160,9 @@ class MilestoneUpdate(BaseModel):
 class TaskBase(BaseModel):
     name: str = Field(..., description="Task name")
     description: Optional[str] = Field(None, description="Task description")
-    task_type: str = Field(default="daily", description="Task type: daily, weekly, monthly, one-time")
+    task_type: TaskType = Field(default="daily", description="Task type: daily, weekly, monthly, one-time")
     due_date: Optional[date] = Field(None, description="Due date")
-    priority: str = Field(default="medium", description="Priority: high, medium, low")
+    priority: Priority = Field(default="medium", description="Priority: high, medium, low")
     estimated_duration: Optional[int] = Field(None, description="Estimated duration in minutes")
     value: Optional[float] = Field(None, description="Value contributed to goal's current_value when completed")
     is_recurring: Optional[bool] = Field(default=False, description="Task resets daily and tracks completions instead of closing")
@@ -152,6 +174,8 @@ class TaskCreate(TaskBase):
 
 class Task(TaskBase):
     id: int = Field(..., description="Task ID")
+    task_type: str = Field(default="daily", description="Task type")
+    priority: str = Field(default="medium", description="Priority")
     goal_id: Optional[int] = Field(None, description="Goal ID")
     completed: bool = Field(default=False, description="Task completion status")
     completed_at: Optional[datetime] = Field(None, description="Completion timestamp")
@@ -165,9 +189,9 @@ class Task(TaskBase):
 class TaskUpdate(BaseModel):
     name: Optional[str] = Field(None, description="Task name")
     description: Optional[str] = Field(None, description="Task description")
-    task_type: Optional[str] = Field(None, description="Task type: daily, weekly, monthly")
+    task_type: Optional[TaskType] = Field(None, description="Task type: daily, weekly, monthly, one-time")
     due_date: Optional[date] = Field(None, description="Due date")
-    priority: Optional[str] = Field(None, description="Priority: high, medium, low")
+    priority: Optional[Priority] = Field(None, description="Priority: high, medium, low")
     estimated_duration: Optional[int] = Field(None, description="Estimated duration in minutes")
     completed: Optional[bool] = Field(None, description="Completion status")
     value: Optional[float] = Field(None, description="Value contributed to goal's current_value when completed")
@@ -187,7 +211,7 @@ class RecurringCompletionTask(BaseModel):
 class SubTaskBase(BaseModel):
     name: str = Field(..., description="Sub task name")
     description: Optional[str] = Field(None, description="Sub task description")
-    priority: str = Field(default="medium", description="Priority: high, medium, low")
+    priority: Priority = Field(default="medium", description="Priority: high, medium, low")
     estimated_duration: Optional[int] = Field(None, description="Estimated duration in minutes")
     order: int = Field(default=0, description="Display order of the subtask")
 
@@ -198,6 +222,7 @@ class SubTaskCreate(SubTaskBase):
 
 class SubTask(SubTaskBase):
     id: int = Field(..., description="Sub task ID")
+    priority: str = Field(default="medium", description="Priority")
     task_id: int = Field(..., description="Task ID")
     completed: bool = Field(default=False, description="Sub task completion status")
     completed_at: Optional[datetime] = Field(None, description="Completion timestamp")
@@ -210,7 +235,7 @@ class SubTask(SubTaskBase):
 class SubTaskUpdate(BaseModel):
     name: Optional[str] = Field(None, description="Sub task name")
     description: Optional[str] = Field(None, description="Sub task description")
-    priority: Optional[str] = Field(None, description="Priority: high, medium, low")
+    priority: Optional[Priority] = Field(None, description="Priority: high, medium, low")
     estimated_duration: Optional[int] = Field(None, description="Estimated duration in minutes")
     completed: Optional[bool] = Field(None, description="Completion status")
     completed_at: Optional[datetime] = Field(None, description="Completion timestamp")
@@ -221,7 +246,7 @@ class ProgressLogBase(BaseModel):
     id: Optional[int] = None
     value_logged: Optional[float] = Field(None, description="Logged value")
     notes: Optional[str] = Field(None, description="Notes about the progress")
-    mood: Optional[str] = Field(None, description="Mood: great, good, okay, struggling")
+    mood: Optional[Mood] = Field(None, description="Mood: great, good, neutral, bad, awful")
     energy_level: Optional[int] = Field(None, description="Energy level 1-10")
 
 
@@ -232,6 +257,7 @@ class ProgressLogCreate(ProgressLogBase):
 
 class ProgressLog(ProgressLogBase):
     id: int = Field(..., description="Progress log ID")
+    mood: Optional[str] = Field(None, description="Mood")
     goal_id: int = Field(..., description="Goal ID")
     log_date: date = Field(..., description="Log date")
     created_at: datetime = Field(..., description="Creation timestamp")
@@ -250,6 +276,7 @@ class ProgressLogTaskCreate(ProgressLogBase):
 
 class ProgressTaskLog(ProgressLogBase):
     id: int = Field(..., description="Progress log ID")
+    mood: Optional[str] = Field(None, description="Mood")
     task_id: int = Field(..., description="Task ID")
     log_date: date = Field(..., description="Log date")
     created_at: datetime = Field(..., description="Creation timestamp")
@@ -260,7 +287,7 @@ class ProgressTaskLog(ProgressLogBase):
 class ProgressLogTaskUpdate(ProgressLogBase):
     value_logged: Optional[float] = Field(None, description="Logged value")
     notes: Optional[str] = Field(None, description="Notes")
-    mood: Optional[str] = Field(None, description="Mood")
+    mood: Optional[Mood] = Field(None, description="Mood")
     energy_level: Optional[int] = Field(None, description="Energy level")
 
 
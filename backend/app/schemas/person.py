@@ -1,22 +1,28 @@
+import re
 from datetime import datetime
-from typing import Optional
+from typing import Annotated, Optional
 
 from pydantic import BaseModel, ConfigDict, EmailStr, Field
 
+# Cheap shape check for non-signup paths; full EmailStr parsing stays on create.
+EMAIL_RE = re.compile(r"^[^@\s]+@[^@\s]+\.[^@\s]+$")
+Email = Annotated[str, Field(pattern=EMAIL_RE.pattern, max_length=254)]
+
 
 class PersonBase(BaseModel):
     name: str = Field(..., description="Full name", min_length=1, max_length=100)
-    email: EmailStr = Field(..., description="Email address")
+    email: str = Field(..., description="Email address")
     timezone: str = Field(default="Asia/Tashkent", description="Timezone")
 
 
 class PersonCreate(PersonBase):
+    email: EmailStr = Field(..., description="Email address")
     password: str = Field(..., description="Password", min_length=6)
 
 
 class PersonUpdate(BaseModel):
     name: Optional[str] = Field(None)
-    email: Optional[EmailStr] = Field(None)
+    email: Optional[Email] = Field(None)
     timezone: Optional[str] = Field(None)
 
 
@@ -174,7 +174,7 @@ class UserResponse(BaseModel):
     """Schema for user information in responses"""
     id: int
     name: str
-    email: EmailStr
+    email: str
     timezone: str
     is_active: bool
     is_verified: bool
@@ -31,6 +31,7 @@ from typing import Optional
 from sqlalchemy.orm import Session
 
 from app import models
+from app.services import response_cache
 from app.external_models.gennis import (
     GennisTeacher,
     GennisTeacherPayment,
@@ -233,6 +234,7 @@ def sync_job(job: models.Job, db: Session) -> SyncReport:
 
     job.gennis_last_synced_at = datetime.utcnow()
     db.commit()
+    response_cache.invalidate(job.person_id)
     return report
 
 
@@ -4,6 +4,7 @@ Handles automatic salary month generation from job data.
 """
 import logging
 from datetime import date
+from sqlalchemy import insert, select
 from sqlalchemy.orm import Session
 from typing import List, Tuple
 
@@ -41,14 +42,11 @@ class JobService:
         end_boundary = job.end_date if job.end_date else date.today()
         end = date(end_boundary.year, end_boundary.month, 1)
 
-        existing_months = {
-            row.month
-            for row in db.query(models.SalaryMonth.month).filter(
-                models.SalaryMonth.job_id == job.id
-            ).all()
-        }
+        existing_months = set(db.scalars(
+            select(models.SalaryMonth.month).where(models.SalaryMonth.job_id == job.id)
+        ))
 
-        created: List[models.SalaryMonth] = []
+        rows: List[dict] = []
         skipped: List[str] = []
 
         current = start
@@ -58,18 +56,15 @@ class JobService:
             if month_str in existing_months:
                 skipped.append(month_str)
             else:
-                record = models.SalaryMonth(
-                    job_id=job.id,
-                    person_id=job.person_id,
-                    month=month_str,
-                    salary_amount=job.salary,
-                    deductions=0.0,
-                    net_amount=job.salary,
-                    remaining_amount=job.salary,
-                )
-                db.add(record)
-                db.flush()
-                created.append(record)
+                rows.append({
+                    "job_id": job.id,
+                    "person_id": job.person_id,
+                    "month": month_str,
+                    "salary_amount": job.salary,
+                    "deductions": 0.0,
+                    "net_amount": job.salary,
+                    "remaining_amount": job.salary,
+                })
 
             # advance one month without external libs
             if current.month == 12:
@@ -77,9 +72,18 @@ class JobService:
             else:
                 current = date(current.year, current.month + 1, 1)
 
+        if not rows:
+            return [], skipped
+
+        # One multi-row INSERT ... RETURNING instead of an add + flush per month
+        created: List[models.SalaryMonth] = list(db.scalars(
+            insert(models.SalaryMonth).returning(models.SalaryMonth), rows
+        ))
+        created_ids = [record.id for record in created]
         db.commit()
-        for record in created:
-            db.refresh(record)
+
+        # Reload the expired rows in one SELECT rather than a refresh each
+        db.scalars(select(models.SalaryMonth).where(models.SalaryMonth.id.in_(created_ids))).all()
 
         return created, skipped
 
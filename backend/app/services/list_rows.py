@@ -0,0 +1,26 @@
+"""
+Plain-dict rows for read-heavy list endpoints.
+
+Those routes select only the response schema's columns (no ORM instances
+are built) and skip `response_model`, so FastAPI does not re-validate
+every row through Pydantic; the handler returns dicts and the default
+ORJSONResponse renders them.
+"""
+
+from typing import Iterable
+
+from pydantic import BaseModel
+
+
+def columns_of(schema: type[BaseModel]) -> tuple[str, ...]:
+    """Field names of a response schema whose fields all map to model columns."""
+    return tuple(schema.model_fields)
+
+
+def entity_columns(model, columns: tuple[str, ...]) -> tuple:
+    """Column attributes of `model` to pass to db.query(*...) for a column-only select."""
+    return tuple(getattr(model, column) for column in columns)
+
+
+def as_dicts(rows: Iterable, columns: tuple[str, ...]) -> list[dict]:
+    return [{column: getattr(row, column) for column in columns} for row in rows]
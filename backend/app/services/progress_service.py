@@ -3,8 +3,8 @@ Progress Calculation Service
 Handles calculation of goal progress based on task completion
 """
 from sqlalchemy.orm import Session
-from sqlalchemy import func
-from typing import Optional
+from sqlalchemy import func, case, select
+from typing import Dict, Iterable, Optional, Tuple
 from app import models
 
 
@@ -42,6 +42,36 @@ class ProgressService:
         percentage = (completed_tasks / total_tasks) * 100
         return round(percentage, 2)
 
+    @staticmethod
+    def get_task_counts(goal_ids: Iterable[int], db: Session) -> Dict[int, Tuple[int, int]]:
+        """
+        Batch (total, completed) task counts for many goals in one grouped query.
+
+        Args:
+            goal_ids: Goal IDs to count tasks for
+            db: Database session
+
+        Returns:
+            Dict keyed by goal_id; goals without tasks map to (0, 0)
+        """
+        goal_ids = list(goal_ids)
+        counts = {goal_id: (0, 0) for goal_id in goal_ids}
+        if not goal_ids:
+            return counts
+
+        rows = db.execute(
+            select(
+                models.Task.goal_id,
+                func.count(models.Task.id),
+                func.coalesce(func.sum(case((models.Task.completed == True, 1), else_=0)), 0),
+            )
+            .where(models.Task.goal_id.in_(goal_ids))
+            .group_by(models.Task.goal_id)
+        )
+        for goal_id, total, completed in rows:
+            counts[goal_id] = (total, completed)
+        return counts
+
     @staticmethod
     def calculate_weighted_task_percentage(goal_id: int, db: Session) -> float:
         """
@@ -98,32 +128,12 @@ class ProgressService:
         Returns:
             Float representing completion percentage (0-100)
         """
-        # Get all tasks for this goal
-        tasks = db.query(models.Task) \
-            .filter(models.Task.goal_id == goal_id) \
-            .all()
-
-        if not tasks:
-            return 0.0
-
-        total_items = 0
-        completed_items = 0
-
-        for task in tasks:
-            # Check if task has subtasks
-            subtasks = db.query(models.SubTasks) \
-                .filter(models.SubTasks.task_id == task.id) \
-                .all()
-
-            if subtasks:
-                # Task has subtasks - count subtask completion
-                total_items += len(subtasks)
-                completed_items += sum(1 for st in subtasks if st.completed)
-            # else:
-            #     # Task has no subtasks - count task itself
-            #     total_items += 1
-            #     if task.completed:
-            #         completed_items += 1
+        # Only subtasks count (a task without subtasks adds nothing), so one
+        # aggregate over the goal's subtasks replaces a query per task.
+        total_items, completed_items = db.query(
+            func.count(models.SubTasks.id),
+            func.sum(case((models.SubTasks.completed == True, 1), else_=0))
+        ).select_from(models.SubTasks).join(models.Task).filter(models.Task.goal_id == goal_id).one()
 
         if total_items == 0:
             return 0.0
@@ -0,0 +1,136 @@
+"""
+Short-lived cache for per-user read endpoints.
+
+Analytics such as the monthly summary or net worth are read far more often
+than the rows behind them change, so repeat reads within the TTL are served
+from memory. Entries are keyed by the person whose data they hold; write
+routes call `invalidate(person_id)` after committing so the next read
+recomputes.
+
+Values stay in the API process, but invalidation is shared through Redis:
+each person has a generation counter there that `invalidate` increments, and
+an entry is only served while the counter still reads what it read when the
+entry was computed. A write handled by one uvicorn worker therefore evicts
+the entry in every worker, at the cost of one Redis GET per read.
+
+If Redis is unreachable the cache fails open: reads skip the generation
+check (retrying Redis after REDIS_RETRY_SECONDS) and invalidation only
+reaches the local process, so a write served by another worker is visible
+after at most the entry's TTL.
+"""
+
+import logging
+import threading
+import time
+from typing import Any, Callable, Hashable, Optional
+
+import redis
+
+from app.config import settings
+
+logger = logging.getLogger(__name__)
+
+DEFAULT_TTL_SECONDS = 60
+MAX_ENTRIES = 10_000
+
+GENERATION_KEY = "response_cache:generation:{}"
+# Far longer than any entry TTL, so an expired counter can't restart at a
+# value a live entry still carries.
+GENERATION_KEY_TTL_SECONDS = 24 * 60 * 60
+REDIS_TIMEOUT_SECONDS = 0.1
+REDIS_RETRY_SECONDS = 30
+
+_lock = threading.Lock()
+_entries: dict[tuple, tuple[float, Optional[int], Any]] = {}
+
+_redis_client: Optional[redis.Redis] = None
+_redis_down_until = 0.0
+
+
+def get_or_compute(
+    person_id: int,
+    key: Hashable,
+    compute: Callable[[], Any],
+    ttl: float = DEFAULT_TTL_SECONDS,
+) -> Any:
+    """Return the cached value for (person_id, key), computing it on a miss."""
+    cache_key = (person_id, key)
+    generation = _generation(person_id)
+    now = time.monotonic()
+    with _lock:
+        hit = _entries.get(cache_key)
+        if hit is not None and hit[0] > now and (generation is None or hit[1] == generation):
+            return hit[2]
+
+    value = compute()
+
+    with _lock:
+        if len(_entries) >= MAX_ENTRIES:
+            _evict_expired(now)
+            if len(_entries) >= MAX_ENTRIES:
+                _entries.clear()
+        _entries[cache_key] = (now + ttl, generation, value)
+    return value
+
+
+def invalidate(person_id: int) -> None:
+    """Drop every cached entry belonging to a person, in all workers."""
+    with _lock:
+        for cache_key in [k for k in _entries if k[0] == person_id]:
+            del _entries[cache_key]
+    _bump_generation(person_id)
+
+
+def clear() -> None:
+    with _lock:
+        _entries.clear()
+
+
+def _evict_expired(now: float) -> None:
+    for cache_key in [k for k, (expires, _, _) in _entries.items() if expires <= now]:
+        del _entries[cache_key]
+
+
+def _client() -> redis.Redis:
+    global _redis_client
+    if _redis_client is None:
+        _redis_client = redis.Redis.from_url(
+            settings.REDIS_URL,
+            socket_connect_timeout=REDIS_TIMEOUT_SECONDS,
+            socket_timeout=REDIS_TIMEOUT_SECONDS,
+        )
+    return _redis_client
+
+
+def _redis_available() -> bool:
+    return time.monotonic() >= _redis_down_until
+
+
+def _mark_redis_down(error: Exception) -> None:
+    global _redis_down_until
+    _redis_down_until = time.monotonic() + REDIS_RETRY_SECONDS
+    logger.warning("response cache: Redis unavailable, invalidating locally only: %s", error)
+
+
+def _generation(person_id: int) -> Optional[int]:
+    """The person's invalidation generation, or None while Redis is down."""
+    if not _redis_available():
+        return None
+    try:
+        return int(_client().get(GENERATION_KEY.format(person_id)) or 0)
+    except redis.RedisError as error:
+        _mark_redis_down(error)
+        return None
+
+
+def _bump_generation(person_id: int) -> None:
+    if not _redis_available():
+        return
+    key = GENERATION_KEY.format(person_id)
+    try:
+        pipe = _client().pipeline()
+        pipe.incr(key)
+        pipe.expire(key, GENERATION_KEY_TTL_SECONDS)
+        pipe.execute()
+    except redis.RedisError as error:
+        _mark_redis_down(error)
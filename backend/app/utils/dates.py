@@ -0,0 +1,21 @@
+"""
+Half-open [start, end) date ranges for month / year period filters.
+
+Filter as `start <= column < end` so the predicate stays sargable and
+needs no "last day of month" arithmetic.
+"""
+
+from datetime import date
+from functools import lru_cache
+
+
+@lru_cache(maxsize=256)
+def month_range(year: int, month: int) -> tuple[date, date]:
+    start = date(year, month, 1)
+    end = date(year + (month == 12), month % 12 + 1, 1)
+    return start, end
+
+
+@lru_cache(maxsize=64)
+def year_range(year: int) -> tuple[date, date]:
+    return date(year, 1, 1), date(year + 1, 1, 1)
@@ -0,0 +1,65 @@
+"""
+Keyset pagination for newest-first list endpoints.
+
+Pages are ordered by (sort_column DESC, id DESC) and continue with
+`WHERE (sort_column, id) < (:last_value, :last_id)`, which stays an index
+range scan however deep the client pages. The response body remains a
+plain list; the cursor for the next page, if any, goes in X-Next-Cursor.
+
+Paging is opt-in: with limit=None every remaining row is returned in the
+same order and no cursor is issued, so clients that don't read the header
+yet still see the whole list.
+"""
+
+import base64
+from datetime import date, datetime
+from typing import Optional
+
+from fastapi import HTTPException, Response, status
+from sqlalchemy import tuple_
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(sort_value, row_id: int) -> str:
+    raw = f"{sort_value.isoformat() if sort_value is not None else ''}|{row_id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_cursor(cursor: str, sort_column) -> tuple:
+    try:
+        raw_value, raw_id = base64.urlsafe_b64decode(cursor.encode()).decode().split("|")
+        python_type = sort_column.type.python_type if sort_column is not None else None
+        if python_type is date:
+            sort_value = date.fromisoformat(raw_value)
+        elif python_type is datetime:
+            sort_value = datetime.fromisoformat(raw_value)
+        else:
+            sort_value = None
+        return sort_value, int(raw_id)
+    except ValueError:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid cursor")
+
+
+def keyset_page(
+    query, sort_column, id_column, cursor: Optional[str], limit: Optional[int], response: Response
+) -> list:
+    """Return one page of `query`; pass sort_column=None to page by id alone."""
+    if cursor:
+        sort_value, last_id = decode_cursor(cursor, sort_column)
+        if sort_column is None:
+            query = query.filter(id_column < last_id)
+        else:
+            query = query.filter(tuple_(sort_column, id_column) < (sort_value, last_id))
+
+    order = [id_column.desc()] if sort_column is None else [sort_column.desc(), id_column.desc()]
+    if limit is None:
+        return query.order_by(*order).all()
+
+    rows = query.order_by(*order).limit(limit + 1).all()
+    if len(rows) > limit:
+        rows = rows[:limit]
+        last = rows[-1]
+        sort_value = getattr(last, sort_column.key) if sort_column is not None else None
+        response.headers[NEXT_CURSOR_HEADER] = encode_cursor(sort_value, getattr(last, id_column.key))
+    return rows
@@ -0,0 +1,139 @@
+"""Writes that check ownership inside the UPDATE itself.
+
+Income-source, job and milestone writes run one UPDATE ... WHERE id/owner/
+not-deleted ... RETURNING. A row that is missing, soft-deleted or owned by
+someone else must come back as 404 and stay untouched.
+"""
+from datetime import date
+
+import pytest
+
+from app import models
+
+
+@pytest.fixture
+def other_user(db_session):
+    other = models.Person(name="Other", email="other@test.local", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+    return other
+
+
+def _job(db_session, person, **fields):
+    job = models.Job(person_id=person.id, name="Teacher", salary=1000, start_date=date(2026, 1, 1), **fields)
+    db_session.add(job)
+    db_session.commit()
+    return job
+
+
+def _income(db_session, person, **fields):
+    income = models.IncomeSource(
+        person_id=person.id, source_name="Tutoring", source_type="freelance",
+        amount=500, received_date=date(2026, 1, 5), **fields
+    )
+    db_session.add(income)
+    db_session.commit()
+    return income
+
+
+def _reloaded(db_session, row):
+    db_session.expire_all()
+    return db_session.get(type(row), row.id)
+
+
+def test_job_update_returns_the_written_row(auth_client, db_session, test_user):
+    job = _job(db_session, test_user)
+
+    response = auth_client.put(f"/api/jobs/{job.id}", json={"salary": 1500})
+
+    assert response.status_code == 200, response.text
+    assert response.json()["salary"] == 1500
+    assert _reloaded(db_session, job).salary == 1500
+
+
+@pytest.mark.parametrize("method, path, body", [
+    ("put", "/api/jobs/{id}", {"salary": 1500}),
+    ("post", "/api/jobs/{id}/deactivate", None),
+    ("delete", "/api/jobs/{id}", None),
+])
+def test_job_writes_404_on_other_peoples_jobs(auth_client, db_session, other_user, method, path, body):
+    job = _job(db_session, other_user)
+
+    response = auth_client.request(method.upper(), path.format(id=job.id), json=body)
+
+    assert response.status_code == 404
+    job = _reloaded(db_session, job)
+    assert (job.salary, job.active, job.deleted) == (1000, True, False)
+
+
+def test_job_writes_404_on_deleted_jobs(auth_client, db_session, test_user):
+    job = _job(db_session, test_user, deleted=True)
+
+    assert auth_client.put(f"/api/jobs/{job.id}", json={"salary": 1500}).status_code == 404
+    assert auth_client.post(f"/api/jobs/{job.id}/deactivate").status_code == 404
+    assert auth_client.delete(f"/api/jobs/{job.id}").status_code == 404
+    assert _reloaded(db_session, job).salary == 1000
+
+
+def test_income_source_writes_404_on_other_peoples_rows(auth_client, db_session, other_user):
+    income = _income(db_session, other_user)
+
+    assert auth_client.put(f"/api/income-sources/{income.id}", json={"amount": 900}).status_code == 404
+    assert auth_client.delete(f"/api/income-sources/{income.id}").status_code == 404
+    income = _reloaded(db_session, income)
+    assert (income.amount, income.deleted) == (500, False)
+
+
+def test_income_source_update_and_delete_own_row(auth_client, db_session, test_user):
+    income = _income(db_session, test_user)
+
+    response = auth_client.put(f"/api/income-sources/{income.id}", json={"amount": 900})
+    assert response.status_code == 200, response.text
+    assert response.json()["amount"] == 900
+
+    assert auth_client.delete(f"/api/income-sources/{income.id}").status_code == 200
+    assert auth_client.put(f"/api/income-sources/{income.id}", json={"amount": 1}).status_code == 404
+
+
+def test_milestone_writes_404_on_missing_rows(auth_client):
+    assert auth_client.put("/api/milestones/999", json={"name": "Band 7"}).status_code == 404
+    assert auth_client.post("/api/milestones/999/mark").status_code == 404
+    assert auth_client.delete("/api/milestones/999").status_code == 404
+
+
+def test_milestone_update_keeps_the_original_achieved_at(auth_client, db_session, test_user):
+    goal = models.Goal(person_id=test_user.id, name="IELTS 6.5")
+    db_session.add(goal)
+    db_session.commit()
+    milestone_id = auth_client.post("/api/milestones/", json={"goal_id": goal.id, "name": "Band 6"}).json()["id"]
+
+    achieved_at = auth_client.post(f"/api/milestones/{milestone_id}/mark").json()["achieved_at"]
+    assert achieved_at is not None
+
+    again = auth_client.put(f"/api/milestones/{milestone_id}", json={"achieved": True})
+    assert again.json()["achieved_at"] == achieved_at
+
+    cleared = auth_client.post(f"/api/milestones/{milestone_id}/mark").json()
+    assert (cleared["achieved"], cleared["achieved_at"]) == (False, None)
+
+
+def test_progress_log_lists_are_unbounded_unless_paged(auth_client, db_session, test_user):
+    goal = models.Goal(person_id=test_user.id, name="IELTS 6.5")
+    db_session.add(goal)
+    db_session.commit()
+    task = models.Task(goal_id=goal.id, name="Daily listening")
+    db_session.add(task)
+    db_session.commit()
+    logs = [models.ProgressLog(goal_id=goal.id, value_logged=i) for i in range(5)]
+    task_logs = [models.ProgressLogTask(task_id=task.id) for _ in range(120)]
+    db_session.add_all(logs + task_logs)
+    db_session.commit()
+
+    # The task history page reads every log without paging; newest comes first
+    by_task = auth_client.get(f"/api/progresslog_task/task/{task.id}").json()
+    assert [row["id"] for row in by_task] == [log.id for log in reversed(task_logs)]
+
+    page = auth_client.get("/api/progresslog/", params={"limit": 2, "offset": 2})
+    assert page.status_code == 200
+    assert [row["id"] for row in page.json()] == [logs[2].id, logs[1].id]
+    assert auth_client.get("/api/progresslog/", params={"limit": 1001}).status_code == 422
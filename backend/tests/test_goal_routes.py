@@ -0,0 +1,66 @@
+"""Goal collection routes: response shapes and conditional GETs."""
+from app import models, schemas
+
+
+def _make_goal(db_session, person, **fields):
+    goal = models.Goal(person_id=person.id, name="IELTS 6.5", description="Band 6.5 by June", **fields)
+    db_session.add(goal)
+    db_session.commit()
+    return goal
+
+
+def test_goal_list_returns_full_goals_by_default(auth_client, db_session, test_user):
+    goal = _make_goal(db_session, test_user)
+
+    response = auth_client.get("/api/goals/", params={"person_id": test_user.id})
+
+    assert response.status_code == 200
+    [row] = response.json()
+    assert set(row) == set(schemas.Goal.model_fields)
+    assert row["id"] == goal.id
+    assert row["description"] == "Band 6.5 by June"
+
+
+def test_goal_list_slim_is_opt_in(auth_client, db_session, test_user):
+    _make_goal(db_session, test_user)
+
+    response = auth_client.get("/api/goals/", params={"person_id": test_user.id, "slim": True})
+
+    assert response.status_code == 200
+    [row] = response.json()
+    assert set(row) == set(schemas.GoalListItem.model_fields)
+
+
+def test_goal_list_etag_depends_on_shape(auth_client, db_session, test_user):
+    _make_goal(db_session, test_user)
+    full = auth_client.get("/api/goals/", params={"person_id": test_user.id})
+
+    slim = auth_client.get(
+        "/api/goals/",
+        params={"person_id": test_user.id, "slim": True},
+        headers={"If-None-Match": full.headers["ETag"]},
+    )
+    assert slim.status_code == 200
+
+    cached = auth_client.get(
+        "/api/goals/",
+        params={"person_id": test_user.id},
+        headers={"If-None-Match": full.headers["ETag"]},
+    )
+    assert cached.status_code == 304
+
+
+def test_create_goal_returns_the_inserted_row(auth_client, db_session, test_user):
+    response = auth_client.post("/api/goals/", json={
+        "person_id": test_user.id,
+        "name": "Run 10k",
+        "target_value": 10,
+    })
+
+    assert response.status_code == 201, response.text
+    body = response.json()
+    stored = db_session.get(models.Goal, body["id"])
+    assert (body["name"], body["person_id"], body["target_value"]) == ("Run 10k", test_user.id, 10)
+    assert body["status"] == stored.status
+    assert body["created_at"] is not None
+    assert body["percentage"] == 0
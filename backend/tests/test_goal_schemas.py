@@ -0,0 +1,80 @@
+"""Request schemas for goals, tasks and progress logs take closed vocabularies.
+
+The values below are the ones the frontend forms actually send
+(progress-log-form.tsx, task-form.tsx, goal-form.tsx); each must validate,
+anything else must be a 422-style ValidationError. Response schemas stay
+plain `str` so stored rows outside the vocabulary still serialize.
+"""
+from datetime import date, datetime
+
+import pytest
+from pydantic import ValidationError
+
+from app import models, schemas
+
+FORM_MOODS = ["great", "good", "neutral", "bad", "awful"]
+
+
+@pytest.mark.parametrize("mood", FORM_MOODS)
+def test_progress_log_create_accepts_form_moods(mood):
+    log = schemas.ProgressLogCreate(goal_id=1, value_logged=1.0, mood=mood)
+    assert log.mood == mood
+
+
+@pytest.mark.parametrize("mood", FORM_MOODS)
+def test_task_progress_log_accepts_form_moods(mood):
+    assert schemas.ProgressLogTaskCreate(task_id=1, mood=mood).mood == mood
+    assert schemas.ProgressLogTaskUpdate(mood=mood).mood == mood
+
+
+def test_progress_log_rejects_unknown_mood():
+    with pytest.raises(ValidationError):
+        schemas.ProgressLogCreate(goal_id=1, mood="ecstatic")
+
+
+def test_progress_log_route_accepts_neutral_mood(auth_client, db_session, test_user):
+    goal = models.Goal(person_id=test_user.id, name="IELTS 6.5")
+    db_session.add(goal)
+    db_session.commit()
+
+    response = auth_client.post("/api/progresslog/", json={
+        "goal_id": goal.id,
+        "value_logged": 1.0,
+        "mood": "neutral",
+    })
+
+    assert response.status_code == 201, response.text
+    assert response.json()["mood"] == "neutral"
+
+
+@pytest.mark.parametrize("task_type", ["daily", "weekly", "monthly", "one-time"])
+@pytest.mark.parametrize("priority", ["high", "medium", "low"])
+def test_task_create_accepts_form_values(task_type, priority):
+    task = schemas.TaskCreate(name="Read", task_type=task_type, priority=priority)
+    assert (task.task_type, task.priority) == (task_type, priority)
+
+
+@pytest.mark.parametrize("payload", [{"priority": "urgent"}, {"task_type": "yearly"}])
+def test_task_create_rejects_unknown_values(payload):
+    with pytest.raises(ValidationError):
+        schemas.TaskCreate(name="Read", **payload)
+
+
+def test_goal_update_accepts_abandoned_status():
+    assert schemas.GoalUpdate(status="abandoned").status == "abandoned"
+    with pytest.raises(ValidationError):
+        schemas.GoalUpdate(status="archived")
+
+
+def test_responses_serialize_values_outside_the_vocabulary():
+    """Rows written outside the API (AI coach, legacy data) must still load."""
+    task = schemas.Task(
+        id=1, name="Plan", task_type="yearly", priority="High",
+        created_at=datetime(2026, 1, 1),
+    )
+    assert (task.task_type, task.priority) == ("yearly", "High")
+    log = schemas.ProgressTaskLog(
+        id=1, task_id=1, log_date=date(2026, 1, 1),
+        created_at=datetime(2026, 1, 1), mood="meh",
+    )
+    assert log.mood == "meh"
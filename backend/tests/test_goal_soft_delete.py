@@ -0,0 +1,61 @@
+"""Soft-deleted goals: hidden from normal reads, reachable from the trash.
+
+Every top-level ORM SELECT filters out deleted goals (_hide_deleted_goals).
+Trash routes opt out with include_deleted, because deleting a goal moves its
+tasks and milestones to the trash alongside it.
+"""
+from app import models
+
+
+def _goal_with_children(db_session, person):
+    goal = models.Goal(person_id=person.id, name="IELTS 6.5")
+    db_session.add(goal)
+    db_session.commit()
+    task = models.Task(goal_id=goal.id, name="Mock test")
+    milestone = models.Milestone(goal_id=goal.id, name="Band 6")
+    db_session.add_all([task, milestone])
+    db_session.commit()
+    return goal, task, milestone
+
+
+def test_deleted_goal_is_hidden_from_reads(auth_client, db_session, test_user):
+    goal, _, _ = _goal_with_children(db_session, test_user)
+
+    assert auth_client.delete(f"/api/goals/{goal.id}").status_code == 200
+
+    assert auth_client.get(f"/api/goals/{goal.id}").status_code == 404
+    listed = auth_client.get("/api/goals/", params={"person_id": test_user.id}).json()
+    assert goal.id not in [g["id"] for g in listed]
+    assert db_session.query(models.Goal).filter(models.Goal.id == goal.id).first() is None
+    assert db_session.query(models.Goal).filter(
+        models.Goal.id == goal.id
+    ).execution_options(include_deleted=True).first() is not None
+
+
+def test_trash_of_deleted_goal_lists_and_restores(auth_client, db_session, test_user):
+    goal, task, milestone = _goal_with_children(db_session, test_user)
+    assert auth_client.delete(f"/api/goals/{goal.id}").status_code == 200
+
+    trashed_tasks = auth_client.get(f"/api/tasks/deleted/goal/{goal.id}")
+    assert trashed_tasks.status_code == 200, trashed_tasks.text
+    assert [t["id"] for t in trashed_tasks.json()] == [task.id]
+    trashed_milestones = auth_client.get(f"/api/milestones/deleted/person/{test_user.id}")
+    assert [m["id"] for m in trashed_milestones.json()] == [milestone.id]
+
+    restored = auth_client.post(f"/api/goals/{goal.id}/restore")
+    assert restored.status_code == 200, restored.text
+
+    assert auth_client.get(f"/api/tasks/deleted/goal/{goal.id}").json() == []
+    assert [t["id"] for t in auth_client.get(f"/api/tasks/goal/{goal.id}").json()] == [task.id]
+    assert auth_client.get(f"/api/milestones/deleted/person/{test_user.id}").json() == []
+
+
+def test_trash_of_another_persons_goal_is_404(auth_client, db_session):
+    other = models.Person(name="Other", email="other@test.local", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+    goal, _, _ = _goal_with_children(db_session, other)
+    goal.deleted = True
+    db_session.commit()
+
+    assert auth_client.get(f"/api/tasks/deleted/goal/{goal.id}").status_code == 404
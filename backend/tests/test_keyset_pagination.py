@@ -0,0 +1,104 @@
+"""Keyset-paged list endpoints: opt-in pages, stable across sort-key ties.
+
+Without `limit` a list returns every row, as it did before paging existed,
+because the frontend doesn't follow X-Next-Cursor. With `limit`, pages are
+ordered (sort key DESC, id DESC) and chained through the cursor header; rows
+sharing a date must be neither repeated nor skipped at a page boundary.
+"""
+from datetime import date
+
+from app import models
+from app.utils.pagination import NEXT_CURSOR_HEADER
+
+
+def _add_jobs(db_session, person, start_dates):
+    jobs = [
+        models.Job(person_id=person.id, name=f"Job {i}", salary=1000, start_date=start)
+        for i, start in enumerate(start_dates)
+    ]
+    db_session.add_all(jobs)
+    db_session.commit()
+    return jobs
+
+
+def _walk(client, url, limit):
+    """Follow X-Next-Cursor from the first page to the last."""
+    pages = []
+    response = client.get(url, params={"limit": limit})
+    while True:
+        assert response.status_code == 200, response.text
+        pages.append([row["id"] for row in response.json()])
+        cursor = response.headers.get(NEXT_CURSOR_HEADER)
+        if cursor is None:
+            return pages
+        response = client.get(url, params={"limit": limit, "cursor": cursor})
+
+
+def test_jobs_list_without_limit_returns_every_row(auth_client, db_session, test_user):
+    _add_jobs(db_session, test_user, [date(2025, 1, 1)] * 60)
+
+    response = auth_client.get("/api/jobs/")
+
+    assert response.status_code == 200
+    assert len(response.json()) == 60
+    assert NEXT_CURSOR_HEADER not in response.headers
+
+
+def test_jobs_pages_through_two_cursors_across_date_ties(auth_client, db_session, test_user):
+    jobs = _add_jobs(db_session, test_user, [
+        date(2026, 3, 1), date(2026, 2, 1), date(2026, 2, 1),
+        date(2026, 2, 1), date(2026, 2, 1), date(2026, 1, 1),
+    ])
+    by_date = [jobs[0]] + sorted(jobs[1:5], key=lambda j: j.id, reverse=True) + [jobs[5]]
+
+    pages = _walk(auth_client, "/api/jobs/", limit=2)
+
+    assert len(pages) == 3
+    assert [job_id for page in pages for job_id in page] == [j.id for j in by_date]
+
+
+def test_deleted_jobs_page_like_the_live_list(auth_client, db_session, test_user):
+    jobs = _add_jobs(db_session, test_user, [date(2026, 1, 1)] * 3)
+    for job in jobs:
+        job.deleted = True
+    db_session.commit()
+
+    pages = _walk(auth_client, f"/api/jobs/deleted/by-person/{test_user.id}", limit=2)
+
+    assert pages == [[jobs[2].id, jobs[1].id], [jobs[0].id]]
+
+
+def test_income_sources_page_newest_first(auth_client, db_session, test_user):
+    incomes = [
+        models.IncomeSource(
+            person_id=test_user.id, source_name=f"Gig {i}", source_type="freelance",
+            amount=100, received_date=received,
+        )
+        for i, received in enumerate([date(2026, 1, 5), date(2026, 1, 9), date(2026, 1, 9)])
+    ]
+    db_session.add_all(incomes)
+    db_session.commit()
+
+    assert len(auth_client.get("/api/income-sources/").json()) == 3
+    pages = _walk(auth_client, "/api/income-sources/", limit=2)
+
+    assert pages == [[incomes[2].id, incomes[1].id], [incomes[0].id]]
+
+
+def test_milestones_page_by_id(auth_client, db_session, test_user):
+    goal = models.Goal(person_id=test_user.id, name="IELTS 6.5")
+    db_session.add(goal)
+    db_session.commit()
+    milestones = [models.Milestone(goal_id=goal.id, name=f"Step {i}") for i in range(3)]
+    db_session.add_all(milestones)
+    db_session.commit()
+
+    pages = _walk(auth_client, "/api/milestones/", limit=2)
+
+    assert pages == [[milestones[2].id, milestones[1].id], [milestones[0].id]]
+
+
+def test_malformed_cursor_is_400(auth_client):
+    response = auth_client.get("/api/jobs/", params={"limit": 2, "cursor": "not-a-cursor"})
+
+    assert response.status_code == 400
@@ -0,0 +1,49 @@
+"""Email handling on person schemas.
+
+Signup (PersonCreate and the auth payloads) keeps strict EmailStr validation.
+Responses serialize whatever address is stored, and partial updates use
+the cheap EMAIL_RE shape check.
+"""
+from datetime import datetime
+
+import pytest
+from pydantic import ValidationError
+
+from app import schemas
+from app.schemas_auth import UserResponse
+
+
+@pytest.mark.parametrize("email", ["new@example.com", "first.last+tag@mail.example.uz"])
+def test_person_update_accepts_well_formed_email(email):
+    assert schemas.PersonUpdate(email=email).email == email
+
+
+@pytest.mark.parametrize("email", ["not-an-email", "two@@example.com", "spaces in@example.com", "a@b"])
+def test_person_update_rejects_malformed_email(email):
+    with pytest.raises(ValidationError):
+        schemas.PersonUpdate(email=email)
+
+
+def test_person_update_caps_email_length():
+    with pytest.raises(ValidationError):
+        schemas.PersonUpdate(email="x" * 250 + "@example.com")
+
+
+def test_person_update_leaves_email_unset():
+    assert schemas.PersonUpdate(name="Renamed").model_dump(exclude_unset=True) == {"name": "Renamed"}
+
+
+def test_person_create_keeps_strict_validation():
+    with pytest.raises(ValidationError):
+        schemas.PersonCreate(name="New", email="user@localhost", password="secret1")
+
+
+def test_responses_serialize_stored_addresses_as_is():
+    """Rows are not re-validated on the way out."""
+    person = schemas.Person(id=1, name="Legacy", email="admin@localhost", created_at=datetime(2026, 1, 1))
+    assert person.email == "admin@localhost"
+    user = UserResponse(
+        id=1, name="Legacy", email="Admin@Example.COM", timezone="Asia/Tashkent",
+        is_active=True, is_verified=True, created_at=datetime(2026, 1, 1),
+    )
+    assert user.email == "Admin@Example.COM"
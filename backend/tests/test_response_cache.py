@@ -0,0 +1,248 @@
+"""Response cache: per-person entries, cross-worker invalidation, fail-open.
+
+Values are cached per process; a Redis generation counter per person makes
+an invalidation in one worker evict the entry in every other worker. With
+Redis down the cache falls back to local invalidation, so another worker's
+write is visible once the entry's TTL runs out.
+
+The route tests read a cached endpoint, write through the API, and expect
+the next read to show the write.
+"""
+from datetime import date
+
+import pytest
+import redis
+
+from app import models
+from app.services import response_cache
+
+
+class FakeRedis:
+    """The slice of redis.Redis the cache uses, shared like a real server."""
+
+    def __init__(self):
+        self.values = {}
+
+    def get(self, key):
+        return self.values.get(key)
+
+    def incr(self, key):
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    def expire(self, key, seconds):
+        return True
+
+    def pipeline(self):
+        return self
+
+    def execute(self):
+        return []
+
+
+class DownRedis(FakeRedis):
+    def get(self, key):
+        raise redis.ConnectionError("connection refused")
+
+    def execute(self):
+        raise redis.ConnectionError("connection refused")
+
+
+@pytest.fixture
+def fake_redis(monkeypatch):
+    server = FakeRedis()
+    monkeypatch.setattr(response_cache, "_redis_client", server)
+    monkeypatch.setattr(response_cache, "_redis_down_until", 0.0)
+    response_cache.clear()
+    yield server
+    response_cache.clear()
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(response_cache.time, "monotonic", lambda: now[0])
+    return now
+
+
+def _counter():
+    calls = []
+
+    def compute():
+        calls.append(1)
+        return len(calls)
+
+    return compute, calls
+
+
+def test_hit_within_ttl_skips_compute(fake_redis):
+    compute, calls = _counter()
+
+    assert response_cache.get_or_compute(1, "stats", compute, ttl=30) == 1
+    assert response_cache.get_or_compute(1, "stats", compute, ttl=30) == 1
+    assert len(calls) == 1
+
+
+def test_invalidation_from_another_worker_evicts_local_entry(fake_redis):
+    compute, calls = _counter()
+    response_cache.get_or_compute(1, "stats", compute, ttl=30)
+
+    # Another worker's invalidate(1): only the shared counter moves, this
+    # process's entry is untouched
+    fake_redis.incr(response_cache.GENERATION_KEY.format(1))
+
+    assert response_cache.get_or_compute(1, "stats", compute, ttl=30) == 2
+    assert len(calls) == 2
+
+
+def test_invalidation_is_per_person(fake_redis):
+    compute, calls = _counter()
+    response_cache.get_or_compute(1, "stats", compute, ttl=30)
+    response_cache.get_or_compute(2, "stats", compute, ttl=30)
+
+    response_cache.invalidate(2)
+
+    assert response_cache.get_or_compute(1, "stats", compute, ttl=30) == 1
+    assert response_cache.get_or_compute(2, "stats", compute, ttl=30) == 3
+
+
+def test_redis_down_fails_open_with_ttl_staleness_bound(monkeypatch, clock):
+    monkeypatch.setattr(response_cache, "_redis_client", DownRedis())
+    monkeypatch.setattr(response_cache, "_redis_down_until", 0.0)
+    response_cache.clear()
+    compute, calls = _counter()
+
+    assert response_cache.get_or_compute(1, "stats", compute, ttl=30) == 1
+    # A write on another worker can't reach this process: the stale entry
+    # is served until its TTL, and no longer
+    clock[0] += 29
+    assert response_cache.get_or_compute(1, "stats", compute, ttl=30) == 1
+    clock[0] += 2
+    assert response_cache.get_or_compute(1, "stats", compute, ttl=30) == 2
+
+    # Local invalidation still works without Redis
+    response_cache.invalidate(1)
+    assert response_cache.get_or_compute(1, "stats", compute, ttl=30) == 3
+    response_cache.clear()
+
+
+def _make_goal(db_session, person_id):
+    goal = models.Goal(person_id=person_id, name="IELTS 6.5")
+    db_session.add(goal)
+    db_session.commit()
+    return goal
+
+
+def test_goal_statistics_are_keyed_on_the_path_person(auth_client, db_session):
+    other = models.Person(name="Other", email="other@test.local", hashed_password="x")
+    db_session.add(other)
+    db_session.commit()
+    goal = _make_goal(db_session, other.id)
+
+    before = auth_client.get(f"/api/goals/statistics/person/{other.id}")
+    assert before.status_code == 200, before.text
+    assert before.json()["total_milestones"] == 0
+
+    # The milestone write invalidates the goal owner, not the caller
+    assert auth_client.post("/api/milestones/", json={
+        "goal_id": goal.id, "name": "Band 6",
+    }).status_code == 200
+
+    after = auth_client.get(f"/api/goals/statistics/person/{other.id}")
+    assert after.json()["total_milestones"] == 1
+
+
+def test_milestone_writes_refresh_goal_statistics(auth_client, db_session, test_user):
+    goal = _make_goal(db_session, test_user.id)
+    milestone_id = auth_client.post("/api/milestones/", json={
+        "goal_id": goal.id, "name": "Band 6",
+    }).json()["id"]
+    url = f"/api/goals/statistics/person/{test_user.id}"
+    assert auth_client.get(url).json()["total_achieved_milestones"] == 0
+
+    assert auth_client.post(f"/api/milestones/{milestone_id}/mark").status_code == 200
+    assert auth_client.get(url).json()["total_achieved_milestones"] == 1
+
+    assert auth_client.put(f"/api/milestones/{milestone_id}", json={"achieved": False}).status_code == 200
+    assert auth_client.get(url).json()["total_achieved_milestones"] == 0
+
+    assert auth_client.delete(f"/api/milestones/{milestone_id}").status_code == 200
+    assert auth_client.get(url).json()["total_milestones"] == 0
+
+
+def test_subtask_writes_invalidate_the_goal_owner(auth_client, db_session, test_user):
+    goal = _make_goal(db_session, test_user.id)
+    task = models.Task(goal_id=goal.id, name="Mock test")
+    db_session.add(task)
+    db_session.commit()
+    compute, calls = _counter()
+
+    def cached():
+        return response_cache.get_or_compute(test_user.id, "probe", compute, ttl=30)
+
+    cached()
+    subtask_id = auth_client.post("/api/subtasks/", json={
+        "task_id": task.id, "name": "Listening",
+    }).json()["id"]
+    assert cached() == 2
+
+    assert auth_client.post(f"/api/subtasks/{subtask_id}/mark_subtask").status_code == 200
+    assert cached() == 3
+
+    assert auth_client.put(f"/api/subtasks/{subtask_id}", json={"name": "Reading"}).status_code == 200
+    assert cached() == 4
+
+    assert auth_client.delete(f"/api/subtasks/{subtask_id}").status_code == 200
+    assert cached() == 5
+
+
+def test_salary_months_list_refreshes_after_writes(auth_client, db_session, test_user):
+    job = models.Job(person_id=test_user.id, name="Teacher", salary=1000, start_date=date(2026, 3, 1))
+    db_session.add(job)
+    db_session.flush()
+    db_session.add(models.SalaryMonth(
+        job_id=job.id, person_id=test_user.id, month="2026-03",
+        salary_amount=1000, net_amount=1000, total_spent=0, remaining_amount=1000,
+    ))
+    db_session.commit()
+    [row] = auth_client.get("/api/salary-months/").json()
+    assert row["total_spent"] == 0
+
+    # The expenses trigger moves the totals; the expense route invalidates
+    assert auth_client.post("/api/expenses/", json={
+        "person_id": test_user.id, "name": "Groceries", "amount": 300, "category": "food",
+        "date": "2026-03-10", "source": "salary", "salary_month_id": row["id"],
+    }).status_code == 201
+    [row] = auth_client.get("/api/salary-months/").json()
+    assert row["total_spent"] == 300
+
+    assert auth_client.delete(f"/api/salary-months/{row['id']}").status_code == 200
+    assert auth_client.get("/api/salary-months/").json() == []
+
+
+def test_savings_total_balance_refreshes_after_deposit(auth_client):
+    saving_id = auth_client.post("/api/savings/", json={
+        "account_name": "Rainy Day", "account_type": "savings", "initial_amount": 1000,
+        "currency": "UZS", "start_date": "2026-01-01",
+    }).json()["id"]
+    assert auth_client.get("/api/savings/total-balance").json()["total_balance"] == 1000
+
+    assert auth_client.post(f"/api/savings/{saving_id}/deposit", json={
+        "amount": 500, "transaction_date": "2026-02-01",
+    }).status_code == 200
+
+    after = auth_client.get("/api/savings/total-balance").json()
+    assert (after["total_balance"], after["by_type"]) == (1500, {"savings": 1500})
+
+
+def test_goal_task_statistics_refresh_after_task_writes(auth_client, db_session, test_user):
+    goal = _make_goal(db_session, test_user.id)
+    task = models.Task(goal_id=goal.id, name="Mock test")
+    db_session.add(task)
+    db_session.commit()
+    url = f"/api/tasks/goal/{goal.id}/statistics"
+    assert auth_client.get(url).json()["completed_tasks"] == 0
+
+    assert auth_client.post(f"/api/tasks/{task.id}/mark_task").status_code == 200
+
+    assert auth_client.get(url).json()["completed_tasks"] == 1
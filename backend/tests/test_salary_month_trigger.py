@@ -0,0 +1,80 @@
+"""Salary-month totals are kept by the expenses trigger, not by the routers.
+
+models/finance.py installs the trigger when create_all builds the expenses
+table. Each expense write must leave total_spent and remaining_amount equal
+to the live expenses of the month, in the same transaction as the write.
+"""
+from datetime import date
+
+from app import models
+
+
+def _salary_month(db_session, person, month="2026-03", **fields):
+    job = models.Job(person_id=person.id, name="Teacher", salary=1000, start_date=date(2026, 1, 1))
+    db_session.add(job)
+    db_session.flush()
+    salary_month = models.SalaryMonth(
+        job_id=job.id, person_id=person.id, month=month,
+        salary_amount=1000, net_amount=1000, total_spent=0, remaining_amount=1000, **fields
+    )
+    db_session.add(salary_month)
+    db_session.commit()
+    return salary_month
+
+
+def _expense(auth_client, person, salary_month_id, amount):
+    response = auth_client.post("/api/expenses/", json={
+        "person_id": person.id,
+        "name": "Groceries",
+        "amount": amount,
+        "category": "food",
+        "date": "2026-03-10",
+        "source": "salary",
+        "salary_month_id": salary_month_id,
+    })
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def _totals(db_session, salary_month_id):
+    db_session.expire_all()
+    salary_month = db_session.get(models.SalaryMonth, salary_month_id)
+    return salary_month.total_spent, salary_month.remaining_amount
+
+
+def test_expense_writes_keep_salary_month_totals(auth_client, db_session, test_user):
+    month_id = _salary_month(db_session, test_user).id
+
+    expense_id = _expense(auth_client, test_user, month_id, 300)
+    _expense(auth_client, test_user, month_id, 100)
+    assert _totals(db_session, month_id) == (400, 600)
+
+    assert auth_client.put(f"/api/expenses/{expense_id}", json={"amount": 500}).status_code == 200
+    assert _totals(db_session, month_id) == (600, 400)
+
+    assert auth_client.delete(f"/api/expenses/{expense_id}").status_code == 200
+    assert _totals(db_session, month_id) == (100, 900)
+
+    assert auth_client.patch(f"/api/expenses/deleted/{expense_id}/restore").status_code == 200
+    assert _totals(db_session, month_id) == (600, 400)
+
+
+def test_relinking_an_expense_moves_its_amount(auth_client, db_session, test_user):
+    march_id = _salary_month(db_session, test_user).id
+    april_id = _salary_month(db_session, test_user, month="2026-04").id
+    expense_id = _expense(auth_client, test_user, march_id, 250)
+
+    # ExpenseUpdate can't relink, so exercise the trigger's UPDATE OF salary_month_id directly
+    db_session.get(models.Expense, expense_id).salary_month_id = april_id
+    db_session.commit()
+
+    assert _totals(db_session, march_id) == (0, 1000)
+    assert _totals(db_session, april_id) == (250, 750)
+
+
+def test_gennis_months_are_left_alone(auth_client, db_session, test_user):
+    month_id = _salary_month(db_session, test_user, gennis_salary_location_id=42).id
+
+    _expense(auth_client, test_user, month_id, 300)
+
+    assert _totals(db_session, month_id) == (0, 1000)
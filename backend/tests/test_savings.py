@@ -594,3 +594,44 @@ class TestSoftDelete:
         response = client.get(f"/api/savings/by-person/{test_user.id}")
         ids = [s["id"] for s in response.json()]
         assert saving_id not in ids
+
+
+# ==================== TRANSACTION HISTORY TESTS ====================
+
+
+class TestTransactionHistory:
+
+    def test_pages_through_two_cursors_across_same_day_transactions(self, client, sample_saving):
+        saving_id = sample_saving["id"]
+        for day in ["2026-02-01", "2026-02-01", "2026-02-01", "2026-03-01"]:
+            response = client.post(f"/api/savings/{saving_id}/deposit", json={
+                "amount": 100_000, "transaction_date": day
+            })
+            assert response.status_code == 200
+
+        pages = []
+        response = client.get(f"/api/savings/{saving_id}/transactions", params={"limit": 2})
+        while True:
+            assert response.status_code == 200
+            pages.append(response.json())
+            cursor = response.headers.get("X-Next-Cursor")
+            if cursor is None:
+                break
+            response = client.get(
+                f"/api/savings/{saving_id}/transactions", params={"limit": 2, "cursor": cursor}
+            )
+
+        assert [len(page) for page in pages] == [2, 2, 1]
+        rows = [tx for page in pages for tx in page]
+        keys = [(tx["transaction_date"], tx["id"]) for tx in rows]
+        # Same-day deposits are split across the first cursor, each exactly once
+        assert keys == sorted(keys, reverse=True)
+        assert len({tx["id"] for tx in rows}) == 5
+        assert [tx["transaction_date"] for tx in rows].count("2026-02-01") == 3
+
+    def test_last_page_has_no_cursor(self, client, sample_saving):
+        response = client.get(f"/api/savings/{sample_saving['id']}/transactions")
+
+        assert response.status_code == 200
+        assert len(response.json()) == 1
+        assert "X-Next-Cursor" not in response.headers
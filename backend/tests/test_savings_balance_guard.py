@@ -0,0 +1,189 @@
+"""Critical-path test: no write path may leave a savings account negative.
+
+savings.current_balance carries CHECK (current_balance >= 0). Every route
+that replays the transaction chain must turn an overdraft into a 400 and
+leave the account untouched, instead of letting the constraint fail the
+commit with an IntegrityError (500).
+"""
+from datetime import date
+
+import pytest
+from sqlalchemy import text, update
+from sqlalchemy.exc import IntegrityError
+
+from app import models
+from app.routers.savings import _recompute_balance_chain
+
+
+def _make_saving(auth_client, initial_amount=1000):
+    response = auth_client.post("/api/savings/", json={
+        "account_name": "Guarded Fund",
+        "account_type": "savings",
+        "initial_amount": initial_amount,
+        "currency": "UZS",
+        "start_date": "2026-01-01",
+    })
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def _make_savings_expense(auth_client, person, saving_id, amount, on):
+    response = auth_client.post("/api/expenses/", json={
+        "person_id": person.id,
+        "name": "Laptop",
+        "amount": amount,
+        "category": "shopping",
+        "date": on,
+        "source": "savings",
+        "saving_id": saving_id,
+    })
+    assert response.status_code == 201, response.text
+    return response.json()["id"]
+
+
+def _balance(db_session, saving_id):
+    db_session.expire_all()
+    return db_session.get(models.Saving, saving_id).current_balance
+
+
+def _overdraw(db_session, saving_id, amount, on):
+    """Recreate an account that went negative before the CHECK existed —
+    production adds the constraint NOT VALID, so such rows survive."""
+    db_session.execute(text(
+        "ALTER TABLE savings DROP CONSTRAINT ck_savings_current_balance_nonnegative"
+    ))
+    db_session.add(models.SavingTransaction(
+        saving_id=saving_id,
+        transaction_type="withdrawal",
+        amount=amount,
+        transaction_date=on,
+        balance_before=0.0,
+        balance_after=0.0,
+    ))
+    db_session.flush()
+    _recompute_balance_chain(db_session.get(models.Saving, saving_id), db_session)
+    db_session.flush()
+    db_session.execute(text(
+        "ALTER TABLE savings ADD CONSTRAINT ck_savings_current_balance_nonnegative "
+        "CHECK (current_balance >= 0) NOT VALID"
+    ))
+    db_session.commit()
+
+
+def test_raising_savings_expense_past_balance_is_400(auth_client, db_session, test_user):
+    saving_id = _make_saving(auth_client)
+    expense_id = _make_savings_expense(auth_client, test_user, saving_id, 600, "2026-02-01")
+
+    response = auth_client.put(f"/api/expenses/{expense_id}", json={"amount": 1500})
+
+    assert response.status_code == 400, response.text
+    assert _balance(db_session, saving_id) == 400
+    assert db_session.get(models.Expense, expense_id).amount == 600
+
+
+def test_backdated_withdraw_that_overdraws_later_chain_is_400(auth_client, db_session):
+    saving_id = _make_saving(auth_client)
+    assert auth_client.post(f"/api/savings/{saving_id}/withdraw", json={
+        "amount": 900, "transaction_date": "2026-03-01",
+    }).status_code == 200
+
+    # 1000 is available on 2026-02-01, but the March withdrawal then overdraws
+    response = auth_client.post(f"/api/savings/{saving_id}/withdraw", json={
+        "amount": 500, "transaction_date": "2026-02-01",
+    })
+
+    assert response.status_code == 400, response.text
+    assert _balance(db_session, saving_id) == 100
+
+
+def test_backdated_transaction_that_overdraws_later_chain_is_400(auth_client, db_session):
+    saving_id = _make_saving(auth_client)
+    assert auth_client.post(f"/api/savings/{saving_id}/withdraw", json={
+        "amount": 900, "transaction_date": "2026-03-01",
+    }).status_code == 200
+
+    response = auth_client.post(f"/api/savings/{saving_id}/transactions", json={
+        "transaction_type": "withdrawal",
+        "amount": 500,
+        "transaction_date": "2026-02-01",
+    })
+
+    assert response.status_code == 400, response.text
+    assert _balance(db_session, saving_id) == 100
+
+
+def test_restoring_expense_that_overdraws_later_chain_is_400(auth_client, db_session, test_user):
+    saving_id = _make_saving(auth_client)
+    expense_id = _make_savings_expense(auth_client, test_user, saving_id, 600, "2026-01-10")
+    assert auth_client.delete(f"/api/expenses/{expense_id}").status_code == 200
+    assert auth_client.post(f"/api/savings/{saving_id}/withdraw", json={
+        "amount": 900, "transaction_date": "2026-02-01",
+    }).status_code == 200
+    assert auth_client.post(f"/api/savings/{saving_id}/deposit", json={
+        "amount": 1000, "transaction_date": "2026-03-01",
+    }).status_code == 200
+
+    # 1100 covers the 600 today, but re-withdrawing it on 2026-01-10 leaves
+    # the February withdrawal short
+    response = auth_client.patch(f"/api/expenses/deleted/{expense_id}/restore")
+
+    assert response.status_code == 400, response.text
+    assert _balance(db_session, saving_id) == 1100
+    assert db_session.get(models.Expense, expense_id).deleted is True
+
+
+def test_orphan_expense_backfill_that_overdraws_is_400(auth_client, db_session, test_user):
+    saving_id = _make_saving(auth_client)
+    db_session.add(models.Expense(
+        person_id=test_user.id,
+        name="Imported",
+        amount=5000,
+        category="other",
+        date=date(2026, 2, 1),
+        source="savings",
+        saving_id=saving_id,
+    ))
+    db_session.commit()
+
+    assert auth_client.get(f"/api/savings/{saving_id}").status_code == 400
+    assert auth_client.get("/api/savings/total-balance").status_code == 400
+    assert _balance(db_session, saving_id) == 1000
+
+
+def test_deposit_into_already_negative_account_is_400(auth_client, db_session):
+    saving_id = _make_saving(auth_client)
+    _overdraw(db_session, saving_id, 1500, date(2026, 2, 1))
+
+    response = auth_client.post(f"/api/savings/{saving_id}/deposit", json={
+        "amount": 100, "transaction_date": "2026-03-01",
+    })
+
+    assert response.status_code == 400, response.text
+    assert _balance(db_session, saving_id) == -500
+
+
+def test_deleting_expense_of_already_negative_account_is_400(auth_client, db_session, test_user):
+    saving_id = _make_saving(auth_client)
+    expense_id = _make_savings_expense(auth_client, test_user, saving_id, 600, "2026-01-10")
+    _overdraw(db_session, saving_id, 1200, date(2026, 1, 20))
+
+    # The reversal deposit lifts the account to -200, still below zero
+    response = auth_client.delete(f"/api/expenses/{expense_id}")
+
+    assert response.status_code == 400, response.text
+    assert _balance(db_session, saving_id) == -800
+    assert db_session.get(models.Expense, expense_id).deleted is False
+
+
+def test_check_constraint_rejects_negative_balance(auth_client, db_session):
+    """The last line of defence for writes that bypass the routes."""
+    saving_id = _make_saving(auth_client)
+
+    with pytest.raises(IntegrityError):
+        db_session.execute(
+            update(models.Saving).where(models.Saving.id == saving_id).values(current_balance=-1)
+        )
+        db_session.flush()
+    db_session.rollback()
+
+    assert _balance(db_session, saving_id) == 1000
@@ -0,0 +1,57 @@
+"""Task writes leave the goal percentage current by the time they respond.
+
+The frontend refetches the goal right after every task write, so the stored
+percentage (and any goal statistics cached before the write) must already
+reflect it when the response arrives.
+"""
+from app import models
+from app.services.progress_service import ProgressService
+
+
+def _goal_with_tasks(db_session, person, count):
+    goal = models.Goal(person_id=person.id, name="IELTS 6.5")
+    db_session.add(goal)
+    db_session.commit()
+    tasks = [models.Task(goal_id=goal.id, name=f"Mock test {i}") for i in range(count)]
+    db_session.add_all(tasks)
+    db_session.commit()
+    return goal, tasks
+
+
+def _percentage(db_session, goal_id):
+    db_session.expire_all()
+    return db_session.get(models.Goal, goal_id).percentage
+
+
+def test_mark_task_updates_goal_percentage_before_responding(auth_client, db_session, test_user):
+    goal, tasks = _goal_with_tasks(db_session, test_user, 2)
+
+    response = auth_client.post(f"/api/tasks/{tasks[0].id}/mark_task")
+
+    assert response.status_code == 200, response.text
+    assert _percentage(db_session, goal.id) == 50
+    assert auth_client.get(f"/api/goals/{goal.id}").json()["percentage"] == 50
+
+
+def test_create_update_delete_keep_goal_percentage_current(auth_client, db_session, test_user):
+    goal, tasks = _goal_with_tasks(db_session, test_user, 1)
+
+    created = auth_client.post("/api/tasks/", json={"name": "Essay", "goal_id": goal.id})
+    assert created.status_code == 200, created.text
+    assert _percentage(db_session, goal.id) == 0
+
+    assert auth_client.put(f"/api/tasks/{tasks[0].id}", json={"completed": True}).status_code == 200
+    assert _percentage(db_session, goal.id) == 50
+
+    assert auth_client.delete(f"/api/tasks/{created.json()['id']}").status_code == 200
+    assert _percentage(db_session, goal.id) == ProgressService.calculate_hybrid_percentage(goal.id, db_session)
+
+
+def test_cached_goal_statistics_see_the_new_percentage(auth_client, db_session, test_user):
+    goal, tasks = _goal_with_tasks(db_session, test_user, 2)
+    url = f"/api/goals/{goal.id}/with-stats"
+    assert auth_client.get(url).json()["percentage"] == 0
+
+    assert auth_client.post(f"/api/tasks/{tasks[0].id}/mark_task").status_code == 200
+
+    assert auth_client.get(url).json()["percentage"] == 50
@@ -26,6 +26,7 @@ import { Skeleton } from '@/components/ui/skeleton'
 import { Dialog, DialogContent, DialogHeader, DialogTitle, DialogTrigger } from '@/components/ui/dialog'
 import { useHttp } from '@/lib/hooks/use-http'
 import { API_ENDPOINTS } from '@/lib/api/endpoints'
+import { fetchWithAuth } from '@/lib/api/fetch-with-auth'
 import {
     FormField,
     TextInput,
@@ -117,11 +118,25 @@ function useSavingsProfileDelete(id: string) {
     })
 }
 
+// The balance chart replays the whole history, so follow X-Next-Cursor
+// until the backend stops returning one.
 function useSavingsTransactions(savingId: string) {
-    const { request } = useHttp()
     return useQuery<Transaction[]>({
         queryKey: ['savings', 'transactions', savingId],
-        queryFn: () => request(API_ENDPOINTS.SAVINGS_TRANSACTIONS.LIST(savingId)),
+        queryFn: async () => {
+            const transactions: Transaction[] = []
+            let cursor: string | null = null
+            do {
+                const response = await fetchWithAuth(API_ENDPOINTS.SAVINGS_TRANSACTIONS.LIST(savingId, cursor))
+                const page = await response.json()
+                if (!response.ok) {
+                    throw new Error(page?.detail || `HTTP error ${response.status}`)
+                }
+                transactions.push(...page)
+                cursor = response.headers.get('X-Next-Cursor')
+            } while (cursor)
+            return transactions
+        },
         enabled: !!savingId,
     })
 }
@@ -150,7 +150,9 @@ export const API_ENDPOINTS = {
         DELETE: (id: string | number) => `${API_URL}/savings/${id}`,
     },
     SAVINGS_TRANSACTIONS: {
-        LIST: (savingId: string | number) => `${API_URL}/savings/${savingId}/transactions`,
+        // Pages newest first; pass the previous response's X-Next-Cursor header to continue
+        LIST: (savingId: string | number, cursor?: string | null) =>
+            `${API_URL}/savings/${savingId}/transactions?limit=1000${cursor ? `&cursor=${encodeURIComponent(cursor)}` : ''}`,
         CREATE: (savingId: string | number) => `${API_URL}/savings/${savingId}/transactions`,
         DELETE: (savingId: string | number, transactionId: string | number) =>
             `${API_URL}/savings/${savingId}/transactions/${transactionId}`,